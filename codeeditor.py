@@ -21,28 +21,29 @@ class LineNumberArea(QWidget):
         self._code_editor.line_number_area_paint_event(event)
 
 
-class CodeEditor(QPlainTextEdit):
-    """QPlainTextEdit with a gutter for line numbers."""
+class LineNumberGutter:
+    """Mixin drawing a line-number gutter to the left of a scroll area.
 
-    def __init__(self):
-        super().__init__()
+    The class it is mixed into must provide:
 
-        self.line_color = QColor(221, 221, 243)
+    ``line_count()``
+        The number of lines the gutter must make room for.
+    ``visible_line_numbers(rect)``
+        Yield ``(number, top)`` for each line intersecting ``rect``.
+
+    ``abc`` cannot enforce these: its metaclass conflicts with Qt's.
+    """
+
+    def init_line_number_area(self):
+        """Create the gutter widget and its default colours."""
         self.line_number_area_background = Qt.lightGray
         self.line_number_area_text = Qt.black
-
         self.line_number_area = LineNumberArea(self)
-        self.blockCountChanged[int].connect(self.update_line_number_area_width)
-        self.updateRequest[QRect, int].connect(self.update_line_number_area)
-        self.cursorPositionChanged.connect(self.highlight_current_line)
-
-        self.update_line_number_area_width(0)
-        self.highlight_current_line()
 
     def line_number_area_width(self):
         """Compute the width needed to render current line numbers."""
         digits = 1
-        max_num = max(1, self.blockCount())
+        max_num = max(1, self.line_count())
         while max_num >= 10:
             max_num *= 0.1
             digits += 1
@@ -62,30 +63,54 @@ class CodeEditor(QPlainTextEdit):
         """Paint the gutter background and line numbers."""
         with QPainter(self.line_number_area) as painter:
             painter.fillRect(event.rect(), self.line_number_area_background)
-            block = self.firstVisibleBlock()
-            block_number = block.blockNumber()
-            offset = self.contentOffset()
-            top = self.blockBoundingGeometry(block).translated(offset).top()
-            bottom = top + self.blockBoundingRect(block).height()
-
-            while block.isValid() and top <= event.rect().bottom():
-                if block.isVisible() and bottom >= event.rect().top():
-                    number = str(block_number + 1)
-                    painter.setPen(self.line_number_area_text)
-                    width = self.line_number_area.width()
-                    height = self.fontMetrics().height()
-                    painter.drawText(0, top, width, height, Qt.AlignRight, number)
-
-                block = block.next()
-                top = bottom
-                bottom = top + self.blockBoundingRect(block).height()
-                block_number += 1
+            painter.setPen(self.line_number_area_text)
+            width = self.line_number_area.width()
+            height = self.fontMetrics().height()
+            for number, top in self.visible_line_numbers(event.rect()):
+                painter.drawText(0, top, width, height, Qt.AlignRight, str(number))
 
     @Slot(int)
     def update_line_number_area_width(self, new_block_count):  # pylint: disable=unused-argument
         """Adjust the left margin to fit current line numbers."""
         self.setViewportMargins(self.line_number_area_width(), 0, 0, 0)
 
+
+class CodeEditor(LineNumberGutter, QPlainTextEdit):
+    """QPlainTextEdit with a gutter for line numbers."""
+
+    def __init__(self):
+        super().__init__()
+
+        self.line_color = QColor(221, 221, 243)
+        self.init_line_number_area()
+        self.blockCountChanged[int].connect(self.update_line_number_area_width)
+        self.updateRequest[QRect, int].connect(self.update_line_number_area)
+        self.cursorPositionChanged.connect(self.highlight_current_line)
+
+        self.update_line_number_area_width(0)
+        self.highlight_current_line()
+
+    def line_count(self):
+        """Return the number of blocks in the document."""
+        return self.blockCount()
+
+    def visible_line_numbers(self, rect):
+        """Yield ``(number, top)`` for each visible block inside ``rect``."""
+        block = self.firstVisibleBlock()
+        block_number = block.blockNumber()
+        offset = self.contentOffset()
+        top = self.blockBoundingGeometry(block).translated(offset).top()
+        bottom = top + self.blockBoundingRect(block).height()
+
+        while block.isValid() and top <= rect.bottom():
+            if block.isVisible() and bottom >= rect.top():
+                yield block_number + 1, top
+
+            block = block.next()
+            top = bottom
+            bottom = top + self.blockBoundingRect(block).height()
+            block_number += 1
+
     @Slot(QRect, int)
     def update_line_number_area(self, rect, dy):
         """Scroll or repaint the gutter as the document updates."""
@@ -25,6 +25,14 @@ class TextFormat(IntEnum):
     OTHER = 1
 
 
+class SortMode(IntEnum):
+    """How sort keys are compared."""
+    TEXT = 0
+    IGNORE_CASE = 1
+    NATURAL = 2
+    NUMERIC = 3
+
+
 # Encoding mappings
 ENCODING_NAMES = {
     EncodingType.UTF8: "UTF-8",
@@ -72,6 +80,37 @@ DEFAULT_LANGUAGE = "English"
 DEFAULT_MAX_RECENT_FILES = 5
 DEFAULT_ICON_SIZE = 24
 
+# File loading
+DEFAULT_LOAD_CHUNK_SIZE = 1024 * 1024
+DEFAULT_STREAM_LOAD_THRESHOLD = 8 * 1024 * 1024
+DEFAULT_VIEWER_THRESHOLD = 1024 * 1024 * 1024
+DEFAULT_DETECT_SAMPLE_SIZE = 64 * 1024
+DETECT_FEED_SIZE = 4096
+DEFAULT_ENCODING_CACHE_SIZE = 256
+ENCODING_CACHE_FILE = "encoding_cache.json"
+VIEWER_INDEX_CHUNK_SIZE = 1024 * 1024
+VIEWER_MAX_LINE_LENGTH = 4096
+
+# Background text transforms
+BACKGROUND_TASK_THRESHOLD = 1024 * 1024
+EXTERNAL_SORT_THRESHOLD = 64 * 1024 * 1024
+EXTERNAL_SORT_RUN_SIZE = 16 * 1024 * 1024
+
+# Search highlighting
+SEARCH_HIGHLIGHT_DELAY = 150
+SEARCH_HIGHLIGHT_MARGIN = 50
+
+# Find and Replace
+FIND_PATTERN_CACHE_SIZE = 64
+INCREMENTAL_SEARCH_DELAY = 250
+MATCH_INDEX_MAX_EDIT = 256 * 1024
+REGEX_SEARCH_TIMEOUT = 10
+
+# Find in Files
+FIND_IN_FILES_MAX_HITS = 1000
+FIND_IN_FILES_MAX_LINE = 500
+FIND_IN_FILES_PENDING = 64
+
 # File extensions
 TEXT_FILE_EXTENSIONS = ("txt", "TXT")
 
@@ -0,0 +1,391 @@
+"""Document statistics kept up to date as the text changes."""
+
+import codecs
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import List, Tuple
+
+from PySide6.QtCore import QObject
+from PySide6.QtGui import QTextBlock, QTextCursor, QTextDocument
+
+from constants import EncodingType, MATCH_INDEX_MAX_EDIT
+from textops import PARAGRAPH_SEPARATOR, find_pattern, qt_position
+
+
+class DocumentMetrics(QObject):
+    """Character, word, line-break and byte counts of a document.
+
+    The counts follow ``contentsChange(pos, removed, added)``: characters
+    and line breaks are read from the document's own character and block
+    counts, so no update or lookup ever copies the text.
+    Words, code points and UTF-8 bytes are kept per block; an edit recounts
+    only the blocks it touched and splices them into the per-block arrays,
+    so the totals and the counts of any selection are available without a
+    pass over the document.
+    """
+
+    def __init__(self, document: QTextDocument):
+        super().__init__(document)
+        self._document = document
+        self.chars = document.characterCount() - 1
+        self.newlines = document.blockCount() - 1
+        self.words = 0
+        self.points = 0
+        self.utf8 = 0
+        self._words = array("q")
+        self._points = array("q")
+        self._utf8 = array("q")
+        self._recount(document.firstBlock(), document.blockCount(), 0)
+        document.contentsChange.connect(self.contentsChange)
+
+    def contentsChange(self, pos: int, removed: int, added: int) -> None:  # pylint: disable=invalid-name
+        """Apply one edit of the document to the counts."""
+        self.chars = self._document.characterCount() - 1
+        self.newlines = self._document.blockCount() - 1
+        end = min(pos + added, self._document.characterCount() - 1)
+        first = self._document.findBlock(pos)
+        count = self._document.findBlock(end).blockNumber() - first.blockNumber() + 1
+        replaced = count - (self._document.blockCount() - len(self._words))
+        if replaced < 1 or first.blockNumber() + replaced > len(self._words):
+            # The change could not be located; recount from scratch
+            self.words = self.points = self.utf8 = 0
+            del self._words[:], self._points[:], self._utf8[:]
+            self._recount(self._document.firstBlock(), self._document.blockCount(), 0)
+        else:
+            self._recount(first, count, replaced)
+
+    def _recount(self, block: QTextBlock, count: int, replaced: int) -> None:
+        """Replace ``replaced`` entries from ``block`` on with ``count`` new ones."""
+        first = block.blockNumber()
+        last = self._document.findBlockByNumber(first + count - 1)
+        cursor = QTextCursor(block)
+        cursor.setPosition(last.position() + last.length() - 1, QTextCursor.KeepAnchor)
+        lines = cursor.selectedText().split(PARAGRAPH_SEPARATOR)
+        words = array("q", map(len, map(str.split, lines)))
+        points = array("q", map(len, lines))
+        utf8 = array("q", map(utf8_length, lines))
+        old = slice(first, first + replaced)
+        self.words += sum(words) - sum(self._words[old])
+        self.points += sum(points) - sum(self._points[old])
+        self.utf8 += sum(utf8) - sum(self._utf8[old])
+        self._words[old] = words
+        self._points[old] = points
+        self._utf8[old] = utf8
+
+    def length(self, crlf: bool) -> int:
+        """Return the text length with each line break written as CRLF or LF."""
+        if crlf:
+            return self.chars + self.newlines
+        return self.chars
+
+    def size(self, encoding: EncodingType, crlf: bool) -> int:
+        """Return the exact size of the document saved in ``encoding``.
+
+        The size includes the BOM that is written for the encoding.
+        """
+        units = self.chars - self.newlines
+        return BOM_SIZES.get(encoding, 0) + encoded_size(
+            encoding, units, self.points, self.utf8, self.newlines, crlf
+        )
+
+    def position_at(self, offset: int, encoding: EncodingType, crlf: bool) -> int:
+        """Return the position of the character at byte ``offset`` of the
+        document saved in ``encoding``, BOM included.
+
+        The line is found by bisecting the byte counts of the lines before
+        it; only that line is read. An offset inside a line break maps to
+        the end of its line, one past the end to the end of the document.
+        """
+        document = self._document
+        utf16 = encoding in (EncodingType.UTF16_BE, EncodingType.UTF16_LE)
+        breaks = (2 if crlf else 1) * (2 if utf16 else 1)
+        offset = max(0, offset - BOM_SIZES.get(encoding, 0))
+        if utf16:
+            # Qt positions count a line break as one UTF-16 unit
+            def before(line: int) -> int:
+                position = document.findBlockByNumber(line).position()
+                return 2 * (position - line) + line * breaks
+        else:
+            utf8 = encoding in (EncodingType.UTF8, EncodingType.UTF8_BOM)
+            starts = list(accumulate(self._utf8 if utf8 else self._points, initial=0))
+
+            def before(line: int) -> int:
+                return starts[line] + line * breaks
+
+        low, high = 0, document.blockCount() - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if before(middle) <= offset:
+                low = middle
+            else:
+                high = middle - 1
+        block = document.findBlockByNumber(low)
+        text = block.text()
+        rest = offset - before(low)
+        if utf16:
+            widths = (4 if char > "\uffff" else 2 for char in text)
+            rest = bisect_right(list(accumulate(widths)), rest)
+        elif utf8:
+            rest = bisect_right(list(accumulate(map(utf8_length, text))), rest)
+        return block.position() + qt_position(text, min(rest, len(text)))
+
+    def selection(
+        self, cursor: QTextCursor, encoding: EncodingType, crlf: bool
+    ) -> Tuple[int, int, int]:
+        """Return ``(chars, words, size)`` of the cursor selection.
+
+        Blocks lying wholly inside the selection are summed from the
+        per-block counts; only the partial first and last blocks are read.
+        ``chars`` excludes line breaks, ``size`` is the encoded size in
+        ``encoding`` with CRLF or LF line breaks.
+        """
+        if not cursor.hasSelection():
+            return 0, 0, 0
+        start = self._document.findBlock(cursor.selectionStart())
+        end = self._document.findBlock(cursor.selectionEnd())
+        head = cursor.selectionStart() - start.position()
+        tail = cursor.selectionEnd() - end.position()
+        newlines = end.blockNumber() - start.blockNumber()
+        chars = cursor.selectionEnd() - cursor.selectionStart() - newlines
+        if not newlines:
+            parts = [_utf16_slice(start.text(), head, tail)]
+            inner = slice(0, 0)
+        else:
+            parts = [
+                _utf16_slice(start.text(), head, None),
+                _utf16_slice(end.text(), 0, tail),
+            ]
+            inner = slice(start.blockNumber() + 1, end.blockNumber())
+        words = sum(self._words[inner]) + sum(len(part.split()) for part in parts)
+        points = sum(self._points[inner]) + sum(map(len, parts))
+        utf8 = sum(self._utf8[inner]) + sum(map(utf8_length, parts))
+        return chars, words, encoded_size(encoding, chars, points, utf8, newlines, crlf)
+
+
+class MatchIndex(QObject):
+    """Sorted start and end positions of the matches of one Find query.
+
+    ``query`` is ``(find_text, case, whole_word)`` as for
+    ``textops.find_pattern``; the positions come from
+    ``textops.match_spans`` over the document's raw text. The index then
+    follows ``contentsChange``: an edit rescans only the text around it,
+    and the positions after it are shifted lazily. One pending shift
+    applies to the tail of the arrays from ``_from`` on, and is settled
+    only between the old and the new edit point, so typing in one place
+    costs time for the matches near it, not for all of them. An edit
+    longer than ``MATCH_INDEX_MAX_EDIT`` invalidates the index.
+    """
+
+    def __init__(
+        self, document: QTextDocument, query: tuple, starts: array, ends: array
+    ):
+        super().__init__(document)
+        self.query = query
+        self.valid = True
+        self._document = document
+        self._pattern = find_pattern(*query)
+        # The longest match in UTF-16 units: re.IGNORECASE matches
+        # literals character by character
+        self._reach = 2 * len(query[0])
+        self._starts = starts
+        self._ends = ends
+        self._from = len(starts)
+        self._shift = 0
+        document.contentsChange.connect(self.contentsChange)
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def span(self, idx: int) -> Tuple[int, int]:
+        """Return the start and end position of match ``idx``."""
+        shift = self._shift if idx >= self._from else 0
+        return self._starts[idx] + shift, self._ends[idx] + shift
+
+    def after(self, pos: int) -> int:
+        """Return the first match starting at or after ``pos``, or -1."""
+        idx = self._bisect(self._starts, pos)
+        return idx if idx < len(self._starts) else -1
+
+    def before(self, pos: int) -> int:
+        """Return the last match starting before ``pos``, or -1."""
+        return self._bisect(self._starts, pos) - 1
+
+    def find(self, start: int, end: int) -> int:
+        """Return the match spanning exactly ``start:end``, or -1."""
+        idx = self.after(start)
+        if idx != -1 and self.span(idx) == (start, end):
+            return idx
+        return -1
+
+    def release(self) -> None:
+        """Stop following the document and drop the positions."""
+        if self.valid:
+            self.valid = False
+            self._document.contentsChange.disconnect(self.contentsChange)
+            self._starts = array("q")
+            self._ends = array("q")
+            self._from = 0
+
+    def contentsChange(self, pos: int, removed: int, added: int) -> None:  # pylint: disable=invalid-name
+        """Update the matches for one edit of the document."""
+        if max(removed, added) > MATCH_INDEX_MAX_EDIT:
+            self.release()
+            return
+        # Matches touching the edit, where whole-word checks look too
+        first = self._bisect(self._ends, pos)
+        last = self._bisect(self._starts, pos + removed, right=True)
+        self._settle(last)
+        self._shift += added - removed
+        spans, dropped = self._rescan(pos, pos + added, first, last)
+        del self._starts[first:last + dropped]
+        del self._ends[first:last + dropped]
+        self._starts[first:first] = array("q", (start for start, _ in spans))
+        self._ends[first:first] = array("q", (end for _, end in spans))
+        self._from = first + len(spans)
+
+    def _bisect(self, values: array, pos: int, right: bool = False) -> int:
+        find = bisect_right if right else bisect_left
+        idx = find(values, pos, 0, self._from)
+        if idx < self._from:
+            return idx
+        return find(values, pos - self._shift, self._from)
+
+    def _settle(self, idx: int) -> None:
+        """Move the start of the shifted tail to ``idx``."""
+        if idx > self._from:
+            part, shift = slice(self._from, idx), self._shift
+        else:
+            part, shift = slice(idx, self._from), -self._shift
+        if shift:
+            self._starts[part] = array("q", [pos + shift for pos in self._starts[part]])
+            self._ends[part] = array("q", [pos + shift for pos in self._ends[part]])
+        self._from = idx
+
+    def _rescan(
+        self, pos: int, end: int, first: int, last: int
+    ) -> Tuple[List[Tuple[int, int]], int]:
+        """Find the matches of the text edited between ``pos`` and ``end``.
+
+        Matches never overlap, so a new match can hide later ones: the
+        scan goes on until the next match it would find is an old match
+        after the edit. Returns the new matches and the number of old ones
+        after the edit that they hide.
+        """
+        scan = max(0, pos - self._reach)
+        if first:
+            scan = max(scan, self._ends[first - 1])
+        # Past ``limit`` every match is an old one
+        limit = end + self._reach + 1
+        size = self._document.characterCount() - 1
+        cursor = QTextCursor(self._document)
+        base = max(0, scan - 1)
+        cursor.setPosition(base)
+        cursor.setPosition(min(size, limit + self._reach), QTextCursor.KeepAnchor)
+        text = cursor.selectedText()
+        # UTF-16 offset of each character, when some take two units
+        offsets = None
+        if len(text.encode("utf_16_le", "surrogatepass")) != 2 * len(text):
+            offsets = list(
+                accumulate((2 if char > "\uffff" else 1 for char in text), initial=0)
+            )
+
+        spans = []
+        idx = last
+        while True:
+            while idx < len(self._starts) and self._starts[idx] + self._shift < scan:
+                idx += 1
+            target = limit
+            if idx < len(self._starts):
+                target = min(target, self._starts[idx] + self._shift)
+            local = scan - base
+            if offsets is not None:
+                local = bisect_left(offsets, local)
+            match = self._pattern.search(text, local)
+            if not match:
+                break
+            start, stop = match.span()
+            if offsets is not None:
+                start, stop = offsets[start], offsets[stop]
+            if base + start >= target:
+                break
+            spans.append((base + start, base + stop))
+            scan = base + stop
+        return spans, idx - last
+
+
+BOM_SIZES = {
+    EncodingType.UTF8_BOM: len(codecs.BOM_UTF8),
+    EncodingType.UTF16_BE: len(codecs.BOM_UTF16_BE),
+    EncodingType.UTF16_LE: len(codecs.BOM_UTF16_LE),
+}
+
+
+def encoded_size(
+    encoding: EncodingType, units: int, points: int, utf8: int, newlines: int, crlf: bool
+) -> int:
+    """Return the encoded size of text from its counts, without encoding it.
+
+    ``units`` (UTF-16 code units), ``points`` (code points) and ``utf8``
+    (UTF-8 bytes) describe the text without its ``newlines`` line breaks.
+    UTF-16 takes two bytes per code unit; the single-byte code pages take
+    one byte per code point, since a character they cannot represent is
+    saved as a single ``?``.
+    """
+    breaks = newlines * (2 if crlf else 1)
+    if encoding in (EncodingType.UTF16_BE, EncodingType.UTF16_LE):
+        return 2 * (units + breaks)
+    if encoding in (EncodingType.UTF8, EncodingType.UTF8_BOM):
+        return utf8 + breaks
+    return points + breaks
+
+
+def utf8_length(text: str) -> int:
+    """Return the size of ``text`` saved as UTF-8."""
+    if text.isascii():
+        return len(text)
+    return len(text.encode("utf_8", "replace"))
+
+
+def _utf16_slice(text: str, start: int, end) -> str:
+    """Slice ``text`` by Qt (UTF-16) column positions."""
+    if text.isascii():
+        return text[start:end]
+    data = text.encode("utf_16_le", "surrogatepass")
+    return data[2 * start:None if end is None else 2 * end].decode(
+        "utf_16_le", "surrogatepass"
+    )
+
+
+class LineIndex:
+    """Line-start offsets of a document, mapped in O(log n).
+
+    ``QTextDocument`` keeps its blocks (one per logical line) in a balanced
+    tree that it updates incrementally on every edit, so a block is found
+    by number or by position in logarithmic time. This class exposes that
+    tree as a line index instead of mirroring it in a separate array,
+    which would need O(n) shifting on every edit. The lookups go through
+    the blocks, never the layout, so line wrapping does not slow them.
+    """
+
+    def __init__(self, document: QTextDocument):
+        self._document = document
+
+    def line_count(self) -> int:
+        """Return the number of logical lines."""
+        return self._document.blockCount()
+
+    def line_start(self, line: int) -> int:
+        """Return the position where the 0-based ``line`` starts.
+
+        Lines past the end map to the end of the document.
+        """
+        block = self._document.findBlockByNumber(max(0, line))
+        if not block.isValid():
+            return self._document.characterCount() - 1
+        return block.position()
+
+    def line_at(self, pos: int) -> int:
+        """Return the 0-based line holding position ``pos``."""
+        pos = min(max(0, pos), self._document.characterCount() - 1)
+        return self._document.findBlock(pos).blockNumber()
@@ -0,0 +1,95 @@
+"""Persistent cache of detected file encodings and line endings."""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from constants import EncodingType, LineEnding
+
+
+class EncodingCache:
+    """LRU cache mapping files to their detected encoding and line ending.
+
+    Entries are keyed by absolute path and are only returned while the
+    file's size, modification time and inode are unchanged. The cache is
+    kept in a JSON file; beyond ``max_entries`` the least recently used
+    entries are dropped. Lookups may come from worker threads.
+    """
+
+    def __init__(self, path: str, max_entries: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.load()
+
+    @staticmethod
+    def _signature(st: os.stat_result) -> list:
+        return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+    def get(
+        self, path: str, st: Optional[os.stat_result] = None
+    ) -> Optional[Tuple[EncodingType, LineEnding]]:
+        """Return the cached (encoding, line ending) of an unchanged file."""
+        key = os.path.abspath(path)
+        try:
+            st = st or os.stat(path)
+        except OSError:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry["stat"] != self._signature(st):
+                return None
+            self._entries.move_to_end(key)
+        return EncodingType(entry["encoding"]), LineEnding(entry["eol"])
+
+    def put(
+        self,
+        path: str,
+        st: os.stat_result,
+        encoding: EncodingType,
+        eol: LineEnding,
+    ) -> None:
+        """Remember the detection result for a file."""
+        key = os.path.abspath(path)
+        with self._lock:
+            self._entries[key] = {
+                "stat": self._signature(st),
+                "encoding": int(encoding),
+                "eol": int(eol),
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def load(self) -> None:
+        """Read the cache file; a missing or damaged file starts empty."""
+        try:
+            with open(self.path, "r", encoding="utf_8") as f:
+                entries = json.load(f)
+            self._entries = OrderedDict(
+                (key, entry) for key, entry in entries if isinstance(entry, dict)
+            )
+        except (OSError, ValueError, TypeError):
+            self._entries = OrderedDict()
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def save(self) -> None:
+        """Write the cache file if anything changed since it was loaded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            entries = list(self._entries.items())
+            self._dirty = False
+        tmp = self.path + ".tmp"
+        try:
+            with open(tmp, "w", encoding="utf_8") as f:
+                json.dump(entries, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
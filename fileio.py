@@ -0,0 +1,228 @@
+"""File reading helpers for the Notepad application."""
+
+import codecs
+import os
+import stat
+import tempfile
+from typing import BinaryIO, Iterable, Iterator, Tuple
+from chardet.universaldetector import UniversalDetector
+from constants import (
+    EncodingType,
+    LineEnding,
+    ENCODING_PYTHON_NAMES,
+    DEFAULT_DETECT_SAMPLE_SIZE,
+    DETECT_FEED_SIZE,
+    LINE_ENDING_STRINGS,
+)
+
+
+def iter_decoded_chunks(
+    stream: BinaryIO, encoding: str, chunk_size: int, head=b""
+) -> Iterator[Tuple[str, bytes]]:
+    """Decode a binary stream in fixed-size chunks.
+
+    Yields ``(text, raw)`` pairs. ``head`` holds bytes already read
+    from the stream (e.g. the encoding-detection sample, possibly as a
+    memoryview) and is decoded first, so nothing is read twice.
+    Multi-byte sequences split between two chunks are completed by an
+    incremental decoder, and a trailing CR is held back so that a CRLF
+    pair is never divided across chunks.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors="replace")
+    pending = ""
+    raw = head if len(head) else stream.read(chunk_size)
+    while True:
+        final = not len(raw)
+        text = pending + decoder.decode(raw, final=final)
+        pending = ""
+        if not final and text.endswith("\r"):
+            pending = "\r"
+            text = text[:-1]
+        yield text, raw
+        if final:
+            break
+        raw = stream.read(chunk_size)
+
+
+def _read_umask() -> int:
+    # The umask can only be read by setting it, which affects every
+    # thread; it is read once, at import, before any save thread starts
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+def write_text(
+    path: str, chunks: Iterable[str], encoding: EncodingType, eol: LineEnding
+) -> None:
+    """Save text atomically, encoding it chunk by chunk.
+
+    ``chunks`` hold the text with LF line breaks; each is converted to
+    ``eol`` and passed through an incremental encoder, so only one chunk
+    is held in memory. The data goes to a temporary file in the target
+    directory, which is fsynced and then renamed over ``path``: a failed
+    save leaves the previous file intact. The mode (and, where allowed,
+    the owner) of an existing file is kept.
+    """
+    path = os.path.realpath(path)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    newline = LINE_ENDING_STRINGS[eol]
+    encoder = codecs.getincrementalencoder(ENCODING_PYTHON_NAMES[encoding])("replace")
+    fd, tmp = tempfile.mkstemp(
+        prefix=".notepad-", suffix=".tmp", dir=os.path.dirname(path)
+    )
+    try:
+        with open(fd, "wb") as f:
+            # The utf_16_be/le codecs write no BOM of their own
+            if encoding == EncodingType.UTF16_BE:
+                f.write(codecs.BOM_UTF16_BE)
+            elif encoding == EncodingType.UTF16_LE:
+                f.write(codecs.BOM_UTF16_LE)
+            for chunk in chunks:
+                if newline != "\n":
+                    chunk = chunk.replace("\n", newline)
+                f.write(encoder.encode(chunk))
+            f.write(encoder.encode("", final=True))
+            f.flush()
+            os.fsync(f.fileno())
+        if st is not None:
+            os.chmod(tmp, stat.S_IMODE(st.st_mode))
+            if hasattr(os, "chown"):
+                try:
+                    os.chown(tmp, st.st_uid, st.st_gid)
+                except OSError:
+                    pass
+        else:
+            os.chmod(tmp, 0o666 & ~_UMASK)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def decoding_name(encoding: EncodingType) -> str:
+    """Return the Python codec used to read a file in ``encoding``.
+
+    UTF-16 files are read with the BOM-aware ``utf_16`` codec so the BOM
+    is consumed instead of ending up in the text.
+    """
+    if encoding in (EncodingType.UTF16_BE, EncodingType.UTF16_LE):
+        return "utf_16"
+    return ENCODING_PYTHON_NAMES[encoding]
+
+
+def detect_encoding(
+    path: str, sample_size: int = DEFAULT_DETECT_SAMPLE_SIZE
+) -> EncodingType:
+    """Detect file encoding from at most ``sample_size`` leading bytes."""
+    try:
+        with open(path, "rb") as f:
+            sample = f.read(sample_size)
+            complete = not f.read(1)
+    except OSError:
+        return EncodingType.UTF8  # Default fallback
+    return detect_sample_encoding(sample, complete)
+
+
+def detect_sample_encoding(sample: bytes, complete: bool = True) -> EncodingType:
+    """Detect encoding of a byte sample (bytes or memoryview).
+
+    BOMs are checked first, then the sample is validated as strict UTF-8;
+    only when that fails is chardet consulted. ``complete`` tells whether
+    the sample is the whole file, i.e. whether a multi-byte sequence cut
+    at its end is an error or just the sample boundary.
+    """
+    bom = bytes(sample[:3])
+    if bom.startswith(codecs.BOM_UTF8):
+        return EncodingType.UTF8_BOM
+    if bom.startswith(codecs.BOM_UTF16_LE):
+        return EncodingType.UTF16_LE
+    if bom.startswith(codecs.BOM_UTF16_BE):
+        return EncodingType.UTF16_BE
+
+    try:
+        codecs.getincrementaldecoder("utf_8")().decode(sample, final=complete)
+        return EncodingType.UTF8
+    except UnicodeDecodeError:
+        pass
+
+    detector = UniversalDetector()
+    for pos in range(0, len(sample), DETECT_FEED_SIZE):
+        detector.feed(bytes(sample[pos:pos + DETECT_FEED_SIZE]))
+        if detector.done:
+            break
+    detector.close()
+
+    detected_encoding = detector.result.get("encoding") or "utf-8"
+    # Map detected encodings to encoding types
+    encoding_map = {
+        "utf-8-sig": EncodingType.UTF8_BOM,
+        "utf-16": EncodingType.UTF16_LE,
+        "windows-1251": EncodingType.WINDOWS_1251,
+        "ibm866": EncodingType.OEM_866,
+    }
+    return encoding_map.get(detected_encoding.lower(), EncodingType.UTF8)
+
+
+class EolCounter:
+    """Count CRLF, LF and lone CR line breaks over consecutive chunks.
+
+    Chunks are raw bytes of an ASCII-compatible encoding, or decoded text
+    when ``text`` is set (UTF-16). Each style is counted with ``count``
+    in C, and a CR ending one chunk is paired with an LF starting the next.
+    """
+
+    def __init__(self, text: bool = False):
+        self._cr, self._lf = ("\r", "\n") if text else (b"\r", b"\n")
+        self._crlf = self._cr + self._lf
+        self._crTotal = 0
+        self._lfTotal = 0
+        self._lastCr = False
+        self.crlf = 0
+
+    def feed(self, data) -> None:
+        """Count the line breaks in the next chunk."""
+        if not data:
+            return
+        if self._lastCr and data[:1] == self._lf:
+            self.crlf += 1
+        self.crlf += data.count(self._crlf)
+        self._crTotal += data.count(self._cr)
+        self._lfTotal += data.count(self._lf)
+        self._lastCr = data[-1:] == self._cr
+
+    @property
+    def lf(self) -> int:
+        """Number of LF breaks not preceded by CR."""
+        return self._lfTotal - self.crlf
+
+    @property
+    def cr(self) -> int:
+        """Number of CR breaks not followed by LF."""
+        return self._crTotal - self.crlf
+
+    @property
+    def mixed(self) -> bool:
+        """True if CRLF and LF are both used, or any lone CR occurs.
+
+        Lone CRs always count as mixed since files are only written back
+        with CRLF or LF.
+        """
+        return bool(self.cr) or bool(self.crlf and self.lf)
+
+    def dominant(self, default: LineEnding = LineEnding.WINDOWS_CRLF) -> LineEnding:
+        """Return the most frequent of CRLF and LF, or ``default`` if none."""
+        if self.lf > self.crlf:
+            return LineEnding.UNIX_LF
+        if self.crlf:
+            return LineEnding.WINDOWS_CRLF
+        return default
@@ -0,0 +1,124 @@
+"""Find in Files: walking a directory tree and searching single files.
+
+The functions here do not touch Qt, so ``search_file`` can run in the
+worker processes of the main window's process pool.
+"""
+
+import fnmatch
+import mmap
+import os
+import re
+from typing import Iterator, List, Sequence, Tuple
+
+from fileio import decoding_name, detect_sample_encoding
+from textops import find_lines, find_pattern
+from constants import (
+    EncodingType,
+    ENCODING_PYTHON_NAMES,
+    DEFAULT_DETECT_SAMPLE_SIZE,
+    FIND_IN_FILES_MAX_HITS,
+    FIND_IN_FILES_MAX_LINE,
+)
+
+# Encodings in which ASCII, and so a LF line break, is a single byte
+BYTE_ENCODINGS = (
+    EncodingType.UTF8,
+    EncodingType.UTF8_BOM,
+    EncodingType.WINDOWS_1251,
+    EncodingType.OEM_866,
+)
+
+
+def split_globs(globs: str) -> List[str]:
+    """Split a list of glob patterns separated by ``;`` or ``,``."""
+    return [glob.strip() for glob in re.split(r"[;,]", globs) if glob.strip()]
+
+
+def iter_files(
+    root: str, include: Sequence[str] = (), exclude: Sequence[str] = ()
+) -> Iterator[str]:
+    """Yield the files under ``root`` whose names match the globs.
+
+    A file is yielded if its name matches one of ``include`` (or
+    ``include`` is empty) and none of ``exclude``; directories matching
+    ``exclude`` are not entered. Symbolic links to directories are not
+    followed.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            name for name in dirnames if not _matches(name, exclude)
+        )
+        for name in sorted(filenames):
+            if include and not _matches(name, include):
+                continue
+            if not _matches(name, exclude):
+                yield os.path.join(dirpath, name)
+
+
+def _matches(name: str, globs: Sequence[str]) -> bool:
+    return any(fnmatch.fnmatch(name, glob) for glob in globs)
+
+
+def search_file(
+    path: str,
+    find_text: str,
+    case: bool,
+    whole_word: bool,
+    sample_size: int = DEFAULT_DETECT_SAMPLE_SIZE,
+    max_hits: int = FIND_IN_FILES_MAX_HITS,
+) -> List[Tuple[int, str]]:
+    """Return ``(line, text)`` for each line of a file matching ``find_text``.
+
+    Lines are numbered from 1 and at most ``max_hits`` are returned. The
+    file is memory-mapped; in encodings where ASCII is a single byte the
+    raw bytes are searched with a byte pattern and only the lines it hits
+    are decoded and checked against the Find dialog semantics. Other
+    files, and case-insensitive searches for non-ASCII text, decode the
+    whole file. Files that look binary are skipped.
+    """
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            sample = buf[:sample_size]
+            encoding = detect_sample_encoding(sample, len(sample) == len(buf))
+            pattern = find_pattern(find_text, case, whole_word)
+            if encoding in BYTE_ENCODINGS:
+                if b"\0" in sample:
+                    return []
+                if case or find_text.isascii():
+                    codec = ENCODING_PYTHON_NAMES[EncodingType.UTF8]
+                    if encoding not in (EncodingType.UTF8, EncodingType.UTF8_BOM):
+                        codec = ENCODING_PYTHON_NAMES[encoding]
+                    return _search_bytes(
+                        buf, find_text, codec, pattern, case, whole_word, max_hits
+                    )
+            text = str(buf, decoding_name(encoding), "replace")
+            return find_lines(text, pattern, max_hits)
+
+
+def _search_bytes(buf, find_text, codec, pattern, case, whole_word, max_hits):
+    try:
+        needle = find_text.encode(codec)
+    except UnicodeEncodeError:
+        return []  # The file's code page cannot hold the text
+    prefilter = re.compile(re.escape(needle), 0 if case else re.IGNORECASE)
+    # An exact byte match is final; otherwise the decoded line decides
+    verify = whole_word or not case
+    hits = []
+    line = counted = pos = 0
+    while len(hits) < max_hits:
+        match = prefilter.search(buf, pos)
+        if not match:
+            break
+        start = buf.rfind(b"\n", 0, match.start()) + 1
+        end = buf.find(b"\n", match.end())
+        if end == -1:
+            end = len(buf)
+        text = buf[start:end].rstrip(b"\r").decode(codec, "replace")
+        if not verify or pattern.search(text):
+            line += buf[counted:start].count(b"\n")
+            counted = start
+            hits.append((line + 1, text[:FIND_IN_FILES_MAX_LINE]))
+        pos = end + 1
+    return hits
@@ -0,0 +1,308 @@
+"""Read-only, memory-mapped viewer for files too large to edit."""
+
+import mmap
+from array import array
+from bisect import bisect_left
+from typing import Optional
+
+from PySide6.QtCore import Qt, QRect, QTimer
+from PySide6.QtGui import QPainter, QTextCursor, QTextDocument
+from PySide6.QtWidgets import QAbstractScrollArea
+
+from codeeditor import LineNumberGutter
+from fileio import EolCounter, detect_sample_encoding
+from workers import Worker
+from constants import (
+    EncodingType,
+    TextFormat,
+    ENCODING_PYTHON_NAMES,
+    TAB_STOP_SPACES,
+    VIEWER_INDEX_CHUNK_SIZE,
+    VIEWER_MAX_LINE_LENGTH,
+)
+
+
+class SparseLineIndex:
+    """Sparse line-start index over a read-only byte buffer.
+
+    Only the number of line breaks before each ``chunk_size`` block of the
+    buffer is stored, so the index stays a few kilobytes even for
+    multi-gigabyte files. A line start is found by bisecting to the block
+    holding its line break and scanning that block alone. Line-ending
+    styles are counted in the same pass.
+    """
+
+    def __init__(self, buf, chunk_size: int = VIEWER_INDEX_CHUNK_SIZE):
+        self.buf = buf
+        self.size = len(buf)
+        self.chunk_size = chunk_size
+        self.breaks = array("q", [0])
+        self.eol = EolCounter()
+        self.complete = self.size == 0
+
+    @property
+    def line_count(self) -> int:
+        """Number of lines indexed so far."""
+        return self.breaks[-1] + 1
+
+    def build(self, cancelled=None, progress=None) -> None:
+        """Count line breaks block by block; safe to run on a worker."""
+        pos = 0
+        percent = 0
+        while pos < self.size:
+            if cancelled and cancelled():
+                return
+            end = min(pos + self.chunk_size, self.size)
+            block = self.buf[pos:end]
+            self.breaks.append(self.breaks[-1] + block.count(b"\n"))
+            self.eol.feed(block)
+            pos = end
+            if progress and 100 * pos // self.size != percent:
+                percent = 100 * pos // self.size
+                progress(percent)
+        self.complete = True
+
+    def line_start(self, line: int) -> int:
+        """Return the byte offset where the 0-based ``line`` starts."""
+        if line <= 0:
+            return 0
+        block = bisect_left(self.breaks, line) - 1
+        if block >= len(self.breaks) - 1:
+            return self.size
+        pos = block * self.chunk_size
+        for _ in range(line - self.breaks[block]):
+            pos = self.buf.find(b"\n", pos) + 1
+        return pos
+
+    def line_at(self, offset: int) -> Optional[int]:
+        """Return the 0-based line holding byte ``offset``.
+
+        Returns None while ``offset`` lies past the part indexed so far,
+        rather than counting line breaks through the rest of the file.
+        """
+        offset = min(max(0, offset), self.size)
+        block = offset // self.chunk_size
+        if block >= len(self.breaks) - 1 and not self.complete:
+            return None
+        block = min(block, len(self.breaks) - 1)
+        start = block * self.chunk_size
+        return self.breaks[block] + self.buf.count(b"\n", start, offset)
+
+    def lines(self, first: int, count: int):
+        """Yield raw bytes of ``count`` lines starting at ``first``."""
+        pos = self.line_start(first)
+        for _ in range(min(count, self.line_count - first)):
+            if pos > self.size:
+                return
+            end = self.buf.find(b"\n", pos, pos + VIEWER_MAX_LINE_LENGTH)
+            if end == -1:
+                raw = self.buf[pos:pos + VIEWER_MAX_LINE_LENGTH]
+                nxt = self.buf.find(b"\n", pos + len(raw))
+                pos = self.size + 1 if nxt == -1 else nxt + 1
+            else:
+                raw = self.buf[pos:end]
+                pos = end + 1
+            yield raw.rstrip(b"\r")
+
+
+class HugeFileViewer(LineNumberGutter, QAbstractScrollArea):
+    """Scroll area painting only the visible lines of a memory-mapped file.
+
+    It mimics the parts of the Editor interface that the main window reads
+    (file metadata, ``document()``, zoom) so the tab can live next to
+    ordinary editors; editing actions are disabled while it is active.
+    """
+
+    ENCODINGS = (
+        EncodingType.UTF8,
+        EncodingType.UTF8_BOM,
+        EncodingType.WINDOWS_1251,
+        EncodingType.OEM_866,
+    )
+
+    def __init__(self, path: str, sample_size: int, cached=None):
+        super().__init__()
+
+        self.curName = path
+        self.zoomValue = 0
+        self.textFormat = TextFormat.OTHER
+        self.loader = None
+        self.task = None
+        self.saving = None
+
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.fileSize = len(self._mmap)
+        self.index = SparseLineIndex(self._mmap)
+        if cached:
+            self.encodingType, self.lineEnding = cached
+        else:
+            with memoryview(self._mmap) as view, view[:sample_size] as sample:
+                self.encodingType = detect_sample_encoding(
+                    sample, len(sample) == self.fileSize
+                )
+            head = EolCounter()
+            head.feed(self._mmap[:VIEWER_INDEX_CHUNK_SIZE])
+            self.lineEnding = head.dominant()
+        self.mixedEol = False
+        self.encoding = ENCODING_PYTHON_NAMES[self.encodingType]
+        self._placeholder = QTextDocument(self)
+        self._maxWidth = 0
+        self.indexer = Worker(
+            lambda worker: self.index.build(
+                worker.isCancelled, worker.signals.progress.emit
+            )
+        )
+        self.indexer.signals.progress.connect(self.indexUpdated)
+        self.indexer.signals.finished.connect(self.indexUpdated)
+
+        self.init_line_number_area()
+        self.verticalScrollBar().valueChanged.connect(self.line_number_area.update)
+        self.update_line_number_area_width(0)
+
+    @classmethod
+    def supports(cls, encoding: EncodingType) -> bool:
+        """Return True for encodings where a line break is a single LF byte."""
+        return encoding in cls.ENCODINGS
+
+    def document(self) -> QTextDocument:
+        """Return an empty document so editor-only actions become no-ops."""
+        return self._placeholder
+
+    def toPlainText(self) -> str:  # pylint: disable=invalid-name
+        """The viewer never materialises the file as a string."""
+        return ""
+
+    def textCursor(self) -> QTextCursor:  # pylint: disable=invalid-name
+        """Return a cursor on the empty placeholder document."""
+        return QTextCursor(self._placeholder)
+
+    def highlight_current_line(self) -> None:
+        """Nothing to highlight: the viewer has no text cursor."""
+
+    def firstVisibleLine(self) -> int:  # pylint: disable=invalid-name
+        """Return the 0-based number of the top visible line."""
+        return self.verticalScrollBar().value()
+
+    def line_count(self) -> int:
+        """Return the number of lines indexed so far."""
+        return self.index.line_count
+
+    def visible_rows(self) -> int:
+        """Return how many lines fit in the viewport."""
+        return max(1, self.viewport().height() // self.fontMetrics().height())
+
+    def visible_line_numbers(self, rect):
+        """Yield ``(number, top)`` for each visible line inside ``rect``."""
+        height = self.fontMetrics().height()
+        first = self.firstVisibleLine()
+        for row in range(min(self.visible_rows() + 1, self.line_count() - first)):
+            top = row * height
+            if top > rect.bottom():
+                break
+            if top + height >= rect.top():
+                yield first + row + 1, top
+
+    def startIndexing(self) -> Worker:  # pylint: disable=invalid-name
+        """Count lines on a worker thread; the view grows as it progresses."""
+        self.indexer.start()
+        return self.indexer
+
+    def indexUpdated(self) -> None:  # pylint: disable=invalid-name
+        """Refresh scroll range and gutter after the index has grown."""
+        if self.index.complete:
+            self.lineEnding = self.index.eol.dominant(self.lineEnding)
+            self.mixedEol = self.index.eol.mixed
+        self.update_line_number_area_width(0)
+        self.updateScrollBars()
+        self.line_number_area.update()
+        self.viewport().update()
+
+    def updateScrollBars(self) -> None:  # pylint: disable=invalid-name
+        """Fit the scroll bars to the indexed lines and viewport size."""
+        rows = self.visible_rows()
+        vbar = self.verticalScrollBar()
+        vbar.setRange(0, max(0, self.line_count() - rows))
+        vbar.setPageStep(rows)
+        hbar = self.horizontalScrollBar()
+        hbar.setRange(0, max(0, self._maxWidth - self.viewport().width()))
+        hbar.setPageStep(self.viewport().width())
+
+    def goto_line(self, line: int) -> None:
+        """Scroll so that the 0-based ``line`` is at the top."""
+        self.verticalScrollBar().setValue(line)
+
+    def zoom(self, delta: int) -> None:
+        """Zoom in or out by one point based on delta value."""
+        self.zoomIn(1 if delta >= 0 else -1)
+
+    def zoomIn(self, step: int = 1) -> None:  # pylint: disable=invalid-name
+        """Change the font size by ``step`` points."""
+        font = self.font()
+        font.setPointSize(max(1, font.pointSize() + step))
+        self.setFont(font)
+        self.zoomValue += step
+        self.indexUpdated()
+
+    def paintEvent(self, event):  # pylint: disable=invalid-name
+        """Decode and draw only the lines inside the viewport."""
+        with QPainter(self.viewport()) as painter:
+            painter.fillRect(event.rect(), self.palette().base())
+            painter.setPen(self.palette().text().color())
+            metrics = self.fontMetrics()
+            height = metrics.height()
+            left = 4 - self.horizontalScrollBar().value()
+            width = self.viewport().width()
+            widest = self._maxWidth
+            lines = self.index.lines(self.firstVisibleLine(), self.visible_rows() + 1)
+            for row, raw in enumerate(lines):
+                text = raw.decode(self.encoding, "replace").expandtabs(TAB_STOP_SPACES)
+                advance = metrics.horizontalAdvance(text)
+                widest = max(widest, advance)
+                rect = QRect(left, row * height, max(advance, width), height)
+                painter.drawText(rect, Qt.AlignLeft | Qt.TextSingleLine, text)
+        if widest > self._maxWidth:
+            # Changing the scroll range may resize the viewport, which must
+            # not happen while it is being painted
+            self._maxWidth = widest
+            QTimer.singleShot(0, self, self.updateScrollBars)
+
+    def resizeEvent(self, e):  # pylint: disable=invalid-name
+        """Resize gutter and scroll bars with the viewport."""
+        super().resizeEvent(e)
+        self.updateScrollBars()
+
+    def scrollContentsBy(self, dx, dy):  # pylint: disable=invalid-name
+        """Repaint instead of scrolling pixels: rows are redrawn each time."""
+        self.viewport().update()
+        if dy:
+            self.line_number_area.update()
+
+    def keyPressEvent(self, event):  # pylint: disable=invalid-name
+        """Jump to the start or end of the file with Ctrl+Home/End."""
+        vbar = self.verticalScrollBar()
+        if event.key() == Qt.Key_Home and event.modifiers() & Qt.ControlModifier:
+            vbar.setValue(vbar.minimum())
+        elif event.key() == Qt.Key_End and event.modifiers() & Qt.ControlModifier:
+            vbar.setValue(vbar.maximum())
+        else:
+            super().keyPressEvent(event)
+
+    def wheelEvent(self, event) -> None:  # pylint: disable=invalid-name
+        """Handle wheel events, ignoring Ctrl+wheel for zoom."""
+        if event.modifiers() & Qt.ControlModifier:
+            event.ignore()
+        else:
+            super().wheelEvent(event)
+
+    def closeEvent(self, event):  # pylint: disable=invalid-name
+        """Release the memory map when the tab is closed."""
+        self.release()
+        super().closeEvent(event)
+
+    def release(self) -> None:
+        """Stop indexing and unmap the file."""
+        self.indexer.cancel()
+        self.index.buf = b""
+        self._mmap.close()
+        self._file.close()
@@ -1,12 +1,18 @@
 """Main entry point for the PySide6 Notepad application."""
 
-import codecs
+import concurrent.futures
+import multiprocessing
 import os
+import queue
+import re
 import sys
 import subprocess
+import tempfile
+import threading
 import time
-from typing import Optional, Tuple
-from chardet.universaldetector import UniversalDetector
+from functools import partial
+from pathlib import Path
+from typing import Iterable, Optional, Tuple, Union
 from PySide6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -20,6 +26,10 @@ from PySide6.QtWidgets import (
     QColorDialog,
     QPushButton,
     QPlainTextEdit,
+    QProgressBar,
+    QDockWidget,
+    QTreeWidget,
+    QTreeWidgetItem,
 )
 from PySide6.QtPrintSupport import QPrinter, QPrintDialog, QPrintPreviewDialog
 from PySide6.QtCore import (
@@ -31,6 +41,9 @@ from PySide6.QtCore import (
     Qt,
     QRegularExpression,
     QTranslator,
+    QObject,
+    QTimer,
+    Signal,
 )
 from PySide6.QtGui import (
     QFont,
@@ -49,15 +62,34 @@ from ui.main_form import Ui_MainWindow
 from codeeditor import CodeEditor
 from ui.find_replace import Ui_Find
 from ui.go_to import Ui_Goto
+from ui.sort_lines import Ui_SortLines
+from ui.remove_duplicates import Ui_RemoveDuplicates
+from ui.find_in_files import Ui_FindInFiles
 from ui.options import Ui_Opt
 import ui.files_res
+from fileio import (
+    EolCounter,
+    decoding_name,
+    detect_encoding,
+    detect_sample_encoding,
+    iter_decoded_chunks,
+    write_text,
+)
+from docmetrics import DocumentMetrics, LineIndex, MatchIndex
+from enccache import EncodingCache
+from filesearch import iter_files, search_file, split_globs
+from regexsearch import RegexPool
+import regexsearch
+import textops
+from textops import PARAGRAPH_SEPARATOR, qt_position, replace_all, transform_lines
+from workers import Worker
+from hugeviewer import HugeFileViewer
 from constants import (
     EncodingType,
     LineEnding,
     TextFormat,
+    SortMode,
     ENCODING_NAMES,
-    ENCODING_PYTHON_NAMES,
-    LINE_ENDING_STRINGS,
     DEFAULT_FONT_FAMILY,
     DEFAULT_FONT_SIZE,
     DEFAULT_FONT_WEIGHT,
@@ -74,6 +106,20 @@ from constants import (
     DEFAULT_LANGUAGE,
     DEFAULT_MAX_RECENT_FILES,
     DEFAULT_ICON_SIZE,
+    DEFAULT_LOAD_CHUNK_SIZE,
+    DEFAULT_STREAM_LOAD_THRESHOLD,
+    DEFAULT_VIEWER_THRESHOLD,
+    DEFAULT_DETECT_SAMPLE_SIZE,
+    DEFAULT_ENCODING_CACHE_SIZE,
+    ENCODING_CACHE_FILE,
+    BACKGROUND_TASK_THRESHOLD,
+    EXTERNAL_SORT_THRESHOLD,
+    FIND_IN_FILES_MAX_HITS,
+    FIND_IN_FILES_PENDING,
+    REGEX_SEARCH_TIMEOUT,
+    SEARCH_HIGHLIGHT_DELAY,
+    INCREMENTAL_SEARCH_DELAY,
+    SEARCH_HIGHLIGHT_MARGIN,
     TEXT_FILE_EXTENSIONS,
     APP_VERSION,
     APP_RELEASE_DATE,
@@ -92,16 +138,36 @@ class Editor(CodeEditor):
         self.encodingType = EncodingType.UTF8
         self.textFormat = TextFormat.TEXT_FILE
         self.lineEnding = LineEnding.WINDOWS_CRLF
-
-        self.searchHighLight = SearchHighLight(self.document())
+        self.mixedEol = False
+
+        self.searchHighLight = SearchHighLight(self)
+        self.metrics = DocumentMetrics(self.document())
+        self.lines = LineIndex(self.document())
+        self.matches = None
+        self.loader = None
+        self.task = None
+        self.saving = None
+        # Unlike QTextDocument.revision(), not bumped by re-highlighting
+        self.edits = 0
+        self.document().contentsChange.connect(self._count_edit)
         self.setAcceptDrops(False)
 
+    def _count_edit(self, _pos: int, _removed: int, _added: int) -> None:
+        self.edits += 1
+
     def zoom(self, delta: int) -> None:
         """Zoom in or out based on delta value."""
         zoom_increment = DEFAULT_ZOOM_INCREMENT if delta >= 0 else -DEFAULT_ZOOM_INCREMENT
         self.zoomIn(zoom_increment)
         self.zoomValue += zoom_increment
 
+    def goto_line(self, line: int) -> None:
+        """Move the cursor to the start of the 0-based ``line``."""
+        cursor = self.textCursor()
+        cursor.setPosition(self.lines.line_start(line))
+        self.setTextCursor(cursor)
+        self.centerCursor()
+
     def wheelEvent(self, event) -> None:
         """Handle wheel events, ignoring Ctrl+wheel for zoom."""
         if event.modifiers() & Qt.ControlModifier:
@@ -110,28 +176,758 @@ class Editor(CodeEditor):
             QPlainTextEdit.wheelEvent(self, event)
 
 
-class SearchHighLight(QSyntaxHighlighter):
-    """Syntax highlighter for search text matches."""
+class ChunkLoader(QObject):
+    """Load a file into an editor without blocking the event loop.
+
+    Encoding detection, reading and decoding run on a worker thread which
+    hands decoded chunks to the GUI thread through a bounded queue; each
+    chunk is appended to the document as it arrives.
+
+    With ``reload`` the editor's text is replaced only once the file has
+    been opened and read, and put back if the load fails or is cancelled.
+    """
+
+    QUEUE_SIZE = 4
+
+    progress = Signal(int)
+    finished = Signal()
+    failed = Signal(str)
+
+    def __init__(
+        self,
+        editor: Editor,
+        path: str,
+        chunk_size: int,
+        threshold: int,
+        sample_size: int,
+        cache: EncodingCache,
+        reload: bool = False,
+    ):
+        super().__init__(editor)
+        self.editor = editor
+        self.path = path
+        self.reload = reload
+        self._previous = None
+        self._modified = editor.document().isModified()
+        self._lineEnding = editor.lineEnding
+        self._mixedEol = editor.mixedEol
+        self._cache = cache
+        self._queue = queue.Queue(self.QUEUE_SIZE)
+        self._stat = None
+        self._cached = False
+        self._encodingType = EncodingType.UTF8
+        self._eol = EolCounter()
+        self._readOnly = editor.isReadOnly()
+        self._done = False
+        self._worker = Worker(self._read, path, chunk_size, threshold, sample_size)
+        self._worker.signals.progress.connect(self._step)
+        self._worker.signals.error.connect(self._fail)
+
+    def start(self) -> None:
+        """Start loading; the editor stays read-only until done."""
+        self.editor.loader = self
+        self.editor.setReadOnly(True)
+        self.editor.document().setUndoRedoEnabled(False)
+        self._worker.start()
+
+    def cancel(self) -> None:
+        """Stop loading, keeping the text appended so far.
+
+        A cancelled reload puts the previous text back instead.
+        """
+        self._worker.cancel()
+        self._finish(emit=False)
+
+    def _read(
+        self,
+        worker: Worker,
+        path: str,
+        chunk_size: int,
+        threshold: int,
+        sample_size: int,
+    ) -> None:
+        """Read, detect and decode the file on the worker thread.
+
+        The file is read once: encoding detection runs on a zero-copy view
+        of the first bytes, which are then decoded as the first chunk.
+        Detection is skipped for files found unchanged in the cache. Line
+        breaks are counted on the same raw chunks (decoded text for UTF-16).
+        Files below ``threshold`` are read whole and decoded in one piece.
+        """
+        with open(path, "rb") as file:
+            self._stat = os.fstat(file.fileno())
+            size = self._stat.st_size
+            if size < threshold:
+                head = file.read()
+            else:
+                head = file.read(sample_size)
+            cached = self._cache.get(path, self._stat)
+            if cached:
+                self._cached = True
+                self._encodingType = cached[0]
+            else:
+                sample = memoryview(head)[:sample_size]
+                self._encodingType = detect_sample_encoding(sample, len(sample) == size)
+            utf16 = self._encodingType in (EncodingType.UTF16_BE, EncodingType.UTF16_LE)
+            self._eol = EolCounter(text=utf16)
+            enc = decoding_name(self._encodingType)
+            done = 0
+            for text, raw in iter_decoded_chunks(file, enc, chunk_size, head):
+                self._eol.feed(text if utf16 else raw)
+                done += len(raw)
+                percent = 100 * done // size if size else 100
+                if not self._put(worker, (text, percent)):
+                    return
+        self._put(worker, None)
+
+    def _put(self, worker: Worker, item) -> bool:
+        while not worker.isCancelled():
+            try:
+                self._queue.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            worker.signals.progress.emit(0)
+            return True
+        return False
+
+    def _step(self) -> None:
+        if self._done:
+            return
+        try:
+            item = self._queue.get_nowait()
+        except queue.Empty:
+            return
+        if self.reload and self._previous is None:
+            self._previous = document_text(self.editor.document())
+            self.editor.clear()
+        if item is None:
+            self._finish()
+            return
+        text, percent = item
+        if text:
+            cursor = QTextCursor(self.editor.document())
+            cursor.movePosition(QTextCursor.End)
+            cursor.insertText(text)
+        self.progress.emit(percent)
 
-    SEARCH_HIGHLIGHT_COLOR = "#9bff9b"
+    def _fail(self, msg: str) -> None:
+        self._finish(emit=False)
+        self.failed.emit(msg)
+
+    def _finish(self, emit: bool = True) -> None:
+        if self._done:
+            return
+        self._done = True
+        doc = self.editor.document()
+        doc.setUndoRedoEnabled(True)
+        doc.setModified(False)
+        self.editor.setReadOnly(self._readOnly)
+        self.editor.highlight_current_line()
+        self.editor.lineEnding = self._eol.dominant()
+        self.editor.mixedEol = self._eol.mixed
+        self.editor.loader = None
+        if self.reload and not emit:
+            if self._previous is not None:
+                self.editor.setPlainText(self._previous)
+            doc.setModified(self._modified)
+            self.editor.lineEnding = self._lineEnding
+            self.editor.mixedEol = self._mixedEol
+        self._previous = None
+        if emit:
+            self.editor.encodingType = self._encodingType
+            if not self._cached:
+                self._cache.put(
+                    self.path, self._stat, self._encodingType, self.editor.lineEnding
+                )
+            self.finished.emit()
+
+
+def insert_result(cursor: QTextCursor, text: str, result) -> None:
+    """Replace the selection of ``cursor`` with a transform result.
+
+    A ``Path`` result names a file written by an on-disk transform; it is
+    streamed into the document in chunks as one edit, then removed.
+    """
+    if isinstance(result, Path):
+        cursor.beginEditBlock()
+        try:
+            cursor.removeSelectedText()
+            with open(result, encoding="utf_8", errors="surrogatepass") as f:
+                for chunk in iter(lambda: f.read(DEFAULT_LOAD_CHUNK_SIZE), ""):
+                    cursor.insertText(chunk)
+        finally:
+            cursor.endEditBlock()
+            os.remove(result)
+    elif result != text:
+        cursor.insertText(result)
+
+
+def find_flags(case: bool, whole_word: bool) -> QTextDocument.FindFlag:
+    """Return the ``QTextDocument.find`` flags for the Find dialog options."""
+    flags = QTextDocument.FindFlag(0)
+    if case:
+        flags |= QTextDocument.FindCaseSensitively
+    if whole_word:
+        flags |= QTextDocument.FindWholeWords
+    return flags
+
+
+def document_text(document: QTextDocument) -> str:
+    """Return the text of ``document`` with LF line breaks.
+
+    Unlike ``toPlainText`` it keeps no-break spaces and line separators
+    (U+2028), so the text can be written back without changing them.
+    """
+    return document.toRawText().replace(PARAGRAPH_SEPARATOR, "\n")
+
+
+def iter_document_text(
+    document: QTextDocument, chunk_size: int, start: int = 0, end: Optional[int] = None
+):
+    """Yield the text of ``document`` in chunks of about ``chunk_size``.
+
+    Chunks end at line breaks and use LF, so a character is never split
+    and the whole text is never copied at once. ``start`` and ``end``
+    limit the text to part of the document.
+    """
+    if end is None:
+        end = document.characterCount() - 1
+    cursor = QTextCursor(document)
+    while True:
+        last = document.findBlock(start + chunk_size)
+        stop = last.position() + last.length() - 1
+        if not last.isValid() or stop >= end:
+            stop = end
+        cursor.setPosition(start)
+        cursor.setPosition(stop, QTextCursor.KeepAnchor)
+        text = cursor.selectedText().replace(PARAGRAPH_SEPARATOR, "\n")
+        if stop == end:
+            yield text
+            return
+        yield text + "\n"
+        start = stop + 1
+
+
+class TextTask(QObject):
+    """Transform a snapshot of an editor's text off the GUI thread.
+
+    The transform runs in a worker process so that long pure-Python work
+    such as sorting cannot hold the GUI thread through the GIL. Its result
+    replaces the snapshot only if the document was not edited meanwhile.
+    A snapshot may also be given as an iterable of text chunks. It is then
+    written to a temporary file, one chunk per turn of the event loop, and
+    the transform gets the file's ``Path`` instead of a string.
+    """
+
+    finished = Signal(bool)
+    failed = Signal(str)
+
+    def __init__(
+        self,
+        editor: Editor,
+        cursor: QTextCursor,
+        text: Union[str, Iterable[str]],
+        fn,
+        pool: concurrent.futures.Executor,
+    ):
+        super().__init__(editor)
+        self.editor = editor
+        self._cursor = cursor
+        self._text = text
+        self._chunks = None
+        self._file = None
+        if not isinstance(text, str):
+            self._chunks = iter(text)
+            fd, path = tempfile.mkstemp(prefix="notepad-text-", suffix=".txt")
+            self._file = open(
+                fd, "w", encoding="utf_8", errors="surrogatepass", newline="\n"
+            )
+            self._text = Path(path)
+        self._edits = editor.edits
+        self._worker = Worker(self._run, fn, pool)
+        self._worker.signals.result.connect(self._apply)
+        self._worker.signals.error.connect(self._fail)
+
+    def start(self) -> None:
+        """Start the transform."""
+        self.editor.task = self
+        if self._chunks is None:
+            self._worker.start()
+        else:
+            QTimer.singleShot(0, self._spill)
+
+    def cancel(self) -> None:
+        """Discard the transform; a running process finishes unobserved."""
+        if self._chunks is not None:
+            self._closeSpill()
+        self._worker.cancel()
+        self.editor.task = None
+
+    def _spill(self) -> None:
+        if self._chunks is None:
+            return
+        if self.editor.edits != self._edits:
+            self._closeSpill()
+            self._apply(None)
+            return
+        try:
+            chunk = next(self._chunks, None)
+            if chunk is not None:
+                self._file.write(chunk)
+                QTimer.singleShot(0, self._spill)
+                return
+            self._file.close()
+        except OSError as e:
+            self._closeSpill()
+            self._fail(str(e))
+            return
+        self._chunks = None
+        self._worker.start()
+
+    def _closeSpill(self) -> None:
+        self._chunks = None
+        self._file.close()
+        os.remove(self._text)
+
+    def _run(self, worker: Worker, fn, pool: concurrent.futures.Executor):
+        text = self._text
+        try:
+            future = pool.submit(fn, text)
+        except BaseException:
+            self._removeSpilled(text)
+            raise
+        future.add_done_callback(lambda _future: self._removeSpilled(text))
+        while True:
+            try:
+                result = future.result(timeout=0.1)
+            except concurrent.futures.TimeoutError:
+                if worker.isCancelled():
+                    future.add_done_callback(self._discard)
+                    future.cancel()
+                    return None
+            else:
+                if worker.isCancelled():
+                    self._discard(future)
+                return result
+
+    @staticmethod
+    def _removeSpilled(text: Union[str, Path]) -> None:
+        # The task may be deleted with its tab before the process is done
+        if isinstance(text, Path):
+            os.remove(text)
+
+    @staticmethod
+    def _discard(future: concurrent.futures.Future) -> None:
+        # Remove the file of an on-disk result that will not be applied
+        if future.cancelled() or future.exception():
+            return
+        if isinstance(future.result(), Path):
+            os.remove(future.result())
+
+    def _apply(self, result) -> None:
+        self.editor.task = None
+        if self.editor.edits != self._edits:
+            if isinstance(result, Path):
+                os.remove(result)
+            self.finished.emit(False)
+            return
+        insert_result(self._cursor, self._text, result)
+        self.finished.emit(True)
+
+    def _fail(self, msg: str) -> None:
+        self.editor.task = None
+        self.failed.emit(msg)
+
+
+class SaveTask(QObject):
+    """Save an editor's document, by default off the GUI thread.
+
+    A background save writes a snapshot of the text taken with one
+    ``toRawText`` copy, so editing can go on meanwhile; the editor is
+    marked unmodified only if it was not edited before the save completed.
+    A save that waits streams the live document instead.
+    """
+
+    finished = Signal(bool)
+    failed = Signal(str)
+
+    def __init__(self, editor: Editor, path: str):
+        super().__init__(editor)
+        self.editor = editor
+        self.path = path
+        self._encoding = editor.encodingType
+        self._eol = editor.lineEnding
+        self._edits = editor.edits
+        self._snapshot = None
+        self._error = None
+        self._written = threading.Event()
+        self._pending = True
+
+    def start(self, wait: bool = False) -> bool:
+        """Start the save; with ``wait`` save on this thread and return
+        whether it succeeded."""
+        self.editor.saving = self
+        if wait:
+            self._write(iter_document_text(self.editor.document(), DEFAULT_LOAD_CHUNK_SIZE))
+            return self._finish()
+        self._snapshot = self.editor.document().toRawText()
+        worker = Worker(
+            lambda _worker: self._write(
+                textops.iter_chunks(self._snapshot, DEFAULT_LOAD_CHUNK_SIZE)
+            )
+        )
+        worker.signals.finished.connect(self._finish)
+        worker.start()
+        return True
+
+    def wait(self) -> bool:
+        """Block until the save is written and return whether it succeeded."""
+        self._written.wait()
+        return self._finish()
+
+    def _write(self, chunks) -> None:
+        try:
+            write_text(self.path, chunks, self._encoding, self._eol)
+        except Exception as e:  # pylint: disable=broad-except
+            self._error = str(e)
+        finally:
+            self._written.set()
+
+    def _finish(self) -> bool:
+        if self._pending:
+            self._pending = False
+            self._snapshot = None
+            self.editor.saving = None
+            if self._error is not None:
+                self.failed.emit(self._error)
+            else:
+                self.editor.curName = self.path
+                self.editor.mixedEol = False
+                unchanged = self.editor.edits == self._edits
+                if unchanged:
+                    self.editor.document().setModified(False)
+                self.finished.emit(unchanged)
+        return self._error is None
+
+
+class FileSearch(QObject):
+    """Search the files under a directory in a process pool.
+
+    A worker thread walks the tree and keeps up to
+    ``FIND_IN_FILES_PENDING`` files queued in the pool; the hits of each
+    file are reported as soon as it has been searched.
+    """
+
+    found = Signal(str, list)
+    finished = Signal(int, int)
+    failed = Signal(str)
+
+    def __init__(
+        self,
+        parent: QObject,
+        pool: concurrent.futures.Executor,
+        root: str,
+        include: str,
+        exclude: str,
+        find_text: str,
+        case: bool,
+        whole_word: bool,
+        sample_size: int,
+    ):
+        super().__init__(parent)
+        self._pool = pool
+        self._files = (root, split_globs(include), split_globs(exclude))
+        self._args = (find_text, case, whole_word, sample_size)
+        self._worker = Worker(self._run)
+        self._worker.signals.result.connect(lambda counts: self.finished.emit(*counts))
+        self._worker.signals.error.connect(self.failed)
+
+    def start(self) -> None:
+        """Start walking and searching."""
+        self._worker.start()
+
+    def cancel(self) -> None:
+        """Stop the search; files already searched are not reported."""
+        self._worker.cancel()
+
+    def _run(self, worker: Worker):
+        searched = hits = 0
+        pending = {}
+        files = iter_files(*self._files)
+        while True:
+            for path in files:
+                pending[self._pool.submit(search_file, path, *self._args)] = path
+                if len(pending) >= FIND_IN_FILES_PENDING:
+                    break
+            if not pending:
+                return searched, hits
+            done, _ = concurrent.futures.wait(
+                pending, timeout=0.1, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            if worker.isCancelled():
+                for future in pending:
+                    future.cancel()
+                return None
+            for future in done:
+                path = pending.pop(future)
+                searched += 1
+                try:
+                    result = future.result()
+                except (OSError, ValueError):
+                    continue  # Unreadable or special file
+                if result:
+                    hits += len(result)
+                    self.found.emit(path, result)
+
+
+class TabSearch(QObject):
+    """Search the open tabs on the global thread pool.
+
+    Editors are searched in a snapshot of their text taken when the search
+    starts, large-file viewers in their file. ``found`` reports each tab
+    with hits and ``finished(hits, tabs)`` follows the last one.
+    """
+
+    found = Signal(object, list)
+    finished = Signal(int, int)
+
+    def __init__(
+        self,
+        parent: QObject,
+        docs: list,
+        find_text: str,
+        case: bool,
+        whole_word: bool,
+        sample_size: int,
+    ):
+        super().__init__(parent)
+        self._pending = len(docs)
+        self._hits = 0
+        self._matched = 0
+        self._workers = []
+        pattern = textops.find_pattern(find_text, case, whole_word)
+        for doc in docs:
+            if isinstance(doc, HugeFileViewer):
+                worker = Worker(
+                    lambda _worker, path: search_file(
+                        path, find_text, case, whole_word, sample_size
+                    ),
+                    doc.curName,
+                )
+            else:
+                worker = Worker(
+                    lambda _worker, text: textops.find_lines(
+                        text, pattern, FIND_IN_FILES_MAX_HITS, PARAGRAPH_SEPARATOR
+                    ),
+                    doc.document().toRawText(),
+                )
+            worker.signals.result.connect(partial(self._done, doc))
+            worker.signals.error.connect(lambda _msg, doc=doc: self._done(doc, []))
+            self._workers.append(worker)
+
+    def start(self) -> None:
+        """Start searching all tabs."""
+        for worker in self._workers:
+            worker.start()
+
+    def cancel(self) -> None:
+        """Stop reporting hits."""
+        for worker in self._workers:
+            worker.cancel()
+
+    def _done(self, doc, hits: list) -> None:
+        if hits:
+            self._hits += len(hits)
+            self._matched += 1
+            self.found.emit(doc, hits)
+        self._pending -= 1
+        if not self._pending:
+            self.finished.emit(self._hits, self._matched)
+
+
+class RegexSearch(QObject):
+    """Run a regex search of an editor's text in the regex worker process.
+
+    ``finished(current, result)`` reports the result of ``fn``, with
+    ``current`` False if the document was edited meanwhile. A search that
+    runs longer than ``REGEX_SEARCH_TIMEOUT`` seconds emits ``timedOut``
+    instead; it and a cancelled search kill the worker process, as ``re``
+    cannot be interrupted.
+    """
+
+    finished = Signal(bool, object)
+    failed = Signal(str)
+    timedOut = Signal()
+
+    def __init__(self, editor: Editor, pool: RegexPool, fn, *args):
+        super().__init__(editor)
+        self.editor = editor
+        self._pool = pool
+        self._fn = fn
+        self._args = args
+        self._edits = editor.edits
+        self._result = None
+        self._timedOut = False
+        self._worker = Worker(self._run)
+        self._worker.signals.result.connect(self._apply)
+        self._worker.signals.error.connect(self._fail)
+
+    def start(self) -> None:
+        """Send the search to the worker process."""
+        self._result = self._pool.submit(
+            self._fn,
+            self.editor,
+            self._edits,
+            lambda: document_text(self.editor.document()),
+            *self._args,
+        )
+        self._worker.start()
+
+    def cancel(self) -> None:
+        """Discard the search and kill the worker process."""
+        self._worker.cancel()
+        self._pool.terminate()
+
+    def discard(self) -> None:
+        """Discard the search, leaving the worker process to finish it."""
+        self._worker.cancel()
+
+    def _run(self, worker: Worker):
+        deadline = time.monotonic() + REGEX_SEARCH_TIMEOUT
+        while True:
+            try:
+                return self._result.get(timeout=0.1)
+            except multiprocessing.TimeoutError:
+                if worker.isCancelled():
+                    return None
+                if time.monotonic() > deadline:
+                    self._timedOut = True
+                    raise
+
+    def _apply(self, result) -> None:
+        current = self.editor.edits == self._edits
+        self.finished.emit(current, result)
+
+    def _fail(self, msg: str) -> None:
+        if self._timedOut:
+            self._pool.terminate()
+            self.timedOut.emit()
+        else:
+            self.failed.emit(msg)
+
+
+class SearchResults(QDockWidget):
+    """Dock listing search hits grouped by file.
+
+    Each group carries a target (a file path or an open tab's widget) and
+    each hit a 1-based line number; activating either emits
+    ``activated(target, line)``.
+    """
+
+    activated = Signal(object, int)
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setObjectName("searchResults")
+        self.tree = QTreeWidget(self)
+        self.tree.setHeaderHidden(True)
+        self.tree.setUniformRowHeights(True)
+        self.tree.itemActivated.connect(self.itemActivated)
+        self.setWidget(self.tree)
+
+    def clear(self, title: str) -> None:
+        """Remove all results and set the dock title."""
+        self.setWindowTitle(title)
+        self.tree.clear()
+
+    def addResults(self, target, name: str, hits: list) -> None:
+        """Append the ``(line, text)`` hits of one target under ``name``."""
+        group = QTreeWidgetItem([f"{name} ({len(hits)})"])
+        group.setData(0, Qt.UserRole, target)
+        children = []
+        for line, text in hits:
+            child = QTreeWidgetItem([f"{line}: {text}"])
+            child.setData(0, Qt.UserRole, line)
+            children.append(child)
+        group.addChildren(children)
+        self.tree.addTopLevelItem(group)
+        group.setExpanded(True)
+
+    def itemActivated(self, item: QTreeWidgetItem, _column: int) -> None:  # pylint: disable=invalid-name
+        """Emit the target and line of an activated group or hit."""
+        if item.parent():
+            self.activated.emit(item.parent().data(0, Qt.UserRole), item.data(0, Qt.UserRole))
+        else:
+            self.activated.emit(item.data(0, Qt.UserRole), 1)
+
+
+class SearchHighLight(QSyntaxHighlighter):
+    """Syntax highlighter for occurrences of the selected text.
+
+    Pattern changes are debounced and only re-highlight the blocks around
+    the viewport; other blocks are brought up to date as they scroll into
+    view.
+    """
+
+    SEARCH_HIGHLIGHT_COLOR = "#9bff9b"
+
+    def __init__(self, editor: QPlainTextEdit):
+        super().__init__(editor.document())
+        self.editor = editor
         self.pattern = QRegularExpression()
         self.format = QTextCharFormat()
         self.format.setBackground(QColor().fromString(self.SEARCH_HIGHLIGHT_COLOR))
+        self._text = ""
+        self._pending = ""
+        self._highlighted = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(SEARCH_HIGHLIGHT_DELAY)
+        self._timer.timeout.connect(self._applyPattern)
+        vbar = editor.verticalScrollBar()
+        vbar.valueChanged.connect(self.highlightVisible)
+        vbar.rangeChanged.connect(self.highlightVisible)
+        editor.document().blockCountChanged.connect(lambda _: self._highlighted.clear())
 
     def highlightBlock(self, text: str) -> None:
         """Highlight matching text in the block."""
+        self._highlighted.add(self.currentBlock().blockNumber())
+        if not self._text:
+            return
         match_iterator = self.pattern.globalMatch(text)
         while match_iterator.hasNext():
             match = match_iterator.next()
             self.setFormat(match.capturedStart(), match.capturedLength(), self.format)
 
     def searchText(self, text: str) -> None:
-        """Update search pattern and rehighlight."""
-        self.pattern = QRegularExpression(text)
-        self.rehighlight()
+        """Highlight ``text`` once the selection has settled."""
+        self._pending = text
+        if text == self._text:
+            self._timer.stop()
+        else:
+            self._timer.start()
+
+    def _applyPattern(self) -> None:
+        # Matches never span blocks, so multi-line selections clear it
+        text = "" if "\u2029" in self._pending else self._pending
+        if text == self._text:
+            return
+        self._text = text
+        self.pattern = QRegularExpression(QRegularExpression.escape(text))
+        self._highlighted.clear()
+        self.highlightVisible()
+
+    def highlightVisible(self) -> None:
+        """Re-highlight stale blocks in and near the viewport."""
+        first = self.editor.firstVisibleBlock()
+        rows = self.editor.viewport().height() // self.editor.fontMetrics().height()
+        start = max(0, first.blockNumber() - SEARCH_HIGHLIGHT_MARGIN)
+        end = first.blockNumber() + rows + SEARCH_HIGHLIGHT_MARGIN
+        block = self.document().findBlockByNumber(start)
+        while block.isValid() and block.blockNumber() <= end:
+            if block.blockNumber() not in self._highlighted:
+                self.rehighlightBlock(block)
+            block = block.next()
 
 
 class Find(QDialog):
@@ -140,6 +936,12 @@ class Find(QDialog):
         self.ui = Ui_Find()
         self.ui.setupUi(self)
         self.setWindowIcon(self.parent().windowIcon())
+        self.counter = None
+        self._snapshot = (None, -1, "")
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(INCREMENTAL_SEARCH_DELAY)
+        self._timer.timeout.connect(self.incrementalSearch)
         self.findReplaceActions()
 
     def changeEvent(self, event):
@@ -147,6 +949,142 @@ class Find(QDialog):
             self.ui.retranslateUi(self)
         super(Find, self).changeEvent(event)
 
+    def showEvent(self, event):
+        self.countMatches()
+        super(Find, self).showEvent(event)
+
+    def hideEvent(self, event):
+        # Do not keep a copy of the document while the dialog is hidden
+        self._timer.stop()
+        self.stopCounter()
+        self._snapshot = (None, -1, "")
+        super(Find, self).hideEvent(event)
+
+    def incrementalSearch(self):
+        """Move to the query as it is typed and count its matches."""
+        if not self.ui.checkRegex.isChecked():
+            self.parent().findIncremental(
+                self.ui.lineEditFind.text(),
+                self.ui.checkCase.isChecked(),
+                self.ui.checkWholeWord.isChecked(),
+                self.ui.checkWrapAround.isChecked(),
+            )
+        self.countMatches()
+
+    def countMatches(self):
+        """Show the number of matches of the query and of the selected one.
+
+        Counts come from the editor's match index. When the query has no
+        index yet, it is built on a worker thread over a snapshot of the
+        document, taken again only after an edit, replacing any build
+        still running. Regular expressions are counted in the regex worker
+        process instead, under its time budget.
+        """
+        self.stopCounter()
+        self.ui.labelCount.clear()
+        find_text = self.ui.lineEditFind.text()
+        doc = self.parent().tab.currentWidget()
+        if not find_text or isinstance(doc, HugeFileViewer):
+            return
+
+        query = (
+            find_text,
+            self.ui.checkCase.isChecked(),
+            self.ui.checkWholeWord.isChecked(),
+        )
+        if self.ui.checkRegex.isChecked():
+            self.countRegexMatches(doc, query)
+            return
+        if doc.matches and doc.matches.valid and doc.matches.query == query:
+            self.showCount(doc)
+            return
+        if self._snapshot[:2] != (doc, doc.edits):
+            self._snapshot = (doc, doc.edits, doc.document().toRawText())
+        pattern = textops.find_pattern(*query)
+        worker = Worker(
+            lambda worker, text: textops.match_spans(text, pattern, worker.isCancelled),
+            self._snapshot[2],
+        )
+        worker.signals.result.connect(
+            partial(self.indexBuilt, worker, doc, query, doc.edits)
+        )
+        self.counter = worker
+        worker.start()
+
+    def indexBuilt(self, worker, doc, query, edits, spans):
+        if worker is not self.counter:
+            return
+        self.counter = None
+        if doc.edits != edits:
+            self.countMatches()  # Edited meanwhile: index the new text
+            return
+        if doc.matches:
+            doc.matches.release()
+        doc.matches = MatchIndex(doc.document(), query, *spans)
+        self.showCount(doc)
+
+    def countRegexMatches(self, doc, query):
+        """Count the matches of a regular expression in the worker process.
+
+        A count superseded by a newer query is discarded but left to
+        finish, so that it does not kill a Find running in the process.
+        """
+        try:
+            textops.find_pattern(*query, True)
+        except re.error:
+            return
+        cursor = doc.textCursor()
+        search = RegexSearch(
+            doc,
+            self.parent().regexPool,
+            regexsearch.count,
+            *query,
+            cursor.selectionStart(),
+            cursor.selectionEnd(),
+        )
+        search.finished.connect(partial(self.regexCounted, search))
+        search.failed.connect(partial(self.regexCounted, search, False))
+        search.timedOut.connect(partial(self.regexCounted, search, False, None))
+        self.counter = search
+        search.start()
+
+    def regexCounted(self, search, current, result):
+        if search is not self.counter:
+            return
+        self.counter = None
+        if current and isinstance(result, tuple):
+            self.setCount(*result)
+
+    def stopCounter(self):
+        if isinstance(self.counter, RegexSearch):
+            self.counter.discard()
+        elif self.counter:
+            self.counter.cancel()
+        self.counter = None
+
+    def showCount(self, doc):
+        cursor = doc.textCursor()
+        current = doc.matches.find(cursor.selectionStart(), cursor.selectionEnd()) + 1
+        self.setCount(current, len(doc.matches))
+
+    def setCount(self, current, total):
+        if self.parent().language == "English":
+            if not total:
+                text = "No matches"
+            elif current:
+                text = f"Match {current:,} of {total:,}"
+            else:
+                text = f"{total:,} matches"
+        else:
+            if not total:
+                text = "Совпадений нет"
+            elif current:
+                text = f"Совпадение {current:,} из {total:,}"
+            else:
+                text = f"Совпадений: {total:,}"
+            text = text.replace(",", "\u00a0")
+        self.ui.labelCount.setText(text)
+
     def findReplaceActions(self):
 
         self.ui.btnFind.clicked.connect(
@@ -155,6 +1093,17 @@ class Find(QDialog):
                 self.ui.checkCase.isChecked(),
                 self.ui.checkWholeWord.isChecked(),
                 self.ui.checkWrapAround.isChecked(),
+                self.ui.checkRegex.isChecked(),
+            )
+        )
+        self.ui.btnFindPrev.clicked.connect(
+            lambda: self.parent().find(
+                self.ui.lineEditFind.text(),
+                self.ui.checkCase.isChecked(),
+                self.ui.checkWholeWord.isChecked(),
+                self.ui.checkWrapAround.isChecked(),
+                self.ui.checkRegex.isChecked(),
+                backward=True,
             )
         )
         self.ui.btnReplace.clicked.connect(
@@ -164,6 +1113,7 @@ class Find(QDialog):
                 self.ui.checkCase.isChecked(),
                 self.ui.checkWholeWord.isChecked(),
                 self.ui.checkWrapAround.isChecked(),
+                self.ui.checkRegex.isChecked(),
             )
         )
         self.ui.btnReplaceAll.clicked.connect(
@@ -172,6 +1122,30 @@ class Find(QDialog):
                 self.ui.lineEditReplace.text(),
                 self.ui.checkCase.isChecked(),
                 self.ui.checkWholeWord.isChecked(),
+                self.ui.checkRegex.isChecked(),
+            )
+        )
+        # Searches of the open tabs are literal
+        self.ui.checkRegex.toggled.connect(self.ui.btnFindAllTabs.setDisabled)
+
+        # Search as the query is typed; buttons refresh the count after
+        # their action, which is connected first
+        self.ui.lineEditFind.textEdited.connect(lambda _text: self._timer.start())
+        for check in (self.ui.checkCase, self.ui.checkWholeWord, self.ui.checkRegex):
+            check.toggled.connect(lambda _checked: self._timer.start())
+        buttons = (
+            self.ui.btnFind,
+            self.ui.btnFindPrev,
+            self.ui.btnReplace,
+            self.ui.btnReplaceAll,
+        )
+        for btn in buttons:
+            btn.clicked.connect(lambda: self.countMatches())
+        self.ui.btnFindAllTabs.clicked.connect(
+            lambda: self.parent().findInTabs(
+                self.ui.lineEditFind.text(),
+                self.ui.checkCase.isChecked(),
+                self.ui.checkWholeWord.isChecked(),
             )
         )
 
@@ -183,6 +1157,7 @@ class Goto(QDialog):
         self.ui.setupUi(self)
         self.setWindowIcon(self.parent().windowIcon())
 
+        self.ui.comboMode.currentIndexChanged.connect(self.modeChanged)
         self.ui.pushButton.clicked.connect(self.gotoClicked)
 
     def changeEvent(self, event):
@@ -190,16 +1165,145 @@ class Goto(QDialog):
             self.ui.retranslateUi(self)
         super(Goto, self).changeEvent(event)
 
+    def modeChanged(self, mode):
+        # Lines are numbered from 1, offsets from 0
+        self.ui.spinBox.setMinimum(1 if mode == 0 else 0)
+
     def gotoClicked(self):
-        line = self.ui.spinBox.value() - 1
+        """Go to a line, or to a byte offset of the file as it is saved."""
+        value = int(self.ui.spinBox.value())
+        offset = self.ui.comboMode.currentIndex() == 1
         doc = self.parent().tab.currentWidget()
-        if line > doc.document().blockCount():
-            doc.moveCursor(QTextCursor.End)
+        if not offset:
+            doc.goto_line(value - 1)
+        elif isinstance(doc, HugeFileViewer):
+            line = doc.index.line_at(value)
+            if line is None:
+                if self.parent().language == "English":
+                    msg = "The file is still being indexed"
+                else:
+                    msg = "Файл еще индексируется"
+                self.parent().ui.statusbar.showMessage(msg, 3000)
+                return
+            doc.goto_line(line)
         else:
-            cursor = QTextCursor(doc.document().findBlockByLineNumber(line))
+            crlf = doc.lineEnding == LineEnding.WINDOWS_CRLF
+            cursor = doc.textCursor()
+            cursor.setPosition(doc.metrics.position_at(value, doc.encodingType, crlf))
             doc.setTextCursor(cursor)
 
 
+class SortLines(QDialog):
+    def __init__(self, parent=None):
+        super(SortLines, self).__init__(parent)
+        self.ui = Ui_SortLines()
+        self.ui.setupUi(self)
+        self.setWindowIcon(self.parent().windowIcon())
+
+        self.ui.btnSort.clicked.connect(self.sortClicked)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.LanguageChange:
+            self.ui.retranslateUi(self)
+        super(SortLines, self).changeEvent(event)
+
+    def sortClicked(self):
+        regex = self.ui.lineEditRegex.text()
+        try:
+            re.compile(regex)
+        except re.error as e:
+            QMessageBox.warning(self, "Notepad", f"{regex}:\n{e}.")
+            return
+        keys = [
+            (
+                self.ui.spinColumn1.value(),
+                SortMode(self.ui.comboMode1.currentIndex()),
+                self.ui.checkDescending1.isChecked(),
+            )
+        ]
+        if self.ui.checkThenBy.isChecked():
+            keys.append(
+                (
+                    self.ui.spinColumn2.value(),
+                    SortMode(self.ui.comboMode2.currentIndex()),
+                    self.ui.checkDescending2.isChecked(),
+                )
+            )
+        self.parent().sort_lines_by(
+            keys,
+            self.ui.lineEditDelimiter.text(),
+            regex,
+            self.ui.checkUnique.isChecked(),
+        )
+        self.accept()
+
+
+class RemoveDuplicates(QDialog):
+    def __init__(self, parent=None):
+        super(RemoveDuplicates, self).__init__(parent)
+        self.ui = Ui_RemoveDuplicates()
+        self.ui.setupUi(self)
+        self.setWindowIcon(self.parent().windowIcon())
+
+        self.ui.btnRemove.clicked.connect(self.removeClicked)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.LanguageChange:
+            self.ui.retranslateUi(self)
+        super(RemoveDuplicates, self).changeEvent(event)
+
+    def removeClicked(self):
+        self.parent().dedupe_lines(
+            keep_last=self.ui.checkKeepLast.isChecked(),
+            ignore_case=self.ui.checkIgnoreCase.isChecked(),
+            ignore_space=self.ui.checkIgnoreSpace.isChecked(),
+            count=self.ui.checkCount.isChecked(),
+            verify=self.ui.checkVerify.isChecked(),
+        )
+        self.accept()
+
+
+class FindInFiles(QDialog):
+    def __init__(self, parent=None):
+        super(FindInFiles, self).__init__(parent)
+        self.ui = Ui_FindInFiles()
+        self.ui.setupUi(self)
+        self.setWindowIcon(self.parent().windowIcon())
+
+        self.ui.btnBrowse.clicked.connect(self.browseClicked)
+        self.ui.btnFindAll.clicked.connect(self.findAllClicked)
+
+    def changeEvent(self, event):
+        if event.type() == QEvent.LanguageChange:
+            self.ui.retranslateUi(self)
+        super(FindInFiles, self).changeEvent(event)
+
+    def showEvent(self, event):
+        # Start in the folder of the current file
+        if not self.ui.lineEditDir.text():
+            path = self.parent().tab.currentWidget().curName
+            self.ui.lineEditDir.setText(os.path.dirname(path) if path else os.getcwd())
+        super(FindInFiles, self).showEvent(event)
+
+    def browseClicked(self):
+        path = QFileDialog.getExistingDirectory(
+            self, self.windowTitle(), self.ui.lineEditDir.text()
+        )
+        if path:
+            self.ui.lineEditDir.setText(path)
+
+    def findAllClicked(self):
+        if self.parent().findInFiles(
+            self.ui.lineEditFind.text(),
+            self.ui.lineEditDir.text(),
+            self.ui.lineEditInclude.text(),
+            self.ui.lineEditExclude.text(),
+            self.ui.checkCase.isChecked(),
+            self.ui.checkWholeWord.isChecked(),
+        ):
+            self.accept()
+
+
 class Options(QDialog):
     def __init__(self, parent=None):
         super(Options, self).__init__(parent)
@@ -436,6 +1540,9 @@ class MainWindow(QMainWindow):
         self.optionsDlg = Options(self)
         self.findDlg = Find(self)
         self.gotoDlg = Goto(self)
+        self.sortDlg = SortLines(self)
+        self.dedupeDlg = RemoveDuplicates(self)
+        self.findInFilesDlg = FindInFiles(self)
         self.createRecentList()
         self.connectActions()
         self.update_window_title()
@@ -505,6 +1612,26 @@ class MainWindow(QMainWindow):
             self.setWindowState(Qt.WindowState.WindowMaximized)
         self.resize(widthApp, heightApp)
         self.move(x, y)
+        # Files
+        self.loadChunkSize = self.settings.value(
+            "FILES/LOAD_CHUNK_SIZE", DEFAULT_LOAD_CHUNK_SIZE, type=int
+        )
+        self.streamThreshold = self.settings.value(
+            "FILES/STREAM_LOAD_THRESHOLD", DEFAULT_STREAM_LOAD_THRESHOLD, type=int
+        )
+        self.viewerThreshold = self.settings.value(
+            "FILES/VIEWER_THRESHOLD", DEFAULT_VIEWER_THRESHOLD, type=int
+        )
+        self.detectSampleSize = self.settings.value(
+            "FILES/DETECT_SAMPLE_SIZE", DEFAULT_DETECT_SAMPLE_SIZE, type=int
+        )
+        self.encodingCacheSize = self.settings.value(
+            "FILES/ENCODING_CACHE_SIZE", DEFAULT_ENCODING_CACHE_SIZE, type=int
+        )
+        cacheDir = QFileInfo(self.settings.fileName()).absolutePath()
+        self.encodingCache = EncodingCache(
+            os.path.join(cacheDir, ENCODING_CACHE_FILE), self.encodingCacheSize
+        )
         # Recent files
         self.maxRecentFiles = DEFAULT_MAX_RECENT_FILES
         self.recentFileActs = []
@@ -545,6 +1672,14 @@ class MainWindow(QMainWindow):
             self.settings.setValue("START_POS_X", self.pos().x())
             self.settings.setValue("START_POS_Y", self.pos().y())
         self.settings.endGroup()
+        self.settings.beginGroup("FILES")
+        self.settings.setValue("LOAD_CHUNK_SIZE", self.loadChunkSize)
+        self.settings.setValue("STREAM_LOAD_THRESHOLD", self.streamThreshold)
+        self.settings.setValue("VIEWER_THRESHOLD", self.viewerThreshold)
+        self.settings.setValue("DETECT_SAMPLE_SIZE", self.detectSampleSize)
+        self.settings.setValue("ENCODING_CACHE_SIZE", self.encodingCacheSize)
+        self.settings.endGroup()
+        self.encodingCache.save()
         self.settings.beginGroup("RECENT_FILE_LIST")
         if len(self.files) == 0:
             self.settings.remove("")
@@ -585,6 +1720,34 @@ class MainWindow(QMainWindow):
         self.zoomLabel = QLabel("Zoom: 100%")
         self.zoomLabel.setMinimumWidth(80)
         self.ui.statusbar.addPermanentWidget(self.zoomLabel)
+        self.loadProgress = QProgressBar()
+        self.loadProgress.setRange(0, 100)
+        self.loadProgress.setMaximumWidth(150)
+        self.loadProgress.setVisible(False)
+        self.ui.statusbar.insertPermanentWidget(0, self.loadProgress)
+        self.loadCancelBtn = QPushButton()
+        self.loadCancelBtn.setVisible(False)
+        self.loadCancelBtn.clicked.connect(self.cancelLoading)
+        self.ui.statusbar.insertPermanentWidget(1, self.loadCancelBtn)
+        self.taskProgress = QProgressBar()
+        self.taskProgress.setRange(0, 0)
+        self.taskProgress.setMaximumWidth(150)
+        self.taskProgress.setVisible(False)
+        self.ui.statusbar.insertPermanentWidget(2, self.taskProgress)
+        self.taskCancelBtn = QPushButton()
+        self.taskCancelBtn.setVisible(False)
+        self.taskCancelBtn.clicked.connect(self.cancelTasks)
+        self.ui.statusbar.insertPermanentWidget(3, self.taskCancelBtn)
+        self._taskPool = None
+        self._searchPool = None
+        self.fileSearch = None
+        self.tabSearch = None
+        self.regexPool = RegexPool()
+        self.regexSearch = None
+        self.searchResults = SearchResults(self)
+        self.searchResults.activated.connect(self.openSearchResult)
+        self.addDockWidget(Qt.BottomDockWidgetArea, self.searchResults)
+        self.searchResults.hide()
         # Tabpanel
         self.tab = QTabWidget()
         self.setCentralWidget(self.tab)
@@ -657,8 +1820,9 @@ class MainWindow(QMainWindow):
         # File-menu
         self.ui.actionNew.triggered.connect(self.newFile)
         self.ui.actionOpen.triggered.connect(self.openDialog)
-        self.ui.actionSave.triggered.connect(self.save)
-        self.ui.actionSaveAs.triggered.connect(self.saveAs)
+        self.ui.actionSave.triggered.connect(lambda: self.save())
+        self.ui.actionSaveAs.triggered.connect(lambda: self.saveAs())
+        self.ui.actionSaveAll.triggered.connect(self.saveAll)
         self.ui.actionPrint.triggered.connect(self.printFile)
         self.ui.actionPrintPreview.triggered.connect(self.printPreview)
         self.ui.actionClose.triggered.connect(
@@ -679,6 +1843,7 @@ class MainWindow(QMainWindow):
             lambda: self.tab.currentWidget().selectAll()
         )
         self.ui.actionFindReplace.triggered.connect(self.runFindDlg)
+        self.ui.actionFindInFiles.triggered.connect(lambda: self.findInFilesDlg.show())
         self.ui.actionGoto.triggered.connect(lambda: self.gotoDlg.show())
         self.ui.actionDateTime.triggered.connect(self.insertDateTime)
         self.ui.actionUPPERCASE.triggered.connect(self.uppercase)
@@ -697,6 +1862,8 @@ class MainWindow(QMainWindow):
         self.ui.actionSortLinesDescendingOrder.triggered.connect(
             self.sort_lines_descending_order
         )
+        self.ui.actionSortLines.triggered.connect(lambda: self.sortDlg.show())
+        self.ui.actionRemoveDuplicates.triggered.connect(lambda: self.dedupeDlg.show())
         self.ui.actionWindowsCRLF.triggered.connect(self.windows_crlf)
         self.ui.actionUnixLF.triggered.connect(self.unix_lf)
 
@@ -738,8 +1905,17 @@ class MainWindow(QMainWindow):
             self.openFile(f)
 
     def closeEvent(self, event):
+        for idx in range(self.tab.count()):
+            if self.tab.widget(idx).saving:
+                self.tab.widget(idx).saving.wait()
         if self.maybeSave():
             self.saveSettings()
+            if self.fileSearch:
+                self.fileSearch.cancel()
+            self.regexPool.terminate()
+            for pool in (self._taskPool, self._searchPool):
+                if pool:
+                    pool.shutdown(wait=False, cancel_futures=True)
             event.accept()
         else:
             event.ignore()
@@ -865,19 +2041,18 @@ class MainWindow(QMainWindow):
         if not path:
             return
         
-        try:
-            enc = self.detector(path)
-            with open(path, "r", encoding=enc, errors="replace") as file:
-                txt = file.read()
-            doc.setPlainText(txt)
-            doc.document().setModified(False)
-            self.update_status_bar()
-        except Exception as e:
-            if self.language == "English":
-                error_msg = "Cannot reload file "
-            else:
-                error_msg = "Невозможно перезагрузить файл "
-            QMessageBox.warning(self, "Notepad", f"{error_msg}{path}:\n{str(e)}.")
+        if self.language == "English":
+            error_msg = "Cannot reload file "
+        else:
+            error_msg = "Невозможно перезагрузить файл "
+
+        if isinstance(doc, HugeFileViewer):
+            self.removeEditor(doc)
+            self.openFile(path)
+            return
+        if doc.loader:
+            doc.loader.cancel()
+        self.loadFile(doc, path, error_msg, reload=True)
 
     def iconSizeToolBar(self, size):
         self.iSize = size
@@ -921,7 +2096,7 @@ class MainWindow(QMainWindow):
             cancelBtn = msgBox.addButton(txt3, QMessageBox.RejectRole)
             msgBox.exec()
             if msgBox.clickedButton() == saveBtn:
-                return self.save()
+                return self.save(wait=True)
             if msgBox.clickedButton() == cancelBtn:
                 return False
         return True
@@ -946,13 +2121,10 @@ class MainWindow(QMainWindow):
         # Endline symbol
         if txt:
             doc.setPlainText(txt)
-            line_ending = self.lineEndingsOpt(txt)
-            if line_ending == LINE_ENDING_STRINGS[LineEnding.WINDOWS_CRLF]:
-                doc.lineEnding = LineEnding.WINDOWS_CRLF
-            elif line_ending == LINE_ENDING_STRINGS[LineEnding.UNIX_LF]:
-                doc.lineEnding = LineEnding.UNIX_LF
-            else:
-                doc.lineEnding = LineEnding.WINDOWS_CRLF
+            eol = EolCounter(text=True)
+            eol.feed(txt)
+            doc.lineEnding = eol.dominant()
+            doc.mixedEol = eol.mixed
 
         # Color
         palette = QPalette()
@@ -1007,6 +2179,8 @@ class MainWindow(QMainWindow):
         self.update_status_bar()
         self.update_encoding_menu()
         self.update_eol()
+        self.update_edit_actions()
+        return doc
 
     def context_doc(self, point):
         if self.language == "English":
@@ -1071,14 +2245,12 @@ class MainWindow(QMainWindow):
             return self.openFile(path)
 
     def openFile(self, path: str) -> bool:
-        """Open a file in a new tab. Returns True if successful."""
+        """Open a file in a new tab. Returns True if loading has started."""
         if self.language == "English":
             txt1 = "Cannot read file "
-            txt2 = "The file is open"
             txt3 = "The file is already opened in Notepad"
         else:
             txt1 = "Невозможно прочитать файл "
-            txt2 = "Файл открыт"
             txt3 = "Файл уже открыт в Notepad"
 
         # Check if file is already open
@@ -1088,21 +2260,16 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Notepad", txt3)
             return False
 
-        # Try to read the file
+        # Huge files open in a read-only viewer; others are read in the background
         try:
-            enc = self.detector(path)
-            with open(
-                file=path, mode="r", encoding=enc, errors="replace", newline=""
-            ) as file:
-                txt = file.read()
+            viewer = self.createViewer(path)
         except Exception as e:
             QMessageBox.warning(self, "Notepad", f"{txt1}{path}:\n{str(e)}.")
             return False
-
-        # Create tab and update recent files
-        fileName = os.path.basename(path)
-        self.createTab(fileName, path, txt)
-        self.ui.statusbar.showMessage(txt2, 3000)
+        if viewer is None:
+            fileName = os.path.basename(path)
+            doc = self.createTab(fileName, path, "")
+            self.loadFile(doc, path, txt1)
 
         # Update recent files list
         if path in self.files:
@@ -1117,36 +2284,156 @@ class MainWindow(QMainWindow):
 
         return True
 
-    def detector(self, path: str) -> str:
-        """Detect file encoding using chardet."""
-        detector = UniversalDetector()
-        try:
-            with open(path, "rb") as f:
-                for line in f:
-                    detector.feed(line)
-                    if detector.done:
-                        break
-            detector.close()
-            
-            detected_encoding = detector.result.get("encoding", "utf-8")
-            # Map detected encodings to Python encoding names
-            encoding_map = {
-                "UTF-8-SIG": "utf_8_sig",
-                "UTF-16": "utf_16",
-                "windows-1251": "cp1251",
-                "IBM866": "cp866",
-            }
-            return encoding_map.get(detected_encoding, "utf_8")
-        except Exception:
-            return "utf_8"  # Default fallback
-
-    def lineEndingsOpt(self, txt: str) -> Optional[str]:
-        """Detect line ending type in text."""
-        if LINE_ENDING_STRINGS[LineEnding.WINDOWS_CRLF] in txt:
-            return LINE_ENDING_STRINGS[LineEnding.WINDOWS_CRLF]
-        if LINE_ENDING_STRINGS[LineEnding.UNIX_LF] in txt:
-            return LINE_ENDING_STRINGS[LineEnding.UNIX_LF]
-        return None
+    def createViewer(self, path: str) -> Optional[HugeFileViewer]:
+        """Open a huge file in a read-only memory-mapped viewer tab.
+
+        Returns None when the file is below the viewer threshold or its
+        encoding has no single-byte line break, so it is edited instead.
+        """
+        if os.path.getsize(path) < self.viewerThreshold:
+            return None
+        cached = self.encodingCache.get(path)
+        doc = HugeFileViewer(path, self.detectSampleSize, cached)
+        if not HugeFileViewer.supports(doc.encodingType):
+            doc.release()
+            doc.deleteLater()
+            return None
+        if not cached:
+            self.encodingCache.put(
+                path, os.stat(path), doc.encodingType, doc.lineEnding
+            )
+
+        palette = QPalette()
+        palette.setColor(QPalette.Text, QColor().fromString(self.colorText))
+        palette.setColor(QPalette.Base, QColor().fromString(self.backgroundColor))
+        doc.setPalette(palette)
+        doc.setFont(
+            QFont(self.fontFamily, self.sizeTxt, self.fontWeight, self.fontItalic)
+        )
+        doc.zoomIn(self.zoomGlob)
+        doc.verticalScrollBar().valueChanged.connect(self.update_status_bar)
+        doc.indexer.signals.finished.connect(lambda: self.viewerIndexed(doc))
+        doc.startIndexing()
+
+        idx = self.tab.addTab(doc, os.path.basename(path))
+        self.tab.setCurrentIndex(idx)
+        self.update_window_title()
+        self.update_status_bar()
+        self.update_encoding_menu()
+        self.update_edit_actions()
+        return doc
+
+    def viewerIndexed(self, doc: HugeFileViewer) -> None:
+        """Show the line-ending style counted while indexing a viewer."""
+        if doc is self.tab.currentWidget():
+            self.update_status_bar()
+
+    def loadFile(
+        self, doc: Editor, path: str, error_msg: str, reload: bool = False
+    ) -> None:
+        """Read a file into an editor on a worker thread, showing progress.
+
+        With ``reload`` the file replaces the editor's text, which is kept
+        if the file cannot be read.
+        """
+        if self.language == "English":
+            txt1 = "Loading"
+            txt2 = "The file is open"
+            txt3 = "Cancel"
+        else:
+            txt1 = "Загрузка"
+            txt2 = "Файл открыт"
+            txt3 = "Отмена"
+
+        loader = ChunkLoader(
+            doc,
+            path,
+            self.loadChunkSize,
+            self.streamThreshold,
+            self.detectSampleSize,
+            self.encodingCache,
+            reload,
+        )
+        loader.progress.connect(self.loadProgress.setValue)
+        loader.finished.connect(lambda: self.loadFinished(doc, txt2))
+        loader.failed.connect(
+            lambda e: self.loadFailed(doc, f"{error_msg}{path}:\n{e}.", reload)
+        )
+        loader.start()
+        self.loadProgress.setValue(0)
+        self.loadCancelBtn.setText(txt3)
+        self.updateLoadWidgets()
+        self.ui.statusbar.showMessage(f"{txt1} {os.path.basename(path)}...")
+
+    def loadFinished(self, doc: Editor, msg: str) -> None:
+        """Refresh the UI once a file is fully loaded."""
+        self.updateLoadWidgets()
+        self.ui.statusbar.showMessage(msg, 3000)
+        if doc is self.tab.currentWidget():
+            self.update_window_title()
+            self.update_status_bar()
+            self.update_encoding_menu()
+            self.update_eol()
+
+    def loadFailed(self, doc: Editor, msg: str, reload: bool = False) -> None:
+        """Drop the placeholder tab of a file that could not be read.
+
+        A tab that was being reloaded keeps its text and stays open.
+        """
+        if not reload:
+            self.removeEditor(doc)
+        self.updateLoadWidgets()
+        self.ui.statusbar.clearMessage()
+        QMessageBox.warning(self, "Notepad", msg)
+
+    def cancelLoading(self) -> None:
+        """Cancel all running loads and close their tabs.
+
+        Tabs being reloaded stay open with their previous text.
+        """
+        if self.language == "English":
+            msg = "Loading cancelled"
+        else:
+            msg = "Загрузка отменена"
+
+        loading = [
+            self.tab.widget(idx)
+            for idx in range(self.tab.count())
+            if self.tab.widget(idx).loader
+        ]
+        for doc in loading:
+            reload = doc.loader.reload
+            doc.loader.cancel()
+            if not reload:
+                self.removeEditor(doc)
+        self.updateLoadWidgets()
+        self.ui.statusbar.showMessage(msg, 3000)
+
+    def updateLoadWidgets(self) -> None:
+        """Show the load progress and cancel button while files are loading."""
+        loading = any(
+            self.tab.widget(idx).loader for idx in range(self.tab.count())
+        )
+        self.loadProgress.setVisible(loading)
+        self.loadCancelBtn.setVisible(loading)
+
+    def removeEditor(self, doc: Editor) -> None:
+        """Close a tab without asking to save it."""
+        idx = self.tab.indexOf(doc)
+        if idx == -1:
+            return
+        doc.close()
+        self.tab.removeTab(idx)
+        if self.tab.count() == 0:
+            self.numbDoc = 0
+            self.newFile()
+
+    def detector(self, path: str) -> EncodingType:
+        """Return the file encoding from the cache or a bounded sample."""
+        cached = self.encodingCache.get(path)
+        if cached:
+            return cached[0]
+        return detect_encoding(path, self.detectSampleSize)
 
     def fileIsNotOpen(self, path: str) -> int:
         """Check if file is already open. Returns tab index or -1 if not found."""
@@ -1155,15 +2442,15 @@ class MainWindow(QMainWindow):
                 return idx
         return -1
 
-    def save(self) -> bool:
+    def save(self, wait: bool = False) -> bool:
         """Save current document. Returns True if successful."""
         idx = self.tab.currentIndex()
         path = self.tab.widget(idx).curName
         if path:
-            return self.saveFile(path)
-        return self.saveAs()
+            return self.saveFile(path, wait)
+        return self.saveAs(wait)
 
-    def saveAs(self) -> bool:
+    def saveAs(self, wait: bool = False) -> bool:
         """Save current document with new name. Returns True if successful."""
         if self.language == "English":
             dialog_title = "Save File"
@@ -1187,70 +2474,123 @@ class MainWindow(QMainWindow):
             QMessageBox.critical(self, "Notepad", error_msg)
             return False
 
-        return self.saveFile(path)
+        return self.saveFile(path, wait)
 
-    def saveFile(self, path: str) -> bool:
-        """Save current document to file. Returns True if successful."""
+    def saveAll(self) -> None:
+        """Save every modified document; saves of several tabs run at once."""
+        current = self.tab.currentIndex()
+        for idx in range(self.tab.count()):
+            doc = self.tab.widget(idx)
+            if not isinstance(doc, Editor) or not doc.document().isModified():
+                continue
+            if doc.curName:
+                self.saveFile(doc.curName, doc=doc)
+            else:
+                self.tab.setCurrentIndex(idx)
+                self.saveAs()
+        self.tab.setCurrentIndex(current)
+
+    def saveFile(self, path: str, wait: bool = False, doc=None) -> bool:
+        """Save a document (the current one by default) to file.
+
+        The file is written on a worker thread unless ``wait`` is set.
+        Returns True if the save succeeded or was started.
+        """
         if self.language == "English":
-            error_msg = "Cannot write file "
-            success_msg = "File saved"
+            saving_msg = "Saving..."
+            loading_msg = "The file is still loading"
+            busy_msg = "The file is still being saved"
         else:
-            error_msg = "Невозможно записать файл "
-            success_msg = "Файл сохранен"
+            saving_msg = "Сохранение..."
+            loading_msg = "Файл еще загружается"
+            busy_msg = "Файл еще сохраняется"
 
-        tb = self.tab
-        idx = tb.currentIndex()
-        doc = tb.widget(idx)
+        if doc is None:
+            doc = self.tab.currentWidget()
+        if not isinstance(doc, Editor):
+            return False
+        if doc.loader:
+            self.ui.statusbar.showMessage(loading_msg, 3000)
+            return False
+        if doc.saving:
+            if not wait:
+                self.ui.statusbar.showMessage(busy_msg, 3000)
+                return False
+            doc.saving.wait()
+
+        task = SaveTask(doc, path)
+        task.finished.connect(partial(self.saveFinished, task))
+        task.failed.connect(partial(self.saveFailed, task))
+        if wait:
+            return task.start(wait=True)
+        task.start()
+        self.updateTaskWidgets()
+        self.ui.statusbar.showMessage(saving_msg)
+        return True
 
-        # Convert line endings
-        if doc.lineEnding == LineEnding.WINDOWS_CRLF:
-            txt = doc.toPlainText().replace("\n", LINE_ENDING_STRINGS[LineEnding.WINDOWS_CRLF])
+    def saveFinished(self, task: SaveTask, unchanged: bool) -> None:
+        """Update the tab of a saved document."""
+        if self.language == "English":
+            success_msg = "File saved"
+            changed_msg = "File saved; the document was edited while saving"
         else:
-            txt = doc.toPlainText()
+            success_msg = "Файл сохранен"
+            changed_msg = "Файл сохранен; документ изменялся во время сохранения"
 
-        # Encode text according to selected encoding
-        encoding_name = ENCODING_PYTHON_NAMES.get(doc.encodingType, "utf_8")
-        encoded_text = txt.encode(encoding_name, "replace")
+        idx = self.tab.indexOf(task.editor)
+        if idx != -1:
+            self.tab.setTabText(idx, os.path.basename(task.path))
+        self.updateTaskWidgets()
+        self.ui.statusbar.showMessage(success_msg if unchanged else changed_msg, 3000)
+        self.update_window_title()
+        self.update_status_bar()
 
-        try:
-            with open(path, "wb") as f:
-                # Write BOM for UTF-16 encodings
-                if doc.encodingType == EncodingType.UTF16_BE:
-                    f.write(codecs.BOM_UTF16_BE)
-                elif doc.encodingType == EncodingType.UTF16_LE:
-                    f.write(codecs.BOM_UTF16_LE)
-                f.write(encoded_text)
-        except Exception as e:
-            QMessageBox.warning(self, "Notepad", f"{error_msg}{path}:\n{str(e)}.")
-            return False
+    def saveFailed(self, task: SaveTask, msg: str) -> None:
+        """Report a save that could not be written."""
+        if self.language == "English":
+            error_msg = "Cannot write file "
+        else:
+            error_msg = "Невозможно записать файл "
 
-        # Update document state
-        doc.curName = path
-        doc.document().setModified(False)
-        name = os.path.basename(path)
-        tb.setTabText(idx, name)
-        self.ui.statusbar.showMessage(success_msg, 3000)
-        self.update_window_title()
-        return True
+        self.updateTaskWidgets()
+        self.ui.statusbar.clearMessage()
+        QMessageBox.warning(self, "Notepad", f"{error_msg}{task.path}:\n{msg}.")
 
     def closeFile(self, idx):
+        if self.tab.widget(idx).saving:
+            self.tab.widget(idx).saving.wait()
+        if self.tab.widget(idx).loader:
+            self.tab.widget(idx).loader.cancel()
+        if self.tab.widget(idx).task:
+            self.tab.widget(idx).task.cancel()
         if self.maybeSave():
             self.tab.widget(idx).close()
             self.tab.removeTab(idx)
         if self.tab.count() == 0:
             self.numbDoc = 0
             self.newFile()
+        self.updateLoadWidgets()
+        self.updateTaskWidgets()
 
     def closeAllFiles(self):
         while self.tab.count() > 0:
             idx = self.tab.currentIndex()
+            if self.tab.widget(idx).saving:
+                self.tab.widget(idx).saving.wait()
+            if self.tab.widget(idx).loader:
+                self.tab.widget(idx).loader.cancel()
+            if self.tab.widget(idx).task:
+                self.tab.widget(idx).task.cancel()
             if self.maybeSave():
                 self.tab.widget(idx).close()
                 self.tab.removeTab(idx)
             else:
+                self.updateLoadWidgets()
                 return False
         self.numbDoc = 0
         self.newFile()
+        self.updateLoadWidgets()
+        self.updateTaskWidgets()
 
     def printFile(self):
         self.zoom_restore()
@@ -1280,51 +2620,278 @@ class MainWindow(QMainWindow):
         doc.searchHighLight.searchText(text)
         self.update_status_bar()
 
-    def find(self, findText, checkCase, checkWholeWord, wrapAround):
+    def find(
+        self, findText, checkCase, checkWholeWord, wrapAround, regex=False, backward=False
+    ):
+        # The Find dialog is modeless and may stay open over a viewer tab
+        if isinstance(self.tab.currentWidget(), HugeFileViewer):
+            return
+        if regex:
+            cursor = self.tab.currentWidget().textCursor()
+            self.startRegexSearch(
+                regexsearch.find,
+                partial(self.regexFound, findText),
+                findText,
+                checkCase,
+                checkWholeWord,
+                cursor.selectionStart() if backward else cursor.selectionEnd(),
+                wrapAround,
+                backward,
+            )
+            return
         idx = self.tab.currentIndex()
         doc = self.tab.widget(idx)
-        flags = QTextDocument.FindFlag(0)
-        if checkCase:
-            flags |= QTextDocument.FindCaseSensitively
-        if checkWholeWord:
-            flags |= QTextDocument.FindWholeWords
+        flags = find_flags(checkCase, checkWholeWord)
+        if backward:
+            flags |= QTextDocument.FindBackward
         if findText:
-            if not doc.find(findText, flags):
-                if wrapAround:
-                    doc.moveCursor(QTextCursor.Start)
-                    if not doc.find(findText, flags):
-                        QMessageBox.information(
-                            self, "Notepad", "Cannot find text:\n'%s'" % findText
-                        )
-                else:
-                    QMessageBox.information(
-                        self, "Notepad", "Cannot find text:\n'%s'" % findText
-                    )
+            query = (findText, checkCase, checkWholeWord)
+            found = self.findIndexed(doc, query, wrapAround, backward)
+            if found is None:
+                found = doc.find(findText, flags)
+                if not found and wrapAround:
+                    doc.moveCursor(QTextCursor.End if backward else QTextCursor.Start)
+                    found = doc.find(findText, flags)
+            if not found:
+                QMessageBox.information(
+                    self, "Notepad", "Cannot find text:\n'%s'" % findText
+                )
+
+    def findIndexed(
+        self, doc: Editor, query: tuple, wrapAround: bool, backward: bool
+    ) -> Optional[bool]:
+        """Select the next or previous match from the editor's match index.
 
-    def replace(self, findText, replaceText, checkCase, checkWholeWord, wrapAround):
+        Returns whether a match was found, or None if the index is missing
+        or belongs to another query.
+        """
+        if isinstance(doc, HugeFileViewer):
+            return False
+        matches = doc.matches
+        if not matches or not matches.valid or matches.query != query:
+            return None
+        cursor = doc.textCursor()
+        if backward:
+            idx = matches.before(cursor.selectionStart())
+            if idx == -1 and wrapAround:
+                idx = len(matches) - 1
+        else:
+            idx = matches.after(cursor.selectionEnd())
+            if idx == -1 and wrapAround and len(matches):
+                idx = 0
+        if idx == -1:
+            return False
+        start, end = matches.span(idx)
+        cursor.setPosition(start)
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+        doc.setTextCursor(cursor)
+        return True
+
+    def findIncremental(self, findText, checkCase, checkWholeWord, wrapAround):
+        """Select the first match at or after the start of the selection,
+        so that typing more of the query keeps extending the same match."""
+        doc = self.tab.currentWidget()
+        if not findText or isinstance(doc, HugeFileViewer):
+            return
+        flags = find_flags(checkCase, checkWholeWord)
+        document = doc.document()
+        found = document.find(findText, doc.textCursor().selectionStart(), flags)
+        if found.isNull() and wrapAround:
+            found = document.find(findText, 0, flags)
+        if not found.isNull():
+            doc.setTextCursor(found)
+
+    def replace(
+        self, findText, replaceText, checkCase, checkWholeWord, wrapAround, regex=False
+    ):
+        if isinstance(self.tab.currentWidget(), HugeFileViewer):
+            return
+        if regex:
+            cursor = self.tab.currentWidget().textCursor()
+            if not cursor.hasSelection():
+                self.find(findText, checkCase, checkWholeWord, wrapAround, regex)
+                return
+            self.startRegexSearch(
+                regexsearch.expand,
+                partial(
+                    self.regexExpanded,
+                    (findText, checkCase, checkWholeWord, wrapAround, True),
+                    (cursor.selectionStart(), cursor.selectionEnd()),
+                ),
+                findText,
+                checkCase,
+                checkWholeWord,
+                cursor.selectionStart(),
+                cursor.selectionEnd(),
+                replaceText,
+            )
+            return
         idx = self.tab.currentIndex()
         doc = self.tab.widget(idx)
         if findText == doc.textCursor().selectedText():
             doc.textCursor().insertText(replaceText)
         self.find(findText, checkCase, checkWholeWord, wrapAround)
 
-    def replaceAll(self, findText, replaceText, checkCase, checkWholeWord):
-        if findText:
+    def replaceAll(self, findText, replaceText, checkCase, checkWholeWord, regex=False):
+        """Replace all matches with one edit over the span they cover."""
+        if self.language == "English":
+            txt1 = "Replaced {} occurrence(s) in {:.0f} ms"
+        else:
+            txt1 = "Заменено вхождений: {} за {:.0f} мс"
+        if isinstance(self.tab.currentWidget(), HugeFileViewer):
+            return
+        if regex:
+            self.startRegexSearch(
+                regexsearch.replace,
+                partial(self.regexReplaced, time.perf_counter()),
+                findText,
+                checkCase,
+                checkWholeWord,
+                replaceText,
+            )
+        elif findText:
             idx = self.tab.currentIndex()
             doc = self.tab.widget(idx)
-            flags = QTextDocument.FindFlag(0)
-            if checkCase:
-                flags |= QTextDocument.FindCaseSensitively
-            if checkWholeWord:
-                flags |= QTextDocument.FindWholeWords
-            doc.textCursor().beginEditBlock()
+            start_time = time.perf_counter()
+            text = document_text(doc.document())
+            replaced, count, start, end = replace_all(
+                text, findText, replaceText, checkCase, checkWholeWord
+            )
+            if count:
+                cursor = QTextCursor(doc.document())
+                cursor.setPosition(qt_position(text, start))
+                cursor.setPosition(qt_position(text, end), QTextCursor.KeepAnchor)
+                cursor.insertText(replaced)
+            elapsed = 1000 * (time.perf_counter() - start_time)
+            self.ui.statusbar.showMessage(txt1.format(count, elapsed), 5000)
+
+    def startRegexSearch(
+        self, fn, handler, findText, checkCase, checkWholeWord, *args
+    ) -> None:
+        """Run a regex search of the current editor in the worker process
+        and pass its result to ``handler``."""
+        if self.language == "English":
+            txt1 = "Searching..."
+            txt2 = "Cancel"
+            txt3 = "Another operation is still running"
+        else:
+            txt1 = "Поиск..."
+            txt2 = "Отмена"
+            txt3 = "Другая операция еще выполняется"
+
+        doc = self.tab.currentWidget()
+        if not findText or isinstance(doc, HugeFileViewer):
+            return
+        if self.regexSearch:
+            self.ui.statusbar.showMessage(txt3, 3000)
+            return
+        try:
+            # Compiled as the worker will, since whole word wraps the pattern
+            textops.find_pattern(findText, checkCase, checkWholeWord, True)
+        except re.error as e:
+            QMessageBox.warning(self, "Notepad", f"{findText}:\n{e}.")
+            return
+
+        search = RegexSearch(
+            doc, self.regexPool, fn, findText, checkCase, checkWholeWord, *args
+        )
+        search.finished.connect(partial(self.regexSearchFinished, search, handler))
+        search.failed.connect(partial(self.regexSearchFailed, search))
+        search.timedOut.connect(partial(self.regexSearchTimedOut, search))
+        self.regexSearch = search
+        search.start()
+        self.taskCancelBtn.setText(txt2)
+        self.updateTaskWidgets()
+        self.ui.statusbar.showMessage(txt1)
+
+    def regexSearchFinished(
+        self, search: RegexSearch, handler, current: bool, result
+    ) -> None:
+        """Pass a result to its handler unless the document was edited or
+        closed meanwhile."""
+        if self.language == "English":
+            txt1 = "The document changed, the result was discarded"
+        else:
+            txt1 = "Документ изменился, результат отменен"
+
+        if search is not self.regexSearch:
+            return
+        self.regexSearch = None
+        self.updateTaskWidgets()
+        self.ui.statusbar.clearMessage()
+        if not current or self.tab.indexOf(search.editor) == -1:
+            self.ui.statusbar.showMessage(txt1, 3000)
+        else:
+            handler(search.editor, result)
+
+    def regexSearchFailed(self, search: RegexSearch, msg: str) -> None:
+        """Show the error of a regex search, e.g. a bad group reference."""
+        if search is self.regexSearch:
+            self.regexSearch = None
+            self.updateTaskWidgets()
+            self.ui.statusbar.clearMessage()
+            QMessageBox.warning(self, "Notepad", msg)
+
+    def regexSearchTimedOut(self, search: RegexSearch) -> None:
+        """Report a regex search stopped for exceeding its time budget."""
+        if self.language == "English":
+            msg = (
+                f"The regular expression took longer than {REGEX_SEARCH_TIMEOUT} s"
+                " and was stopped"
+            )
+        else:
+            msg = (
+                f"Поиск по регулярному выражению занял больше {REGEX_SEARCH_TIMEOUT} с"
+                " и был остановлен"
+            )
+
+        if search is self.regexSearch:
+            self.regexSearch = None
+            self.updateTaskWidgets()
+            self.ui.statusbar.clearMessage()
+            QMessageBox.warning(self, "Notepad", msg)
+
+    def regexFound(self, findText: str, doc: Editor, span) -> None:
+        """Select a regex match, given as a ``(start, end)`` span."""
+        if span is None:
+            QMessageBox.information(
+                self, "Notepad", "Cannot find text:\n'%s'" % findText
+            )
+            return
+        cursor = doc.textCursor()
+        cursor.setPosition(span[0])
+        cursor.setPosition(span[1], QTextCursor.KeepAnchor)
+        doc.setTextCursor(cursor)
+
+    def regexExpanded(
+        self, find_args: tuple, span: Tuple[int, int], doc: Editor, replaced
+    ) -> None:
+        """Replace the regex match that was selected, if it is one, and find
+        the next. ``span`` is the selection when Replace was clicked; the
+        user may have moved the cursor since."""
+        if replaced is not None:
             cursor = QTextCursor(doc.document())
-            while True:
-                cursor = doc.document().find(findText, cursor, flags)
-                if cursor.isNull():
-                    break
-                cursor.insertText(replaceText)
-            doc.textCursor().endEditBlock()
+            cursor.setPosition(span[0])
+            cursor.setPosition(span[1], QTextCursor.KeepAnchor)
+            cursor.insertText(replaced)
+            doc.setTextCursor(cursor)
+        self.find(*find_args)
+
+    def regexReplaced(self, start_time: float, doc: Editor, result) -> None:
+        """Apply the result of a regex Replace All as one edit."""
+        if self.language == "English":
+            txt1 = "Replaced {} occurrence(s) in {:.0f} ms"
+        else:
+            txt1 = "Заменено вхождений: {} за {:.0f} мс"
+
+        replaced, count, start, end = result
+        if count:
+            cursor = QTextCursor(doc.document())
+            cursor.setPosition(start)
+            cursor.setPosition(end, QTextCursor.KeepAnchor)
+            cursor.insertText(replaced)
+        elapsed = 1000 * (time.perf_counter() - start_time)
+        self.ui.statusbar.showMessage(txt1.format(count, elapsed), 5000)
 
     def insertDateTime(self):
         datetime = time.strftime("%H:%M %d.%m.%Y", time.localtime())
@@ -1340,143 +2907,357 @@ class MainWindow(QMainWindow):
             text = cursor.selectedText()
         return cursor, text
 
-    def uppercase(self) -> None:
-        """Convert selected or all text to uppercase."""
+    def _run_text_task(self, fn, spill_fn=None) -> None:
+        """Apply ``fn`` to the selection or document as one edit.
+
+        Large texts are transformed in a background process while the
+        window stays responsive; the result is dropped if the document is
+        edited before it arrives. With ``spill_fn``, texts of
+        EXTERNAL_SORT_THRESHOLD characters or more are not copied into a
+        string: the task streams them to a file and ``spill_fn`` gets its
+        path.
+        """
+        if self.language == "English":
+            txt1 = "Processing..."
+            txt2 = "Done"
+            txt3 = "The document changed, the result was discarded"
+            txt4 = "Cancel"
+            txt5 = "Another operation is still running"
+        else:
+            txt1 = "Обработка..."
+            txt2 = "Готово"
+            txt3 = "Документ изменился, результат отменен"
+            txt4 = "Отмена"
+            txt5 = "Другая операция еще выполняется"
+
         doc = self.tab.currentWidget()
-        if not doc.toPlainText():
+        if doc.document().isEmpty():
+            return
+        if doc.task:
+            self.ui.statusbar.showMessage(txt5, 3000)
+            return
+        cursor = doc.textCursor()
+        if not cursor.hasSelection():
+            cursor.select(QTextCursor.Document)
+        start, end = cursor.selectionStart(), cursor.selectionEnd()
+        if spill_fn and end - start >= EXTERNAL_SORT_THRESHOLD:
+            text = iter_document_text(doc.document(), DEFAULT_LOAD_CHUNK_SIZE, start, end)
+            fn = spill_fn
+        else:
+            text = cursor.selectedText()
+            if len(text) < BACKGROUND_TASK_THRESHOLD:
+                insert_result(cursor, text, fn(text))
+                return
+
+        task = TextTask(doc, cursor, text, fn, self.taskPool())
+        task.finished.connect(
+            lambda applied: self.taskFinished(txt2 if applied else txt3)
+        )
+        task.failed.connect(self.taskFailed)
+        task.start()
+        self.taskCancelBtn.setText(txt4)
+        self.updateTaskWidgets()
+        self.ui.statusbar.showMessage(txt1)
+
+    def taskPool(self) -> concurrent.futures.Executor:
+        """Return the process pool for background text transforms."""
+        if self._taskPool is None:
+            self._taskPool = concurrent.futures.ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=textops.init_collation,
+            )
+        return self._taskPool
+
+    def searchPool(self) -> concurrent.futures.Executor:
+        """Return the process pool for Find in Files.
+
+        It is separate from the transform pool, so a transform never waits
+        behind the files a search has queued.
+        """
+        if self._searchPool is None:
+            self._searchPool = concurrent.futures.ProcessPoolExecutor(
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._searchPool
+
+    def taskFinished(self, msg: str) -> None:
+        """Hide the task widgets and report the outcome."""
+        self.updateTaskWidgets()
+        self.ui.statusbar.showMessage(msg, 3000)
+
+    def taskFailed(self, msg: str) -> None:
+        """Hide the task widgets and show the error."""
+        self.updateTaskWidgets()
+        self.ui.statusbar.clearMessage()
+        QMessageBox.warning(self, "Notepad", msg)
+
+    def cancelTasks(self) -> None:
+        """Cancel all running text transforms."""
+        if self.language == "English":
+            msg = "Operation cancelled"
+        else:
+            msg = "Операция отменена"
+
+        for idx in range(self.tab.count()):
+            if self.tab.widget(idx).task:
+                self.tab.widget(idx).task.cancel()
+        if self.fileSearch:
+            self.fileSearch.cancel()
+            self.fileSearch = None
+        if self.tabSearch:
+            self.tabSearch.cancel()
+            self.tabSearch = None
+        if self.regexSearch:
+            self.regexSearch.cancel()
+            self.regexSearch = None
+        self.updateTaskWidgets()
+        self.ui.statusbar.showMessage(msg, 3000)
+
+    def updateTaskWidgets(self) -> None:
+        """Show the busy indicator while transforms or saves run, and the
+        cancel button while transforms run."""
+        docs = [self.tab.widget(idx) for idx in range(self.tab.count())]
+        running = (
+            any(doc.task for doc in docs)
+            or self.fileSearch is not None
+            or self.tabSearch is not None
+            or self.regexSearch is not None
+        )
+        saving = any(doc.saving for doc in docs)
+        self.taskProgress.setVisible(running or saving)
+        self.taskCancelBtn.setVisible(running)
+
+    def findInFiles(
+        self,
+        find_text: str,
+        root: str,
+        include: str,
+        exclude: str,
+        case: bool,
+        whole_word: bool,
+    ) -> bool:
+        """Search the files under ``root`` and list the hits in the results
+        dock as they arrive. Returns True if the search was started."""
+        if self.language == "English":
+            title = f'Find in Files: "{find_text}"'
+            txt1 = "Searching..."
+            txt2 = "Cancel"
+            txt3 = "Directory not found: "
+        else:
+            title = f'Найти в файлах: "{find_text}"'
+            txt1 = "Поиск..."
+            txt2 = "Отмена"
+            txt3 = "Папка не найдена: "
+
+        if not find_text:
+            return False
+        if not os.path.isdir(root):
+            QMessageBox.warning(self, "Notepad", f"{txt3}{root}")
+            return False
+        if self.fileSearch:
+            self.fileSearch.cancel()
+
+        search = FileSearch(
+            self,
+            self.searchPool(),
+            os.path.abspath(root),
+            include,
+            exclude,
+            find_text,
+            case,
+            whole_word,
+            self.detectSampleSize,
+        )
+        search.found.connect(partial(self.fileSearchFound, search))
+        search.finished.connect(partial(self.fileSearchFinished, search))
+        search.failed.connect(partial(self.fileSearchFailed, search))
+        self.fileSearch = search
+        search.start()
+        self.searchResults.clear(title)
+        self.searchResults.show()
+        self.taskCancelBtn.setText(txt2)
+        self.updateTaskWidgets()
+        self.ui.statusbar.showMessage(txt1)
+        return True
+
+    def fileSearchFound(self, search: FileSearch, path: str, hits: list) -> None:
+        """List the hits of one file unless its search was replaced."""
+        if search is self.fileSearch:
+            self.searchResults.addResults(path, path, hits)
+
+    def fileSearchFinished(self, search: FileSearch, searched: int, hits: int) -> None:
+        """Report the totals of a finished Find in Files."""
+        if self.language == "English":
+            msg = f"{hits} hit(s) in {searched} file(s)"
+        else:
+            msg = f"Найдено: {hits} в {searched} файл(ах)"
+
+        if search is self.fileSearch:
+            self.fileSearch = None
+            self.updateTaskWidgets()
+            self.ui.statusbar.showMessage(msg)
+
+    def fileSearchFailed(self, search: FileSearch, msg: str) -> None:
+        """Hide the task widgets and show why Find in Files stopped."""
+        if search is self.fileSearch:
+            self.fileSearch = None
+            self.updateTaskWidgets()
+            self.ui.statusbar.clearMessage()
+            QMessageBox.warning(self, "Notepad", msg)
+
+    def findInTabs(self, find_text: str, case: bool, whole_word: bool) -> None:
+        """Search every open tab, without switching tabs, and list the hits
+        in the results dock."""
+        if self.language == "English":
+            title = f'Find in Open Documents: "{find_text}"'
+            txt1 = "Searching..."
+            txt2 = "Cancel"
+        else:
+            title = f'Найти в открытых документах: "{find_text}"'
+            txt1 = "Поиск..."
+            txt2 = "Отмена"
+
+        if not find_text:
             return
-        cursor, text = self._get_selected_or_all_text()
-        cursor.insertText(text.upper())
+        if self.tabSearch:
+            self.tabSearch.cancel()
+
+        docs = [self.tab.widget(idx) for idx in range(self.tab.count())]
+        search = TabSearch(
+            self, docs, find_text, case, whole_word, self.detectSampleSize
+        )
+        search.found.connect(partial(self.tabSearchFound, search))
+        search.finished.connect(partial(self.tabSearchFinished, search))
+        self.tabSearch = search
+        search.start()
+        self.searchResults.clear(title)
+        self.searchResults.show()
+        self.taskCancelBtn.setText(txt2)
+        self.updateTaskWidgets()
+        self.ui.statusbar.showMessage(txt1)
+
+    def tabSearchFound(self, search: "TabSearch", doc, hits: list) -> None:
+        """List the hits of one tab unless its search was replaced."""
+        idx = self.tab.indexOf(doc)
+        if search is self.tabSearch and idx != -1:
+            self.searchResults.addResults(doc, self.tab.tabText(idx), hits)
+
+    def tabSearchFinished(self, search: "TabSearch", hits: int, docs: int) -> None:
+        """Report the totals of a finished search of the open tabs."""
+        if self.language == "English":
+            msg = f"{hits} hit(s) in {docs} document(s)"
+        else:
+            msg = f"Найдено: {hits} в {docs} документ(ах)"
+
+        if search is self.tabSearch:
+            self.tabSearch = None
+            self.updateTaskWidgets()
+            self.ui.statusbar.showMessage(msg)
+
+    def openSearchResult(self, target, line: int) -> None:
+        """Show a search result at the 1-based ``line``.
+
+        ``target`` is an open tab's widget or the path of a file, which is
+        opened if needed.
+        """
+        if not isinstance(target, str):
+            idx = self.tab.indexOf(target)
+            if idx == -1:
+                return  # The tab was closed
+        else:
+            idx = self.fileIsNotOpen(target)
+        if idx == -1:
+            if not self.openFile(target):
+                return
+            idx = self.fileIsNotOpen(target)
+        self.tab.setCurrentIndex(idx)
+        doc = self.tab.widget(idx)
+        if doc.loader:
+            doc.loader.finished.connect(lambda: doc.goto_line(line - 1))
+        else:
+            doc.goto_line(line - 1)
+        doc.setFocus()
+
+    def uppercase(self) -> None:
+        """Convert selected or all text to uppercase."""
+        self._run_text_task(str.upper)
 
     def lowercase(self) -> None:
         """Convert selected or all text to lowercase."""
-        doc = self.tab.currentWidget()
-        if not doc.toPlainText():
-            return
-        cursor, text = self._get_selected_or_all_text()
-        cursor.insertText(text.lower())
+        self._run_text_task(str.lower)
 
     def propercase(self) -> None:
         """Convert selected or all text to title case."""
-        doc = self.tab.currentWidget()
-        if not doc.toPlainText():
-            return
-        cursor, text = self._get_selected_or_all_text()
-        cursor.insertText(text.title())
+        self._run_text_task(str.title)
+
+    def _transform_lines(self, transform) -> None:
+        """Apply a line transform to the selection or document in one edit."""
+        self._run_text_task(partial(transform_lines, transform=transform))
 
     def trim_trailing_space(self) -> None:
         """Strip trailing spaces from the selection or the whole document."""
-        doc = self.tab.currentWidget()
-        if not doc.toPlainText():
-            return
-        cursor, text = self._get_selected_or_all_text()
-        lines = text.splitlines(True)
-        for line in lines:
-            cursor.insertText(line.rstrip() + "\u2029")
-        cursor.deletePreviousChar()
+        self._transform_lines(textops.trim_trailing_space)
 
     def trim_leading_space(self) -> None:
         """Strip leading spaces from the selection or the whole document."""
-        doc = self.tab.currentWidget()
-        if not doc.toPlainText():
-            return
-        cursor, text = self._get_selected_or_all_text()
-        lines = text.splitlines(True)
-        for line in lines:
-            if line.lstrip() == "":
-                cursor.insertText("\u2029")
-            else:
-                cursor.insertText(line.lstrip())
+        self._transform_lines(textops.trim_leading_space)
 
     def tab_to_space(self) -> None:
         """Replace tabs with spaces in the selection or document."""
-        doc = self.tab.currentWidget()
-        if not doc.toPlainText():
-            return
-        cursor, text = self._get_selected_or_all_text()
-        spaces = " " * TAB_STOP_SPACES
-        lines = text.splitlines(True)
-        for line in lines:
-            cursor.insertText(line.replace("\t", spaces))
+        self._transform_lines(textops.tab_to_space)
 
     def remove_space(self) -> None:
         """Remove spaces from the selection or entire document."""
-        doc = self.tab.currentWidget()
-        if not doc.toPlainText():
-            return
-        cursor, text = self._get_selected_or_all_text()
-        lines = text.splitlines(True)
-        for line in lines:
-            cursor.insertText(line.replace(" ", ""))
+        self._transform_lines(textops.remove_space)
 
     def join_lines(self) -> None:
         """Join selected lines by removing paragraph separators."""
-        doc = self.tab.currentWidget()
-        if not doc.toPlainText():
-            return
-        cursor, text = self._get_selected_or_all_text()
-        cursor.insertText(text.replace("\u2029", ""))
+        self._run_text_task(textops.join_lines)
 
     def remove_empty_lines(self) -> None:
         """Remove empty lines in the current selection or document."""
-        doc = self.tab.currentWidget()
-        if not doc.toPlainText():
-            return
-        cursor, text = self._get_selected_or_all_text()
-        lines = text.splitlines(True)
-        for line in lines:
-            if line.strip():  # Only keep non-empty lines
-                cursor.insertText(line)
+        self._transform_lines(textops.remove_empty_lines)
 
     def remove_duplicate_lines(self) -> None:
         """Remove duplicate lines while preserving order."""
-        doc = self.tab.currentWidget()
-        if not doc.toPlainText():
-            return
-        cursor, text = self._get_selected_or_all_text()
-        lines = text.splitlines(True)
-        seen = set()
-        unique_lines = []
-        for line in lines:
-            if line not in seen:
-                seen.add(line)
-                unique_lines.append(line)
-        for line in unique_lines:
-            cursor.insertText(line)
+        self._run_text_task(textops.dedupe_lines)
+
+    def dedupe_lines(self, **options) -> None:
+        """Remove duplicate lines with the options of textops.dedupe_lines."""
+        self._run_text_task(partial(textops.dedupe_lines, **options))
 
     def sort_lines_ascending_order(self) -> None:
         """Sort selected lines in ascending order."""
-        doc = self.tab.currentWidget()
-        if not doc.toPlainText():
-            return
-        cursor, text = self._get_selected_or_all_text()
-        lines = text.splitlines(True)
-        if lines:
-            lines[-1] = lines[-1] + "\u2029"
-            lines.sort()
-            for line in lines:
-                cursor.insertText(line)
-            cursor.deletePreviousChar()
+        self._run_text_task(
+            partial(textops.sort_text, reverse=False),
+            partial(textops.sort_file, reverse=False),
+        )
 
     def sort_lines_descending_order(self) -> None:
         """Sort selected lines in descending order."""
-        doc = self.tab.currentWidget()
-        if not doc.toPlainText():
-            return
-        cursor, text = self._get_selected_or_all_text()
-        lines = text.splitlines(True)
-        if lines:
-            lines[-1] = lines[-1] + "\u2029"
-            lines.sort(reverse=True)
-            for line in lines:
-                cursor.insertText(line)
-            cursor.deletePreviousChar()
+        self._run_text_task(
+            partial(textops.sort_text, reverse=True),
+            partial(textops.sort_file, reverse=True),
+        )
+
+    def sort_lines_by(self, keys, delimiter: str, regex: str, unique: bool) -> None:
+        """Sort selected lines by columns or regex groups, see textops."""
+        self._run_text_task(
+            partial(
+                textops.sort_lines_by,
+                keys=keys,
+                delimiter=delimiter,
+                regex=regex,
+                unique=unique,
+            )
+        )
 
     def windows_crlf(self) -> None:
         """Switch line endings to Windows style."""
         doc = self.tab.currentWidget()
-        if doc.lineEnding == LineEnding.UNIX_LF:
+        if doc.lineEnding == LineEnding.UNIX_LF or doc.mixedEol:
             doc.lineEnding = LineEnding.WINDOWS_CRLF
+            doc.mixedEol = False
             self.ui.actionWindowsCRLF.setEnabled(False)
             self.ui.actionUnixLF.setEnabled(True)
             if doc.toPlainText():
@@ -1486,8 +3267,9 @@ class MainWindow(QMainWindow):
     def unix_lf(self) -> None:
         """Switch line endings to Unix style."""
         doc = self.tab.currentWidget()
-        if doc.lineEnding == LineEnding.WINDOWS_CRLF:
+        if doc.lineEnding == LineEnding.WINDOWS_CRLF or doc.mixedEol:
             doc.lineEnding = LineEnding.UNIX_LF
+            doc.mixedEol = False
             self.ui.actionWindowsCRLF.setEnabled(True)
             self.ui.actionUnixLF.setEnabled(False)
             if doc.toPlainText():
@@ -1497,7 +3279,10 @@ class MainWindow(QMainWindow):
     def update_eol(self) -> None:
         """Refresh the line-ending UI state for the current tab."""
         doc = self.tab.currentWidget()
-        if doc.lineEnding == LineEnding.WINDOWS_CRLF:
+        if doc.mixedEol:
+            self.ui.actionWindowsCRLF.setEnabled(True)
+            self.ui.actionUnixLF.setEnabled(True)
+        elif doc.lineEnding == LineEnding.WINDOWS_CRLF:
             self.ui.actionWindowsCRLF.setEnabled(False)
             self.ui.actionUnixLF.setEnabled(True)
         else:
@@ -1550,6 +3335,8 @@ class MainWindow(QMainWindow):
     def wrap_text(self):
         """Toggle line wrapping on all tabs."""
         for idx in range(self.tab.count()):
+            if not isinstance(self.tab.widget(idx), Editor):
+                continue
             if self.ui.actionWrapText.isChecked():
                 self.tab.widget(idx).setLineWrapMode(Editor.WidgetWidth)
             else:
@@ -1572,17 +3359,20 @@ class MainWindow(QMainWindow):
     def summary_doc(self):  # pylint: disable=too-many-locals,too-many-statements
         """Show statistics about the current document."""
         doc = self.tab.currentWidget()
-        text_doc = doc.toPlainText()
-        text_select = doc.textCursor().selectedText()
-        selection_ranges = 1 if text_select else 0
+        crlf = doc.lineEnding == LineEnding.WINDOWS_CRLF
+        chars, words, size = doc.metrics.selection(
+            doc.textCursor(), doc.encodingType, crlf
+        )
+        selection_ranges = 1 if doc.textCursor().hasSelection() else 0
 
         if self.language == "English":
             txt1 = "Characters(without line endings): "
             txt2 = "Words: "
             txt3 = "Lines: "
             txt4 = "Document length: "
-            txt5 = " selected characters"
-            bytes_select = f" ({len(text_select.encode('utf_8'))} bytes) in {selection_ranges} ranges"
+            file_size = f"Size: {doc.metrics.size(doc.encodingType, crlf)} bytes"
+            txt5 = f" selected characters, {words} words"
+            bytes_select = f" ({size} bytes) in {selection_ranges} ranges"
             txt6 = "Full file path: "
             txt7 = "Created: "
             txt8 = "Modified: "
@@ -1592,27 +3382,19 @@ class MainWindow(QMainWindow):
             txt2 = "Слов: "
             txt3 = "Строк: "
             txt4 = "Длина: "
-            txt5 = " выделенных символов"
-            bytes_select = (
-                f" ({len(text_select.encode('utf_8'))} байт) в {selection_ranges} диапазоне(ах)"
-            )
+            file_size = f"Размер: {doc.metrics.size(doc.encodingType, crlf)} байт"
+            txt5 = f" выделенных символов, {words} слов"
+            bytes_select = f" ({size} байт) в {selection_ranges} диапазоне(ах)"
             txt6 = "Полный путь к файлу: "
             txt7 = "Создан: "
             txt8 = "Изменен: "
             txt9 = "Информация о файле"
 
-        char_count = txt1 + str(len(text_doc.replace("\n", "")))
-        word_count = txt2 + str(len(text_doc.split()))
+        char_count = txt1 + str(doc.metrics.chars - doc.metrics.newlines)
+        word_count = txt2 + str(doc.metrics.words)
         lines = txt3 + str(doc.document().lineCount())
-
-        if doc.lineEnding == LineEnding.WINDOWS_CRLF:
-            length = txt4 + str(len(text_doc.replace("\n", LINE_ENDING_STRINGS[LineEnding.WINDOWS_CRLF])))
-            text_select = text_select.replace("\u2029", LINE_ENDING_STRINGS[LineEnding.WINDOWS_CRLF])
-            char_select = str(len(text_select.replace(LINE_ENDING_STRINGS[LineEnding.WINDOWS_CRLF], ""))) + txt5
-        else:
-            length = txt4 + str(doc.document().characterCount() - 1)
-            text_select = text_select.replace("\u2029", LINE_ENDING_STRINGS[LineEnding.UNIX_LF])
-            char_select = str(len(text_select.replace(LINE_ENDING_STRINGS[LineEnding.UNIX_LF], ""))) + txt5
+        length = txt4 + str(doc.metrics.length(crlf))
+        char_select = str(chars) + txt5
 
         info = QFileInfo(doc.curName)
         if info.exists():
@@ -1634,6 +3416,8 @@ class MainWindow(QMainWindow):
                 + "\n"
                 + length
                 + "\n"
+                + file_size
+                + "\n"
                 + char_select
                 + bytes_select
             )
@@ -1647,6 +3431,8 @@ class MainWindow(QMainWindow):
                 + "\n"
                 + length
                 + "\n"
+                + file_size
+                + "\n"
                 + char_select
                 + bytes_select
             )
@@ -1670,7 +3456,7 @@ class MainWindow(QMainWindow):
     def update_tab_distance(self) -> None:
         """Update tab stop distance according to the current font."""
         current_widget = self.tab.currentWidget()
-        if current_widget:
+        if isinstance(current_widget, Editor):
             current_widget.setTabStopDistance(
                 QFontMetricsF(current_widget.font()).horizontalAdvance(" ") * TAB_STOP_SPACES
             )
@@ -1705,12 +3491,14 @@ class MainWindow(QMainWindow):
             EncodingType.WINDOWS_1251: self.ui.actionWindows1251,
             EncodingType.OEM_866: self.ui.actionOEM866,
         }
-        # Uncheck all first
+        # Sync check marks without triggering change_encoding
         for action in encoding_map.values():
+            action.blockSignals(True)
             action.setChecked(False)
-        # Check the current encoding
         if doc.encodingType in encoding_map:
             encoding_map[doc.encodingType].setChecked(True)
+        for action in encoding_map.values():
+            action.blockSignals(False)
 
     def about(self):
         QMessageBox.about(
@@ -1723,7 +3511,7 @@ class MainWindow(QMainWindow):
         """Refresh the status bar with the current document metadata."""
         doc = self.tab.currentWidget()
         cursor = doc.textCursor()
-        text = doc.toPlainText()
+        viewer = isinstance(doc, HugeFileViewer)
 
         # Update encoding label
         encoding_name = ENCODING_NAMES.get(doc.encodingType, "UTF-8")
@@ -1735,18 +3523,33 @@ class MainWindow(QMainWindow):
         else:
             self.textFormatLabel.setText("")
 
-        # Update line ending and length
-        if doc.lineEnding == LineEnding.WINDOWS_CRLF:
-            self.symbNewLineLabel.setText("Windows (CR LF)")
-            length = f"Length: {len(text.replace(chr(10), LINE_ENDING_STRINGS[LineEnding.WINDOWS_CRLF]))}"
+        if self.language == "English":
+            txt1 = "Read Only"
+            txt2 = "Size"
+            txt3 = "Mixed"
         else:
-            self.symbNewLineLabel.setText("Unix (LF)")
-            length = f"Length: {doc.document().characterCount() - 1}"
+            txt1 = "Только чтение"
+            txt2 = "Размер"
+            txt3 = "смешанные"
 
-        self.chrCountLabel.setText(length)
-        self.cursorPosLabel.setText(
-            f"Ln: {1 + cursor.blockNumber()} Col: {1 + cursor.positionInBlock()}"
-        )
+        # Update line ending and length
+        crlf = doc.lineEnding == LineEnding.WINDOWS_CRLF
+        self.symbNewLineLabel.setText("Windows (CR LF)" if crlf else "Unix (LF)")
+        if doc.mixedEol:
+            self.symbNewLineLabel.setText(f"{self.symbNewLineLabel.text()}, {txt3}")
+
+        if viewer:
+            self.textFormatLabel.setText(txt1)
+            self.chrCountLabel.setText(f"{txt2}: {doc.fileSize}")
+            self.cursorPosLabel.setText(f"Ln: {1 + doc.firstVisibleLine()} Col: 1")
+        else:
+            self.chrCountLabel.setText(
+                f"Length: {doc.metrics.length(crlf)} "
+                f"{txt2}: {doc.metrics.size(doc.encodingType, crlf)}"
+            )
+            self.cursorPosLabel.setText(
+                f"Ln: {1 + cursor.blockNumber()} Col: {1 + cursor.positionInBlock()}"
+            )
         self.zoomLabel.setText(
             f"Zoom: {int(100 * (self.sizeTxt + self.zoomGlob) / self.sizeTxt)}%"
         )
@@ -1770,10 +3573,43 @@ class MainWindow(QMainWindow):
             self.update_status_bar()
             self.update_encoding_menu()
             self.update_eol()
+        self.update_edit_actions()
+
+    def update_edit_actions(self) -> None:
+        """Disable editing actions while a read-only viewer tab is active."""
+        editable = not isinstance(self.tab.currentWidget(), HugeFileViewer)
+        actions = [
+            self.ui.actionSave,
+            self.ui.actionSaveAs,
+            self.ui.actionPrint,
+            self.ui.actionPrintPreview,
+            self.ui.actionUndo,
+            self.ui.actionRedo,
+            self.ui.actionCut,
+            self.ui.actionCopy,
+            self.ui.actionPaste,
+            self.ui.actionSelectAll,
+            self.ui.actionFindReplace,
+            self.ui.actionDateTime,
+            self.ui.actionSummary,
+            self.ui.menuConvertCase.menuAction(),
+            self.ui.menuBlankOperations.menuAction(),
+            self.ui.menuLineOperations.menuAction(),
+            self.ui.menuEOLConversion.menuAction(),
+            self.ui.menuEncoding.menuAction(),
+        ]
+        for action in actions:
+            action.setEnabled(editable)
 
 
 if __name__ == "__main__":
+    # Worker processes run only Qt-free modules (textops, filesearch,
+    # regexsearch). Without a file or spec for __main__, spawn does not
+    # run this module, and import Qt, in each of them.
+    __spec__ = None
+    del __file__
     app = QApplication(sys.argv)
+    textops.init_collation()
     window = MainWindow()
     window.show()
     sys.exit(app.exec())
@@ -0,0 +1,174 @@
+"""Regular expression search and replace in a worker process.
+
+Python's ``re`` cannot be interrupted and holds the GIL while it matches,
+so a pattern with catastrophic backtracking would freeze the window.
+Searches therefore run in a single worker process that the main window
+kills when a search runs over its time budget or is cancelled. The process
+keeps the text of the last document it was sent, so stepping through
+matches sends the text only once per edit.
+
+Positions passed in and returned are Qt document positions (UTF-16 units).
+"""
+
+import multiprocessing
+import re
+from typing import Optional, Tuple
+
+from textops import find_pattern, qt_position, replace_all, str_index
+
+_snapshot = (0, "")
+
+
+def _text(serial: int, text: Optional[str]) -> str:
+    global _snapshot  # pylint: disable=global-statement
+    if text is not None:
+        _snapshot = (serial, text)
+    elif _snapshot[0] != serial:
+        raise RuntimeError("The search process lost the document text")
+    return _snapshot[1]
+
+
+def find(
+    serial: int,
+    text: Optional[str],
+    find_text: str,
+    case: bool,
+    whole_word: bool,
+    start: int,
+    wrap_around: bool,
+    backward: bool = False,
+) -> Optional[Tuple[int, int]]:
+    """Return the span of the first match at or after ``start``.
+
+    An empty match at ``start`` itself is skipped so that repeated Find
+    moves on. With ``backward`` the last match starting before ``start``
+    is returned instead. With ``wrap_around`` the search continues from
+    the other end.
+    """
+    text = _text(serial, text)
+    pattern = find_pattern(find_text, case, whole_word, True)
+    pos = str_index(text, start)
+    if backward:
+        match = _last_match(pattern, text, pos)
+        if not match and wrap_around:
+            match = _last_match(pattern, text, len(text) + 1)
+    else:
+        match = pattern.search(text, pos)
+        if match and match.end() == pos:
+            match = pattern.search(text, pos + 1) if pos < len(text) else None
+        if not match and wrap_around:
+            match = pattern.search(text)
+    if not match:
+        return None
+    return qt_position(text, match.start()), qt_position(text, match.end())
+
+
+def _last_match(pattern: re.Pattern, text: str, pos: int) -> Optional[re.Match]:
+    last = None
+    for match in pattern.finditer(text):
+        if match.start() >= pos:
+            break
+        last = match
+    return last
+
+
+def expand(
+    serial: int,
+    text: Optional[str],
+    find_text: str,
+    case: bool,
+    whole_word: bool,
+    start: int,
+    end: int,
+    replace_text: str,
+) -> Optional[str]:
+    """Return the replacement for a match spanning exactly ``start:end``.
+
+    ``replace_text`` may refer to groups as in ``re.sub``; None is returned
+    if the span is not a match.
+    """
+    text = _text(serial, text)
+    pattern = find_pattern(find_text, case, whole_word, True)
+    match = pattern.match(text, str_index(text, start))
+    if not match or match.end() != str_index(text, end):
+        return None
+    return match.expand(replace_text)
+
+
+def replace(
+    serial: int,
+    text: Optional[str],
+    find_text: str,
+    case: bool,
+    whole_word: bool,
+    replace_text: str,
+) -> Tuple[str, int, int, int]:
+    """Replace all matches like ``textops.replace_all`` in regex mode."""
+    text = _text(serial, text)
+    replaced, count, start, end = replace_all(
+        text, find_text, replace_text, case, whole_word, True
+    )
+    return replaced, count, qt_position(text, start), qt_position(text, end)
+
+
+def count(
+    serial: int,
+    text: Optional[str],
+    find_text: str,
+    case: bool,
+    whole_word: bool,
+    start: int,
+    end: int,
+) -> Tuple[int, int]:
+    """Return ``(current, total)`` for the Find dialog's match count.
+
+    ``total`` is the number of matches and ``current`` the 1-based number
+    of the match spanning exactly ``start:end``, or 0.
+    """
+    text = _text(serial, text)
+    pattern = find_pattern(find_text, case, whole_word, True)
+    span = (str_index(text, start), str_index(text, end))
+    current = total = 0
+    for total, match in enumerate(pattern.finditer(text), 1):
+        if match.span() == span:
+            current = total
+    return current, total
+
+
+class RegexPool:
+    """The worker process for regex searches, started on first use.
+
+    ``submit`` sends the document text only if the process does not hold
+    that version already; ``terminate`` kills the process, and the next
+    submit starts a new one.
+    """
+
+    def __init__(self):
+        self._pool = None
+        self._source = None
+        self._version = -1
+        self._serial = 0
+
+    def submit(self, fn, source, version: int, get_text, *args):
+        """Run ``fn(serial, text, *args)`` and return its ``AsyncResult``.
+
+        ``get_text`` is called for the text of ``source`` when the process
+        does not hold ``version`` of it.
+        """
+        if self._pool is None:
+            self._pool = multiprocessing.get_context("spawn").Pool(1)
+            self._source = None
+        text = None
+        if source is not self._source or version != self._version:
+            text = get_text()
+            self._serial += 1
+            self._source = source
+            self._version = version
+        return self._pool.apply_async(fn, (self._serial, text) + args)
+
+    def terminate(self) -> None:
+        """Kill the worker process, dropping any running search."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+            self._source = None
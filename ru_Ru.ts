@@ -48,6 +48,16 @@
         <source>Ctrl+Shift+S</source>
         <translation></translation>
     </message>
+    <message>
+        <location filename="ui/main_form.py" line="386"/>
+        <source>Save A&amp;ll</source>
+        <translation>Сохранить &amp;все</translation>
+    </message>
+    <message>
+        <location filename="ui/main_form.py" line="388"/>
+        <source>Ctrl+Alt+S</source>
+        <translation></translation>
+    </message>
     <message>
         <location filename="ui/main_form.py" line="374"/>
         <source>&amp;Close</source>
@@ -168,6 +178,16 @@
         <source>Ctrl+F</source>
         <translation></translation>
     </message>
+    <message>
+        <location filename="ui/main_form.py" line="436"/>
+        <source>Find in Files...</source>
+        <translation>Найти в файлах...</translation>
+    </message>
+    <message>
+        <location filename="ui/main_form.py" line="438"/>
+        <source>Ctrl+Shift+F</source>
+        <translation></translation>
+    </message>
     <message>
         <location filename="ui/main_form.py" line="420"/>
         <source>Go to</source>
@@ -288,6 +308,16 @@
         <source>Sort Lines Descending Order</source>
         <translation>Сортировать по убыванию</translation>
     </message>
+    <message>
+        <location filename="ui/main_form.py" line="463"/>
+        <source>Sort Lines...</source>
+        <translation>Сортировать строки...</translation>
+    </message>
+    <message>
+        <location filename="ui/main_form.py" line="462"/>
+        <source>Remove Duplicate Lines...</source>
+        <translation>Удалить повторяющиеся строки...</translation>
+    </message>
     <message>
         <location filename="ui/main_form.py" line="456"/>
         <source>Trim Trailing Space</source>
@@ -684,11 +714,21 @@
         <source>Wrap Around</source>
         <translation>Зациклить поиск</translation>
     </message>
+    <message>
+        <location filename="ui/find_replace.py" line="113"/>
+        <source>Regular E&amp;xpression</source>
+        <translation>Регулярное &amp;выражение</translation>
+    </message>
     <message>
         <location filename="ui/find_replace.py" line="113"/>
         <source>&amp;Find</source>
         <translation>&amp;Найти</translation>
     </message>
+    <message>
+        <location filename="ui/find_replace.py" line="114"/>
+        <source>Find &amp;Previous</source>
+        <translation>Найти &amp;предыдущее</translation>
+    </message>
     <message>
         <location filename="ui/find_replace.py" line="114"/>
         <source>&amp;Replace</source>
@@ -699,6 +739,11 @@
         <source>Replace All</source>
         <translation>Заменить все</translation>
     </message>
+    <message>
+        <location filename="ui/find_replace.py" line="123"/>
+        <source>Find All in Open &amp;Documents</source>
+        <translation>Найти все в открытых &amp;документах</translation>
+    </message>
     <message>
         <location filename="ui/find_replace.py" line="116"/>
         <source>&amp;Cancel</source>
@@ -708,14 +753,208 @@
 <context>
     <name>Goto</name>
     <message>
-        <location filename="ui/go_to.py" line="43"/>
+        <location filename="ui/go_to.py" line="46"/>
         <source>Go to</source>
         <translation>Перейти</translation>
     </message>
     <message>
-        <location filename="ui/go_to.py" line="44"/>
-        <source>Go to Line:</source>
-        <translation>Перейти к:</translation>
+        <location filename="ui/go_to.py" line="48"/>
+        <source>Line</source>
+        <translation>Строка</translation>
+    </message>
+    <message>
+        <location filename="ui/go_to.py" line="49"/>
+        <source>Byte offset</source>
+        <translation>Смещение в байтах</translation>
+    </message>
+</context>
+<context>
+    <name>SortLines</name>
+    <message>
+        <location filename="ui/sort_lines.py" line="147"/>
+        <source>Sort Lines</source>
+        <translation>Сортировка строк</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="148"/>
+        <source>Delimiter:</source>
+        <translation>Разделитель:</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="149"/>
+        <source>Whitespace</source>
+        <translation>Пробелы</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="150"/>
+        <source>Regex:</source>
+        <translation>Рег. выражение:</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="151"/>
+        <source>Capture groups are columns</source>
+        <translation>Группы захвата - столбцы</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="152"/>
+        <source>Sort by column:</source>
+        <translation>Сортировать по столбцу:</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="153"/>
+        <source>Whole line</source>
+        <translation>Вся строка</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="154"/>
+        <source>Text</source>
+        <translation>Текст</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="155"/>
+        <source>Ignore Case</source>
+        <translation>Без учета регистра</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="156"/>
+        <source>Natural</source>
+        <translation>Естественная</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="157"/>
+        <source>Numeric</source>
+        <translation>Числовая</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="159"/>
+        <source>Descending</source>
+        <translation>По убыванию</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="160"/>
+        <source>Then by column:</source>
+        <translation>Затем по столбцу:</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="168"/>
+        <source>Remove lines with equal keys</source>
+        <translation>Удалить строки с равными ключами</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="169"/>
+        <source>&amp;Sort</source>
+        <translation>&amp;Сортировать</translation>
+    </message>
+    <message>
+        <location filename="ui/sort_lines.py" line="170"/>
+        <source>&amp;Cancel</source>
+        <translation>&amp;Отмена</translation>
+    </message>
+</context>
+<context>
+    <name>RemoveDuplicates</name>
+    <message>
+        <location filename="ui/remove_duplicates.py" line="75"/>
+        <source>Remove Duplicate Lines</source>
+        <translation>Удаление повторяющихся строк</translation>
+    </message>
+    <message>
+        <location filename="ui/remove_duplicates.py" line="76"/>
+        <source>Keep Last Occurrence</source>
+        <translation>Оставлять последнее вхождение</translation>
+    </message>
+    <message>
+        <location filename="ui/remove_duplicates.py" line="77"/>
+        <source>Ignore Case</source>
+        <translation>Без учета регистра</translation>
+    </message>
+    <message>
+        <location filename="ui/remove_duplicates.py" line="78"/>
+        <source>Ignore Whitespace</source>
+        <translation>Без учета пробелов</translation>
+    </message>
+    <message>
+        <location filename="ui/remove_duplicates.py" line="79"/>
+        <source>Count Occurrences</source>
+        <translation>Подсчитать вхождения</translation>
+    </message>
+    <message>
+        <location filename="ui/remove_duplicates.py" line="80"/>
+        <source>Compare Lines on Hash Match</source>
+        <translation>Сравнивать строки при совпадении хеша</translation>
+    </message>
+    <message>
+        <location filename="ui/remove_duplicates.py" line="81"/>
+        <source>&amp;Remove</source>
+        <translation>&amp;Удалить</translation>
+    </message>
+    <message>
+        <location filename="ui/remove_duplicates.py" line="82"/>
+        <source>&amp;Cancel</source>
+        <translation>&amp;Отмена</translation>
+    </message>
+</context>
+<context>
+    <name>FindInFiles</name>
+    <message>
+        <location filename="ui/find_in_files.py" line="118"/>
+        <source>Find in Files</source>
+        <translation>Найти в файлах</translation>
+    </message>
+    <message>
+        <location filename="ui/find_in_files.py" line="119"/>
+        <source>Find:</source>
+        <translation>Найти:</translation>
+    </message>
+    <message>
+        <location filename="ui/find_in_files.py" line="120"/>
+        <source>Directory:</source>
+        <translation>Папка:</translation>
+    </message>
+    <message>
+        <location filename="ui/find_in_files.py" line="121"/>
+        <source>...</source>
+        <translation>...</translation>
+    </message>
+    <message>
+        <location filename="ui/find_in_files.py" line="122"/>
+        <source>Include:</source>
+        <translation>Включить:</translation>
+    </message>
+    <message>
+        <location filename="ui/find_in_files.py" line="123"/>
+        <source>*.txt; *.log</source>
+        <translation>*.txt; *.log</translation>
+    </message>
+    <message>
+        <location filename="ui/find_in_files.py" line="124"/>
+        <source>Exclude:</source>
+        <translation>Исключить:</translation>
+    </message>
+    <message>
+        <location filename="ui/find_in_files.py" line="125"/>
+        <source>.git; *.bak</source>
+        <translation>.git; *.bak</translation>
+    </message>
+    <message>
+        <location filename="ui/find_in_files.py" line="126"/>
+        <source>Match Case</source>
+        <translation>Учитывать регистр</translation>
+    </message>
+    <message>
+        <location filename="ui/find_in_files.py" line="127"/>
+        <source>Match Whole Word</source>
+        <translation>Только целые слова</translation>
+    </message>
+    <message>
+        <location filename="ui/find_in_files.py" line="128"/>
+        <source>Find &amp;All</source>
+        <translation>Найти &amp;все</translation>
+    </message>
+    <message>
+        <location filename="ui/find_in_files.py" line="129"/>
+        <source>&amp;Cancel</source>
+        <translation>&amp;Отмена</translation>
     </message>
 </context>
 </TS>
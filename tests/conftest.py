@@ -0,0 +1,17 @@
+"""Shared fixtures; the modules under test live in the repository root."""
+
+import os
+import sys
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """The application object that QTextDocument layouts need."""
+    from PySide6.QtWidgets import QApplication
+
+    return QApplication.instance() or QApplication([])
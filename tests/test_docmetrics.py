@@ -0,0 +1,171 @@
+"""Tests for the incremental document metrics and match index."""
+
+import random
+
+import pytest
+
+from constants import ENCODING_PYTHON_NAMES, EncodingType
+from docmetrics import BOM_SIZES, DocumentMetrics, LineIndex, MatchIndex
+from textops import find_pattern, match_spans
+
+TEXTS = ["", "abc", "a\nb\n", "жук\nÿ\n\U0001f600 x\n\nend"]
+
+
+@pytest.fixture
+def document(qapp):
+    """A document laid out as in a QPlainTextEdit.
+
+    Without a layout, QTextDocument does not emit ``contentsChange``.
+    """
+    from PySide6.QtGui import QTextDocument
+    from PySide6.QtWidgets import QPlainTextDocumentLayout
+
+    document = QTextDocument()
+    document.setDocumentLayout(QPlainTextDocumentLayout(document))
+    return document
+
+
+def codec(encoding):
+    # BOMs are counted separately
+    if encoding == EncodingType.UTF8_BOM:
+        return "utf_8"
+    return ENCODING_PYTHON_NAMES[encoding]
+
+
+def saved_size(document, encoding, crlf):
+    text = document.toPlainText().replace("\n", "\r\n" if crlf else "\n")
+    return BOM_SIZES.get(encoding, 0) + len(text.encode(codec(encoding), "replace"))
+
+
+def cursor_at(document, start, end=None):
+    from PySide6.QtGui import QTextCursor
+
+    cursor = QTextCursor(document)
+    cursor.setPosition(start)
+    if end is not None:
+        cursor.setPosition(end, QTextCursor.KeepAnchor)
+    return cursor
+
+
+# Document sizes
+
+
+@pytest.mark.parametrize("text", TEXTS)
+@pytest.mark.parametrize("encoding", list(EncodingType))
+@pytest.mark.parametrize("crlf", [False, True])
+def test_size_matches_the_saved_file(document, text, encoding, crlf):
+    document.setPlainText(text)
+    metrics = DocumentMetrics(document)
+    assert metrics.size(encoding, crlf) == saved_size(document, encoding, crlf)
+
+
+def test_counts_follow_edits(document):
+    document.setPlainText("one two\nthree")
+    metrics = DocumentMetrics(document)
+    rng = random.Random(3)
+    for _ in range(200):
+        size = document.characterCount() - 1
+        start = rng.randrange(size + 1)
+        cursor = cursor_at(document, start, min(size, start + rng.randrange(4)))
+        cursor.insertText(rng.choice(["", "x", " y", "\n", "ж\U0001f600", "a\nb c"]))
+        text = document.toPlainText()
+        assert metrics.chars == len(text.encode("utf_16_le")) // 2
+        assert metrics.newlines == text.count("\n")
+        assert metrics.words == len(text.split())
+        assert metrics.size(EncodingType.UTF8, True) == saved_size(
+            document, EncodingType.UTF8, True
+        )
+
+
+def test_selection_counts(document):
+    document.setPlainText("ab cd\nжук\n\U0001f600 e")
+    metrics = DocumentMetrics(document)
+    cursor = cursor_at(document, 3, 14)
+    selected = cursor.selectedText().replace("\u2029", "\n")
+    chars, words, size = metrics.selection(cursor, EncodingType.UTF8, True)
+    assert chars == 11 - selected.count("\n")
+    assert words == len(selected.split())
+    assert size == len(selected.replace("\n", "\r\n").encode("utf_8"))
+    assert metrics.selection(cursor_at(document, 2), EncodingType.UTF8, False) == (0, 0, 0)
+
+
+@pytest.mark.parametrize("encoding", list(EncodingType))
+@pytest.mark.parametrize("crlf", [False, True])
+def test_position_at_maps_byte_offsets(document, encoding, crlf):
+    document.setPlainText("ab\nжук\n\U0001f600z\n\nend")
+    metrics = DocumentMetrics(document)
+    text = document.toPlainText()
+    newline = "\r\n" if crlf else "\n"
+    offset = BOM_SIZES.get(encoding, 0)
+    position = 0
+    for char in text:
+        width = len(char.replace("\n", newline).encode(codec(encoding), "replace"))
+        for byte in range(width):
+            # Every byte of a character, or of a CRLF, maps to its start
+            assert metrics.position_at(offset + byte, encoding, crlf) == position
+        offset += width
+        position += 2 if char > "\uffff" else 1
+    assert metrics.position_at(offset, encoding, crlf) == position
+    assert metrics.position_at(offset + 100, encoding, crlf) == position
+
+
+# Match index
+
+
+def reindex(document, query):
+    starts, ends = match_spans(document.toRawText(), find_pattern(*query))
+    return list(zip(starts, ends))
+
+
+def spans(index):
+    return [index.span(idx) for idx in range(len(index))]
+
+
+@pytest.mark.parametrize("query", [("ab", True, False), ("ab", False, True), ("aa", True, False)])
+def test_match_index_follows_edits(document, query):
+    document.setPlainText("ab xab aaa\nAb ab\n" * 5)
+    index = MatchIndex(document, query, *match_spans(document.toRawText(), find_pattern(*query)))
+    rng = random.Random(7)
+    for _ in range(300):
+        size = document.characterCount() - 1
+        start = rng.randrange(size + 1)
+        cursor = cursor_at(document, start, min(size, start + rng.randrange(3)))
+        cursor.insertText(rng.choice(["", "a", "b", "ab", " ", "\n", "\U0001f600", "x"]))
+        assert spans(index) == reindex(document, query)
+
+
+def test_match_index_lookups(document):
+    document.setPlainText("ab ab ab")
+    query = ("ab", True, False)
+    index = MatchIndex(document, query, *match_spans(document.toRawText(), find_pattern(*query)))
+    cursor_at(document, 0).insertText("xx")
+    assert spans(index) == [(2, 4), (5, 7), (8, 10)]
+    assert index.after(3) == 1
+    assert index.before(5) == 0
+    assert index.find(5, 7) == 1
+    assert index.find(5, 6) == -1
+    assert index.after(11) == -1
+
+
+def test_large_edit_invalidates_the_index(document):
+    from constants import MATCH_INDEX_MAX_EDIT
+
+    document.setPlainText("ab")
+    query = ("ab", True, False)
+    index = MatchIndex(document, query, *match_spans(document.toRawText(), find_pattern(*query)))
+    cursor_at(document, 0).insertText("x" * (MATCH_INDEX_MAX_EDIT + 1))
+    assert not index.valid
+    assert len(index) == 0
+
+
+# Line index
+
+
+def test_line_index(document):
+    document.setPlainText("ab\n\ncd\n")
+    index = LineIndex(document)
+    assert index.line_count() == 4
+    assert [index.line_start(line) for line in range(5)] == [0, 3, 4, 7, 7]
+    assert [index.line_at(pos) for pos in range(8)] == [0, 0, 0, 1, 2, 2, 2, 3]
+    assert index.line_at(-5) == 0
+    assert index.line_at(100) == 3
@@ -0,0 +1,50 @@
+"""Tests for the persistent encoding cache."""
+
+import os
+
+from constants import EncodingType, LineEnding
+from enccache import EncodingCache
+
+
+def test_entries_survive_a_save(tmp_path):
+    target = tmp_path / "file.txt"
+    target.write_text("x")
+    cache = EncodingCache(str(tmp_path / "cache.json"), 10)
+    cache.put(str(target), os.stat(target), EncodingType.WINDOWS_1251, LineEnding.UNIX_LF)
+    cache.save()
+    loaded = EncodingCache(str(tmp_path / "cache.json"), 10)
+    assert loaded.get(str(target)) == (EncodingType.WINDOWS_1251, LineEnding.UNIX_LF)
+
+
+def test_changed_file_is_a_miss(tmp_path):
+    target = tmp_path / "file.txt"
+    target.write_text("x")
+    cache = EncodingCache(str(tmp_path / "cache.json"), 10)
+    cache.put(str(target), os.stat(target), EncodingType.UTF8, LineEnding.UNIX_LF)
+    target.write_text("longer")
+    assert cache.get(str(target)) is None
+    assert cache.get(str(tmp_path / "missing.txt")) is None
+
+
+def test_least_recently_used_entries_are_dropped(tmp_path):
+    paths = []
+    for name in "abc":
+        path = tmp_path / name
+        path.write_text(name)
+        paths.append(str(path))
+    cache = EncodingCache(str(tmp_path / "cache.json"), 2)
+    for path in paths[:2]:
+        cache.put(path, os.stat(path), EncodingType.UTF8, LineEnding.UNIX_LF)
+    assert cache.get(paths[0])  # Now b is the least recently used
+    cache.put(paths[2], os.stat(paths[2]), EncodingType.UTF8, LineEnding.UNIX_LF)
+    assert cache.get(paths[0]) and cache.get(paths[2])
+    assert cache.get(paths[1]) is None
+
+
+def test_damaged_cache_file_starts_empty(tmp_path):
+    path = tmp_path / "cache.json"
+    path.write_text("{not json")
+    cache = EncodingCache(str(path), 10)
+    assert cache.get(str(path)) is None
+    cache.save()  # Nothing changed: the damaged file is left alone
+    assert path.read_text() == "{not json"
@@ -0,0 +1,162 @@
+"""Tests for chunked decoding, line-ending counting and atomic saves."""
+
+import codecs
+import io
+import os
+import stat
+
+import pytest
+
+from constants import EncodingType, LineEnding
+from fileio import EolCounter, decoding_name, iter_decoded_chunks, write_text
+
+
+def decode_chunks(data, encoding, chunk_size, head=b""):
+    stream = io.BytesIO(data[len(head):])
+    return list(iter_decoded_chunks(stream, encoding, chunk_size, head))
+
+
+# Chunked decoding
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 8))
+def test_crlf_is_never_split_across_chunks(chunk_size):
+    data = b"ab\r\ncd\r\n\r\nef\r"
+    chunks = decode_chunks(data, "utf_8", chunk_size)
+    texts = [text for text, _raw in chunks]
+    assert "".join(texts) == data.decode()
+    for text in texts[:-1]:
+        assert not text.endswith("\r")
+    assert b"".join(raw for _text, raw in chunks) == data
+
+
+def test_trailing_cr_held_back_to_the_next_chunk():
+    texts = [text for text, _raw in decode_chunks(b"ab\r\ncd", "utf_8", 3)]
+    assert texts == ["ab", "\r\ncd", ""]
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 6))
+def test_multibyte_sequences_split_across_chunks(chunk_size):
+    text = "añ€\U0001f600\r\nz"
+    chunks = decode_chunks(text.encode("utf_8"), "utf_8", chunk_size)
+    assert "".join(text for text, _raw in chunks) == text
+
+
+@pytest.mark.parametrize("encoding", [EncodingType.UTF16_LE, EncodingType.UTF16_BE])
+@pytest.mark.parametrize("chunk_size", [1, 3, 4, 7])
+def test_utf16_bom_is_consumed(encoding, chunk_size):
+    text = "x\r\ny\U0001f600\r\n"
+    bom = codecs.BOM_UTF16_LE if encoding == EncodingType.UTF16_LE else codecs.BOM_UTF16_BE
+    codec = "utf_16_le" if encoding == EncodingType.UTF16_LE else "utf_16_be"
+    data = bom + text.encode(codec)
+    chunks = decode_chunks(data, decoding_name(encoding), chunk_size)
+    texts = [text for text, _raw in chunks]
+    assert "".join(texts) == text
+    assert not any(chunk.endswith("\r") for chunk in texts[:-1])
+
+
+def test_utf8_bom_is_consumed_from_the_head():
+    data = codecs.BOM_UTF8 + "é\r\n".encode("utf_8")
+    chunks = decode_chunks(data, "utf_8_sig", 2, head=memoryview(data)[:4])
+    assert "".join(text for text, _raw in chunks) == "é\r\n"
+
+
+def test_empty_stream_yields_one_empty_chunk():
+    assert decode_chunks(b"", "utf_8", 4) == [("", b"")]
+
+
+# Line-ending counts
+
+
+def count_eols(data, chunk_size, text=False):
+    counter = EolCounter(text)
+    for pos in range(0, len(data), chunk_size):
+        counter.feed(data[pos:pos + chunk_size])
+    return counter
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 6))
+def test_eol_counter_pairs_crlf_across_chunks(chunk_size):
+    counter = count_eols(b"a\r\nb\r\nc\nd\re\r\n", chunk_size)
+    assert (counter.crlf, counter.lf, counter.cr) == (3, 1, 1)
+    assert counter.mixed
+
+
+def test_eol_counter_text_mode():
+    counter = count_eols("a\r\nb\r\n", 3, text=True)
+    assert (counter.crlf, counter.lf, counter.cr) == (2, 0, 0)
+    assert not counter.mixed
+    assert counter.dominant() == LineEnding.WINDOWS_CRLF
+
+
+def test_eol_counter_dominant():
+    assert count_eols(b"a\nb\nc\r\n", 2).dominant() == LineEnding.UNIX_LF
+    assert count_eols(b"a\r\nb\n", 2).dominant() == LineEnding.WINDOWS_CRLF
+    assert count_eols(b"abc", 2).dominant(LineEnding.UNIX_LF) == LineEnding.UNIX_LF
+
+
+def test_eol_counter_lone_cr_is_mixed():
+    counter = count_eols(b"a\rb", 1)
+    assert counter.cr == 1 and counter.mixed
+
+
+# Atomic saves
+
+
+@pytest.mark.parametrize(
+    "encoding, eol, expected",
+    [
+        (EncodingType.UTF8, LineEnding.UNIX_LF, "é\nb".encode("utf_8")),
+        (EncodingType.UTF8_BOM, LineEnding.WINDOWS_CRLF, codecs.BOM_UTF8 + "é\r\nb".encode()),
+        (
+            EncodingType.UTF16_LE,
+            LineEnding.WINDOWS_CRLF,
+            codecs.BOM_UTF16_LE + "é\r\nb".encode("utf_16_le"),
+        ),
+        (
+            EncodingType.UTF16_BE,
+            LineEnding.UNIX_LF,
+            codecs.BOM_UTF16_BE + "é\nb".encode("utf_16_be"),
+        ),
+        (EncodingType.WINDOWS_1251, LineEnding.UNIX_LF, b"?\nb"),
+    ],
+)
+def test_write_text_encodes_chunks(tmp_path, encoding, eol, expected):
+    path = tmp_path / "out.txt"
+    write_text(str(path), iter(["é", "\n", "b"]), encoding, eol)
+    assert path.read_bytes() == expected
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+def test_write_text_keeps_the_file_mode(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_bytes(b"old")
+    os.chmod(path, 0o640)
+    write_text(str(path), ["new"], EncodingType.UTF8, LineEnding.UNIX_LF)
+    assert path.read_bytes() == b"new"
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o640
+
+
+def test_write_text_failure_keeps_the_old_file(tmp_path):
+    path = tmp_path / "out.txt"
+    path.write_bytes(b"old")
+
+    def chunks():
+        yield "partial"
+        raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        write_text(str(path), chunks(), EncodingType.UTF8, LineEnding.UNIX_LF)
+    assert path.read_bytes() == b"old"
+    assert os.listdir(tmp_path) == ["out.txt"]
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symbolic links")
+def test_write_text_replaces_the_symlink_target(tmp_path):
+    target = tmp_path / "target.txt"
+    target.write_bytes(b"old")
+    link = tmp_path / "link.txt"
+    os.symlink(target, link)
+    write_text(str(link), ["new"], EncodingType.UTF8, LineEnding.UNIX_LF)
+    assert os.path.islink(link)
+    assert target.read_bytes() == b"new"
@@ -0,0 +1,76 @@
+"""Tests for Find in Files."""
+
+import codecs
+import os
+
+import pytest
+
+from filesearch import iter_files, search_file, split_globs
+
+
+def test_split_globs():
+    assert split_globs(" *.py; *.txt,,*.md ") == ["*.py", "*.txt", "*.md"]
+    assert split_globs("") == []
+
+
+def test_iter_files_include_and_exclude(tmp_path):
+    for name in ["a.py", "b.txt", "build/c.py", "src/d.py", "src/e.pyc"]:
+        path = tmp_path / name
+        path.parent.mkdir(exist_ok=True)
+        path.write_text("")
+    found = [
+        os.path.relpath(path, tmp_path)
+        for path in iter_files(str(tmp_path), ["*.py*"], ["build", "*.pyc"])
+    ]
+    assert found == ["a.py", os.path.join("src", "d.py")]
+
+
+@pytest.fixture
+def write(tmp_path):
+    def write(data, name="file.txt"):
+        path = tmp_path / name
+        path.write_bytes(data)
+        return str(path)
+
+    return write
+
+
+def test_search_reports_each_line_once(write):
+    path = write(b"foo foo\r\nbar\r\nFOO\r\nfood\r\n")
+    assert search_file(path, "foo", False, False) == [(1, "foo foo"), (3, "FOO"), (4, "food")]
+    assert search_file(path, "foo", True, True) == [(1, "foo foo")]
+
+
+def test_search_max_hits(write):
+    path = write(b"x\n" * 10)
+    assert search_file(path, "x", True, False, max_hits=3) == [(1, "x"), (2, "x"), (3, "x")]
+
+
+# Long enough for chardet to recognise the code page
+TEXT = "Съешь же ещё этих мягких французских булок, да выпей чаю\nжук\nЖУК"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        TEXT.encode("utf_8"),
+        codecs.BOM_UTF8 + TEXT.encode("utf_8"),
+        TEXT.encode("cp1251"),
+        codecs.BOM_UTF16_LE + TEXT.encode("utf_16_le"),
+        codecs.BOM_UTF16_BE + TEXT.encode("utf_16_be"),
+    ],
+)
+def test_search_decodes_the_file_encoding(write, data):
+    path = write(data)
+    assert search_file(path, "жук", True, False) == [(2, "жук")]
+    assert search_file(path, "жук", False, False) == [(2, "жук"), (3, "ЖУК")]
+
+
+def test_search_skips_binary_and_empty_files(write):
+    assert search_file(write(b"foo\0bar", "binary"), "foo", True, False) == []
+    assert search_file(write(b"", "empty"), "foo", True, False) == []
+
+
+def test_search_text_outside_the_code_page(write):
+    path = write("жук".encode("cp1251"))
+    assert search_file(path, "\U0001f600", True, False) == []
@@ -0,0 +1,57 @@
+"""Tests for the viewer's sparse line index."""
+
+import pytest
+
+from hugeviewer import SparseLineIndex
+
+DATA = b"first\r\n\nsecond line\nx\r\n\n\nlast"
+
+
+def built(data, chunk_size):
+    index = SparseLineIndex(data, chunk_size)
+    index.build()
+    return index
+
+
+def starts_of(data):
+    return [0] + [pos + 1 for pos in range(len(data)) if data[pos:pos + 1] == b"\n"]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 8, 64])
+@pytest.mark.parametrize("data", [DATA, DATA + b"\n", b"", b"\n", b"no breaks"])
+def test_line_start_and_line_at_across_chunks(data, chunk_size):
+    index = built(data, chunk_size)
+    starts = starts_of(data)
+    assert index.line_count == len(starts)
+    for line, start in enumerate(starts):
+        assert index.line_start(line) == start
+    assert index.line_start(len(starts)) == len(data)
+    for offset in range(len(data) + 1):
+        expected = max(line for line, start in enumerate(starts) if start <= offset)
+        assert index.line_at(offset) == expected
+
+
+@pytest.mark.parametrize("chunk_size", [1, 4, 64])
+def test_lines_strip_line_breaks(chunk_size):
+    index = built(DATA, chunk_size)
+    expected = [line.rstrip(b"\r") for line in DATA.split(b"\n")]
+    assert list(index.lines(0, 100)) == expected
+    assert list(index.lines(2, 2)) == expected[2:4]
+
+
+def test_line_at_waits_for_the_index():
+    index = SparseLineIndex(DATA, 4)
+    assert not index.complete
+    assert index.line_at(0) is None
+    index.build()
+    assert index.complete
+    assert index.line_at(len(DATA)) == DATA.count(b"\n")
+
+
+def test_build_counts_line_endings_and_stops_when_cancelled():
+    index = built(DATA, 3)
+    assert (index.eol.crlf, index.eol.lf) == (2, 4)
+    cancelled = SparseLineIndex(DATA, 3)
+    cancelled.build(cancelled=lambda: True)
+    assert not cancelled.complete
+    assert cancelled.line_count == 1
@@ -0,0 +1,241 @@
+"""Tests for the text operations in textops."""
+
+import os
+import random
+import types
+
+import pytest
+
+import textops
+from constants import SortMode
+from textops import PARAGRAPH_SEPARATOR as SEP
+
+
+def lines_of(*lines):
+    return SEP.join(lines)
+
+
+def random_text(rng, count, alphabet="abcAB \t1"):
+    return lines_of(
+        *("".join(rng.choice(alphabet) for _ in range(rng.randrange(6))) for _ in range(count))
+    )
+
+
+# Sorting
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("seed", range(5))
+def test_external_sort_matches_in_memory_sort(tmp_path, reverse, seed):
+    text = random_text(random.Random(seed), 500, "abcdéz\U0001f600 ")
+    in_memory = textops.sort_text(text, reverse)
+    path = textops.sort_text(text, reverse, threshold=0, run_size=64)
+    try:
+        with open(path, encoding="utf_8", errors="surrogatepass", newline="\n") as f:
+            on_disk = f.read()
+    finally:
+        os.remove(path)
+    assert on_disk.replace("\n", SEP) == in_memory
+
+
+@pytest.mark.parametrize("text", ["", "b", lines_of("b", "a", ""), lines_of("", "", "a")])
+def test_external_sort_keeps_empty_lines(text):
+    path = textops.external_sort(textops.iter_lines(text), False, 4)
+    try:
+        with open(path, encoding="utf_8", newline="\n") as f:
+            assert f.read().replace("\n", SEP) == textops.sort_text(text)
+    finally:
+        os.remove(path)
+
+
+@pytest.mark.parametrize("text", ["", "b\na", "b\na\n", "\n\nc\r\nb"])
+def test_sort_file_reads_lines_like_iter_lines(tmp_path, text):
+    source = tmp_path / "selection.txt"
+    source.write_text(text, encoding="utf_8", newline="\n")
+    path = textops.sort_file(source, run_size=2)
+    try:
+        with open(path, encoding="utf_8", newline="\n") as f:
+            result = f.read()
+    finally:
+        os.remove(path)
+    assert result == "\n".join(sorted(text.split("\n")))
+
+
+def test_external_sort_removes_its_runs(tmp_path, monkeypatch):
+    monkeypatch.setattr(textops.tempfile, "tempdir", str(tmp_path))
+    path = textops.external_sort(iter(["c", "a", "b"] * 10), False, 4)
+    assert os.listdir(tmp_path) == [path.name]
+
+
+def test_sort_lines_by_column_and_mode():
+    text = lines_of("b,10", "a,9", "c,9", "a,100")
+    by_number = textops.sort_lines_by(text, [(2, SortMode.NUMERIC, False)], ",")
+    assert by_number == lines_of("a,9", "c,9", "b,10", "a,100")
+    keys = [(1, SortMode.TEXT, True), (2, SortMode.NATURAL, False)]
+    assert textops.sort_lines_by(text, keys, ",") == lines_of("c,9", "b,10", "a,9", "a,100")
+
+
+def test_sort_lines_by_unique_keeps_first_of_equal_keys():
+    text = lines_of("x 2", "y 1", "z 2")
+    result = textops.sort_lines_by(text, [(2, SortMode.TEXT, False)], unique=True)
+    assert result == lines_of("y 1", "x 2")
+
+
+# Removing duplicates
+
+
+def reference_dedupe(text, keep_last=False, ignore_case=False, ignore_space=False, count=False):
+    def normalize(line):
+        if ignore_case:
+            line = line.casefold()
+        if ignore_space:
+            line = " ".join(line.split())
+        return line
+
+    lines = text.split(SEP)
+    order = reversed(lines) if keep_last else lines
+    kept, counts = {}, {}
+    for line in order:
+        key = normalize(line)
+        kept.setdefault(key, line)
+        counts[key] = counts.get(key, 0) + 1
+    keys = list(kept)
+    if keep_last:
+        keys.reverse()
+    if count:
+        return lines_of(*(f"{counts[key]:>7} {kept[key]}" for key in keys))
+    return lines_of(*(kept[key] for key in keys))
+
+
+@pytest.mark.parametrize("keep_last", [False, True])
+@pytest.mark.parametrize("ignore_case", [False, True])
+@pytest.mark.parametrize("ignore_space", [False, True])
+@pytest.mark.parametrize("count", [False, True])
+def test_dedupe_lines_matches_reference(keep_last, ignore_case, ignore_space, count):
+    rng = random.Random(1)
+    options = dict(
+        keep_last=keep_last, ignore_case=ignore_case, ignore_space=ignore_space, count=count
+    )
+    for _ in range(50):
+        text = random_text(rng, rng.randrange(1, 40))
+        assert textops.dedupe_lines(text, **options) == reference_dedupe(text, **options)
+
+
+def test_dedupe_lines_keep_last_and_count():
+    text = lines_of("a", "b", "a", "c", "b", "a")
+    assert textops.dedupe_lines(text) == lines_of("a", "b", "c")
+    assert textops.dedupe_lines(text, keep_last=True) == lines_of("c", "b", "a")
+    assert textops.dedupe_lines(text, count=True) == lines_of(
+        "      3 a", "      2 b", "      1 c"
+    )
+
+
+def test_dedupe_lines_grows_its_table():
+    text = lines_of(*(str(n % 5000) for n in range(20000)))
+    assert textops.dedupe_lines(text) == lines_of(*map(str, range(5000)))
+
+
+@pytest.fixture
+def colliding_digests(monkeypatch):
+    """Give every line the same digest."""
+
+    class Digest:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def digest(self):
+            return b"\x01" * 8
+
+    monkeypatch.setattr(textops, "hashlib", types.SimpleNamespace(blake2b=Digest))
+
+
+def test_dedupe_lines_verify_survives_collisions(colliding_digests):
+    text = lines_of("x", "y", "x", "z", "y")
+    assert textops.dedupe_lines(text) == lines_of("x", "y", "z")
+    assert textops.dedupe_lines(text, count=True) == lines_of(
+        "      2 x", "      2 y", "      1 z"
+    )
+
+
+def test_dedupe_lines_without_verify_trusts_digests(colliding_digests):
+    assert textops.dedupe_lines(lines_of("x", "y"), verify=False) == "x"
+
+
+# Line transforms
+
+
+def test_transform_lines_joins_once():
+    text = lines_of("  a\t", "", " \t", "b  ", "")
+    assert textops.transform_lines(text, textops.trim_trailing_space) == lines_of(
+        "  a", "", "", "b", ""
+    )
+    assert textops.transform_lines(text, textops.trim_leading_space) == lines_of(
+        "a\t", "", "", "b  ", ""
+    )
+    assert textops.transform_lines(text, textops.remove_space) == lines_of(
+        "a\t", "", "\t", "b", ""
+    )
+    spaces = " " * textops.TAB_STOP_SPACES
+    assert textops.transform_lines("\ta", textops.tab_to_space) == spaces + "a"
+
+
+@pytest.mark.parametrize(
+    "lines, expected",
+    [
+        (["a", "", " ", "b"], ["a", "b"]),
+        (["a", "b", ""], ["a", "b", ""]),
+        (["a", "", "  ", ""], ["a", ""]),
+        (["", " ", ""], []),
+    ],
+)
+def test_remove_empty_lines_keeps_final_line_break(lines, expected):
+    assert list(textops.remove_empty_lines(lines)) == expected
+
+
+def test_join_lines():
+    assert textops.join_lines(lines_of("a", "b", "")) == "ab"
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("text", ["", "a", lines_of("a", "", "bc", "")])
+def test_iter_lines_matches_split(text, reverse):
+    lines = text.split(SEP)
+    assert list(textops.iter_lines(text, reverse)) == (lines[::-1] if reverse else lines)
+
+
+def test_iter_chunks_uses_newlines():
+    text = lines_of("abc", "de", "f")
+    assert "".join(textops.iter_chunks(text, 3)) == "abc\nde\nf"
+
+
+# Find and replace
+
+
+def test_replace_all_returns_the_replaced_span():
+    replaced, count, start, end = textops.replace_all("x foo foobar Foo", "foo", "bar", False, True)
+    assert (count, start, end) == (2, 2, 16)
+    assert replaced == "bar foobar bar"
+
+
+def test_whole_word_treats_underscore_as_boundary():
+    pattern = textops.find_pattern("foo", True, True)
+    assert pattern.search("foo_bar")
+    assert not pattern.search("foo1")
+
+
+def test_replace_all_regex_groups():
+    result = textops.replace_all("a1 b22", r"(\w)(\d+)", r"\2\1", True, False, regex=True)
+    assert result == ("1a 22b", 2, 0, 6)
+
+
+def test_match_spans_are_utf16_positions():
+    text = "\U0001f600foo foo"
+    starts, ends = textops.match_spans(text, textops.find_pattern("foo", True, False))
+    assert list(zip(starts, ends)) == [(2, 5), (6, 9)]
+
+
+def test_qt_position_round_trip():
+    text = "a\U0001f600béc"
+    for index in range(len(text) + 1):
+        assert textops.str_index(text, textops.qt_position(text, index)) == index
+    assert textops.qt_position(text, 2) == 3
@@ -0,0 +1,527 @@
+"""Pure text operations behind the editing tools of the main window."""
+
+import functools
+import hashlib
+import heapq
+import locale
+import os
+import re
+import tempfile
+from array import array
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from constants import (
+    SortMode,
+    FIND_IN_FILES_MAX_LINE,
+    FIND_PATTERN_CACHE_SIZE,
+    TAB_STOP_SPACES,
+    EXTERNAL_SORT_THRESHOLD,
+    EXTERNAL_SORT_RUN_SIZE,
+)
+
+PARAGRAPH_SEPARATOR = "\u2029"
+
+_ASTRAL = re.compile("[\U00010000-\U0010FFFF]")
+_DIGITS = re.compile(r"(\d+)")
+_NUMBER = re.compile(r"\s*([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)")
+
+
+@functools.lru_cache(maxsize=FIND_PATTERN_CACHE_SIZE)
+def find_pattern(
+    find_text: str, case: bool, whole_word: bool, regex: bool = False
+) -> re.Pattern:
+    """Compile ``find_text`` with the Find dialog semantics.
+
+    ``find_text`` is a literal unless ``regex`` is set, in which case ``^``
+    and ``$`` also match at line breaks. Like ``QTextDocument.find``, a
+    whole word must not touch a letter or digit on either side; underscores
+    count as word boundaries. Compiled patterns are cached by their
+    arguments.
+    """
+    pattern = find_text if regex else re.escape(find_text)
+    if whole_word:
+        pattern = rf"(?<![^\W_])(?:{pattern})(?![^\W_])"
+    flags = re.MULTILINE if regex else 0
+    if not case:
+        flags |= re.IGNORECASE
+    return re.compile(pattern, flags)
+
+
+def replace_all(
+    text: str,
+    find_text: str,
+    replace_text: str,
+    case: bool,
+    whole_word: bool,
+    regex: bool = False,
+) -> Tuple[str, int, int, int]:
+    """Replace every match of ``find_text`` in a single pass.
+
+    Returns ``(replaced, count, start, end)`` where ``replaced`` is the new
+    content of ``text[start:end]``, the span from the first match to the
+    end of the last; the rest of the text is unchanged. In ``regex`` mode
+    ``replace_text`` may refer to groups as in ``re.sub``.
+    """
+    pattern = find_pattern(find_text, case, whole_word, regex)
+    parts = []
+    count = 0
+    start = end = 0
+    for match in pattern.finditer(text):
+        if not count:
+            start = end = match.start()
+        parts.append(text[end:match.start()])
+        parts.append(match.expand(replace_text) if regex else replace_text)
+        end = match.end()
+        count += 1
+    return "".join(parts), count, start, end
+
+
+def match_spans(
+    text: str, pattern: re.Pattern, cancelled=None
+) -> Optional[Tuple[array, array]]:
+    """Return arrays of the start and end positions of all matches.
+
+    Positions are Qt document positions (UTF-16 units), so ``text`` must
+    be the raw text of a document. Returns None once ``cancelled()`` is
+    true; it is polled every few thousand matches.
+    """
+    starts = array("q")
+    ends = array("q")
+    astral = _ASTRAL.search(text) is not None
+    extra = counted = 0
+    for count, match in enumerate(pattern.finditer(text), 1):
+        start, end = match.span()
+        if astral:
+            # Characters outside the BMP take two UTF-16 units
+            extra += len(_ASTRAL.findall(text, counted, start))
+            counted = start
+            starts.append(start + extra)
+            ends.append(end + extra + len(_ASTRAL.findall(text, start, end)))
+        else:
+            starts.append(start)
+            ends.append(end)
+        if not count % 4096 and cancelled and cancelled():
+            return None
+    return starts, ends
+
+
+def find_lines(
+    text: str, pattern: re.Pattern, max_hits: int, separator: str = "\n"
+) -> List[Tuple[int, str]]:
+    """Return ``(line, preview)`` for the first ``max_hits`` matching lines.
+
+    Lines are split at ``separator`` and numbered from 1; each matching
+    line is reported once, with a trailing CR removed and the preview cut
+    to ``FIND_IN_FILES_MAX_LINE`` characters.
+    """
+    hits = []
+    line = counted = pos = 0
+    while len(hits) < max_hits:
+        match = pattern.search(text, pos)
+        if not match:
+            break
+        start = text.rfind(separator, 0, match.start()) + 1
+        end = text.find(separator, match.end())
+        if end == -1:
+            end = len(text)
+        line += text.count(separator, counted, start)
+        counted = start
+        hits.append((line + 1, text[start:end].rstrip("\r")[:FIND_IN_FILES_MAX_LINE]))
+        pos = end + 1
+    return hits
+
+
+def qt_position(text: str, index: int) -> int:
+    """Convert a ``str`` index into a Qt document position (UTF-16 units)."""
+    prefix = text[:index]
+    if prefix.isascii():
+        return index
+    return len(prefix.encode("utf_16_le", "surrogatepass")) // 2
+
+
+def str_index(text: str, position: int) -> int:
+    """Convert a Qt document position (UTF-16 units) into a ``str`` index."""
+    if text.isascii():
+        return position
+    units = text.encode("utf_16_le", "surrogatepass")[:2 * position]
+    return len(units.decode("utf_16_le", "surrogatepass"))
+
+
+def iter_chunks(text: str, chunk_size: int) -> Iterator[str]:
+    """Yield a selection in slices of ``chunk_size`` with LF line breaks."""
+    for pos in range(0, len(text), chunk_size):
+        yield text[pos:pos + chunk_size].replace(PARAGRAPH_SEPARATOR, "\n")
+
+
+def transform_lines(text: str, transform) -> str:
+    """Apply a line transform to a selection and join the result once.
+
+    ``text`` is a selection as returned by ``QTextCursor.selectedText``,
+    with lines separated by U+2029; ``transform`` maps an iterable of lines
+    (without separators) to the resulting lines.
+    """
+    return PARAGRAPH_SEPARATOR.join(transform(text.split(PARAGRAPH_SEPARATOR)))
+
+
+def join_lines(text: str) -> str:
+    """Join all lines of a selection into one."""
+    return text.replace(PARAGRAPH_SEPARATOR, "")
+
+
+def iter_lines(text: str, reverse: bool = False) -> Iterator[str]:
+    """Yield the lines of a selection without building a list of them."""
+    if reverse:
+        end = len(text)
+        while True:
+            start = text.rfind(PARAGRAPH_SEPARATOR, 0, end)
+            yield text[start + 1:end]
+            if start == -1:
+                return
+            end = start
+    pos = 0
+    while True:
+        end = text.find(PARAGRAPH_SEPARATOR, pos)
+        if end == -1:
+            yield text[pos:]
+            return
+        yield text[pos:end]
+        pos = end + 1
+
+
+def sort_text(
+    text: str,
+    reverse: bool = False,
+    threshold: int = EXTERNAL_SORT_THRESHOLD,
+    run_size: int = EXTERNAL_SORT_RUN_SIZE,
+) -> Union[str, Path]:
+    """Sort the lines of a selection.
+
+    Selections of ``threshold`` characters or more are sorted on disk by
+    ``external_sort`` and the path of the sorted file is returned.
+    """
+    if len(text) < threshold:
+        lines = text.split(PARAGRAPH_SEPARATOR)
+        lines.sort(reverse=reverse)
+        return PARAGRAPH_SEPARATOR.join(lines)
+    return external_sort(iter_lines(text), reverse, run_size)
+
+
+def sort_file(
+    path: Path, reverse: bool = False, run_size: int = EXTERNAL_SORT_RUN_SIZE
+) -> Path:
+    """Sort the lines of a UTF-8 text file with ``external_sort``.
+
+    The file, written by the caller with newline line breaks, is read a
+    line at a time and is left for the caller to remove.
+    """
+    with open(path, encoding="utf_8", errors="surrogatepass", newline="\n") as f:
+        return external_sort(_file_lines(f), reverse, run_size)
+
+
+def _file_lines(file) -> Iterator[str]:
+    # Like iter_lines: text ending with a line break ends with an empty line
+    for line in file:
+        if not line.endswith("\n"):
+            yield line
+            return
+        yield line[:-1]
+    yield ""
+
+
+def external_sort(lines: Iterable[str], reverse: bool, run_size: int) -> Path:
+    """Sort lines with bounded memory.
+
+    Runs of about ``run_size`` characters are sorted in memory and spilled
+    to temporary files, which are then k-way merged with ``heapq.merge``
+    into a result file. Returns the path of that file, with lines
+    separated by newlines; the caller removes it.
+    """
+    runs = []
+    try:
+        run, size = [], 0
+        for line in lines:
+            run.append(line)
+            size += len(line) + 1
+            if size >= run_size:
+                runs.append(_write_run(run, reverse))
+                run, size = [], 0
+        if run or not runs:
+            runs.append(_write_run(run, reverse))
+
+        fd, path = tempfile.mkstemp(prefix="notepad-sort-", suffix=".txt")
+        with ExitStack() as stack:
+            out = stack.enter_context(
+                open(fd, "w", encoding="utf_8", errors="surrogatepass", newline="\n")
+            )
+            files = [
+                stack.enter_context(
+                    open(run_path, encoding="utf_8", errors="surrogatepass", newline="\n")
+                )
+                for run_path in runs
+            ]
+            merged = heapq.merge(
+                *((line[:-1] for line in f) for f in files), reverse=reverse
+            )
+            for count, line in enumerate(merged):
+                if count:
+                    out.write("\n")
+                out.write(line)
+        return Path(path)
+    finally:
+        for run_path in runs:
+            os.remove(run_path)
+
+
+def _write_run(run: List[str], reverse: bool) -> str:
+    run.sort(reverse=reverse)
+    fd, path = tempfile.mkstemp(prefix="notepad-run-", suffix=".txt")
+    with open(fd, "w", encoding="utf_8", errors="surrogatepass", newline="\n") as f:
+        for line in run:
+            f.write(line)
+            f.write("\n")
+    return path
+
+
+def init_collation() -> None:
+    """Use the user's locale to collate ``SortMode.IGNORE_CASE`` keys.
+
+    ``setlocale`` affects every thread of the process, so this is called
+    once at startup and in each worker process as it starts.
+    """
+    try:
+        locale.setlocale(locale.LC_COLLATE, "")
+    except locale.Error:
+        pass
+
+
+def _collate(field: str) -> str:
+    return locale.strxfrm(field.casefold())
+
+
+def _natural(field: str) -> list:
+    # Text and digit runs alternate, so items at equal positions compare
+    parts = _DIGITS.split(field.casefold())
+    parts[1::2] = map(int, parts[1::2])
+    return parts
+
+
+def _numeric(field: str) -> tuple:
+    match = _NUMBER.match(field)
+    if match:
+        return 0, float(match.group(1)), field
+    return 1, 0.0, field
+
+
+SORT_KEYS = {
+    SortMode.TEXT: str,
+    SortMode.IGNORE_CASE: _collate,
+    SortMode.NATURAL: _natural,
+    SortMode.NUMERIC: _numeric,
+}
+
+
+def line_field(
+    line: str, column: int, delimiter: str, regex: Optional[re.Pattern]
+) -> str:
+    """Return field ``column`` (1-based) of a line; 0 is the whole line.
+
+    Fields are capture groups of ``regex`` if given, otherwise the parts
+    between ``delimiter``, otherwise whitespace-separated words. Missing
+    fields are empty.
+    """
+    if not column:
+        return line
+    if regex:
+        match = regex.search(line)
+        if not match or column > regex.groups:
+            return ""
+        return match.group(column) or ""
+    parts = line.split(delimiter) if delimiter else line.split()
+    return parts[column - 1] if column <= len(parts) else ""
+
+
+def sort_lines_by(
+    text: str,
+    keys: Sequence[Tuple[int, SortMode, bool]],
+    delimiter: str = "",
+    regex: str = "",
+    unique: bool = False,
+) -> str:
+    """Sort the lines of a selection by one or more keys.
+
+    ``keys`` holds ``(column, mode, descending)`` triples, most significant
+    first; see ``line_field`` for columns. Each key is computed once per
+    line and the lines are sorted stably once per key, least significant
+    first. With ``unique`` only the first of lines with equal keys is kept.
+    """
+    lines = text.split(PARAGRAPH_SEPARATOR)
+    pattern = re.compile(regex) if regex else None
+    decorated = []
+    for column, mode, _descending in keys:
+        make_key = SORT_KEYS[mode]
+        decorated.append(
+            [make_key(line_field(line, column, delimiter, pattern)) for line in lines]
+        )
+
+    order = list(range(len(lines)))
+    for values, (_column, _mode, descending) in reversed(list(zip(decorated, keys))):
+        order.sort(key=values.__getitem__, reverse=descending)
+
+    result = []
+    previous = None
+    for idx in order:
+        if unique:
+            current = [values[idx] for values in decorated]
+            if current == previous:
+                continue
+            previous = current
+        result.append(lines[idx])
+    return PARAGRAPH_SEPARATOR.join(result)
+
+
+def trim_trailing_space(lines: Iterable[str]) -> Iterator[str]:
+    """Strip whitespace at the end of each line."""
+    return (line.rstrip() for line in lines)
+
+
+def trim_leading_space(lines: Iterable[str]) -> Iterator[str]:
+    """Strip whitespace at the start of each line."""
+    return (line.lstrip() for line in lines)
+
+
+def tab_to_space(lines: Iterable[str]) -> Iterator[str]:
+    """Replace each tab with ``TAB_STOP_SPACES`` spaces."""
+    spaces = " " * TAB_STOP_SPACES
+    return (line.replace("\t", spaces) for line in lines)
+
+
+def remove_space(lines: Iterable[str]) -> Iterator[str]:
+    """Remove all spaces."""
+    return (line.replace(" ", "") for line in lines)
+
+
+def remove_empty_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Drop lines that are empty or contain only whitespace.
+
+    Each kept line keeps the line break after it, so text ending with a
+    line break still does once the empty lines are gone.
+    """
+    kept = trailing = False
+    for line in lines:
+        if line.strip():
+            yield line
+            kept, trailing = True, False
+        else:
+            trailing = kept
+    if trailing:
+        yield ""
+
+
+def dedupe_lines(
+    text: str,
+    keep_last: bool = False,
+    ignore_case: bool = False,
+    ignore_space: bool = False,
+    count: bool = False,
+    verify: bool = True,
+) -> str:
+    """Remove duplicate lines of a selection, preserving order.
+
+    Seen lines are remembered in an open-addressing table of 8-byte
+    BLAKE2b digests held in arrays, not by the strings themselves: 48 to
+    80 bytes per distinct line and no object per line. Kept lines are
+    recorded by their offset in ``text`` and sliced from it only to join
+    the result. With ``verify`` a digest match is confirmed by comparing
+    the lines, so a hash collision can never drop a line. Lines are
+    compared after optional case folding and whitespace collapsing;
+    ``keep_last`` keeps the last occurrence instead of the first and
+    ``count`` prefixes each kept line with its number of occurrences.
+    """
+
+    def normalize(line: str) -> str:
+        if ignore_case:
+            line = line.casefold()
+        if ignore_space:
+            line = " ".join(line.split())
+        return line
+
+    def line_at(start: int) -> str:
+        end = text.find(PARAGRAPH_SEPARATOR, start)
+        return text[start:] if end == -1 else text[start:end]
+
+    # Open-addressing table of digests and indexes into ``kept``, probed
+    # linearly and doubled when half full
+    digests = array("Q", bytes(8 * 1024))
+    slots = array("q", [-1]) * 1024
+    mask = 1023
+    kept = array("q")
+    counts = array("q")
+    for start, line in _iter_line_starts(text, reverse=keep_last):
+        key = normalize(line)
+        digest = int.from_bytes(
+            hashlib.blake2b(key.encode("utf_8", "surrogatepass"), digest_size=8).digest(),
+            "little",
+        )
+        slot = digest & mask
+        idx = slots[slot]
+        while idx != -1:
+            if digests[slot] == digest and (
+                not verify or normalize(line_at(kept[idx])) == key
+            ):
+                counts[idx] += 1
+                break
+            slot = (slot + 1) & mask
+            idx = slots[slot]
+        else:
+            digests[slot] = digest
+            slots[slot] = len(kept)
+            kept.append(start)
+            counts.append(1)
+            if 2 * len(kept) > mask:
+                digests, slots, mask = _grow_digest_table(digests, slots)
+    if keep_last:
+        kept.reverse()
+        counts.reverse()
+    if count:
+        return PARAGRAPH_SEPARATOR.join(
+            f"{n:>7} {line_at(start)}" for start, n in zip(kept, counts)
+        )
+    return PARAGRAPH_SEPARATOR.join(map(line_at, kept))
+
+
+def _iter_line_starts(text: str, reverse: bool = False) -> Iterator[Tuple[int, str]]:
+    # Like iter_lines, with the offset where each line starts
+    if reverse:
+        end = len(text)
+        while True:
+            start = text.rfind(PARAGRAPH_SEPARATOR, 0, end) + 1
+            yield start, text[start:end]
+            if not start:
+                return
+            end = start - 1
+    start = 0
+    while True:
+        end = text.find(PARAGRAPH_SEPARATOR, start)
+        if end == -1:
+            yield start, text[start:]
+            return
+        yield start, text[start:end]
+        start = end + 1
+
+
+def _grow_digest_table(digests: array, slots: array) -> Tuple[array, array, int]:
+    # Rehash dedupe_lines' table into one of twice the size
+    size = 2 * len(slots)
+    mask = size - 1
+    new_digests = array("Q", bytes(8 * size))
+    new_slots = array("q", [-1]) * size
+    for digest, idx in zip(digests, slots):
+        if idx != -1:
+            slot = digest & mask
+            while new_slots[slot] != -1:
+                slot = (slot + 1) & mask
+            new_digests[slot] = digest
+            new_slots[slot] = idx
+    return new_digests, new_slots, mask
@@ -0,0 +1,131 @@
+# Auto-generated UI module; linting is intentionally disabled.
+from PySide6.QtCore import QCoreApplication, QMetaObject, QSize
+from PySide6.QtWidgets import (QCheckBox, QGridLayout, QHBoxLayout,
+    QLabel, QLineEdit, QPushButton, QSizePolicy, QSpacerItem, QToolButton,
+    QVBoxLayout, QWidget)
+
+class Ui_FindInFiles(object):
+    def setupUi(self, FindInFiles):
+        if not FindInFiles.objectName():
+            FindInFiles.setObjectName(u"FindInFiles")
+        FindInFiles.resize(480, 170)
+        FindInFiles.setMinimumSize(QSize(480, 170))
+        self.horizontalLayout = QHBoxLayout(FindInFiles)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.gridLayout.setHorizontalSpacing(6)
+        self.label = QLabel(FindInFiles)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.lineEditFind = QLineEdit(FindInFiles)
+        self.lineEditFind.setObjectName(u"lineEditFind")
+
+        self.gridLayout.addWidget(self.lineEditFind, 0, 1, 1, 2)
+
+        self.label_2 = QLabel(FindInFiles)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+
+        self.lineEditDir = QLineEdit(FindInFiles)
+        self.lineEditDir.setObjectName(u"lineEditDir")
+
+        self.gridLayout.addWidget(self.lineEditDir, 1, 1, 1, 1)
+
+        self.btnBrowse = QToolButton(FindInFiles)
+        self.btnBrowse.setObjectName(u"btnBrowse")
+
+        self.gridLayout.addWidget(self.btnBrowse, 1, 2, 1, 1)
+
+        self.label_3 = QLabel(FindInFiles)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 2, 0, 1, 1)
+
+        self.lineEditInclude = QLineEdit(FindInFiles)
+        self.lineEditInclude.setObjectName(u"lineEditInclude")
+
+        self.gridLayout.addWidget(self.lineEditInclude, 2, 1, 1, 2)
+
+        self.label_4 = QLabel(FindInFiles)
+        self.label_4.setObjectName(u"label_4")
+
+        self.gridLayout.addWidget(self.label_4, 3, 0, 1, 1)
+
+        self.lineEditExclude = QLineEdit(FindInFiles)
+        self.lineEditExclude.setObjectName(u"lineEditExclude")
+
+        self.gridLayout.addWidget(self.lineEditExclude, 3, 1, 1, 2)
+
+        self.checkCase = QCheckBox(FindInFiles)
+        self.checkCase.setObjectName(u"checkCase")
+
+        self.gridLayout.addWidget(self.checkCase, 4, 0, 1, 1)
+
+        self.checkWholeWord = QCheckBox(FindInFiles)
+        self.checkWholeWord.setObjectName(u"checkWholeWord")
+
+        self.gridLayout.addWidget(self.checkWholeWord, 4, 1, 1, 2)
+
+
+        self.horizontalLayout.addLayout(self.gridLayout)
+
+        self.verticalLayout = QVBoxLayout()
+        self.verticalLayout.setSpacing(6)
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.btnFindAll = QPushButton(FindInFiles)
+        self.btnFindAll.setObjectName(u"btnFindAll")
+
+        self.verticalLayout.addWidget(self.btnFindAll)
+
+        self.verticalSpacer = QSpacerItem(20, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.btnCancel = QPushButton(FindInFiles)
+        self.btnCancel.setObjectName(u"btnCancel")
+
+        self.verticalLayout.addWidget(self.btnCancel)
+
+
+        self.horizontalLayout.addLayout(self.verticalLayout)
+
+#if QT_CONFIG(shortcut)
+        self.label.setBuddy(self.lineEditFind)
+        self.label_2.setBuddy(self.lineEditDir)
+        self.label_3.setBuddy(self.lineEditInclude)
+        self.label_4.setBuddy(self.lineEditExclude)
+#endif // QT_CONFIG(shortcut)
+        QWidget.setTabOrder(self.lineEditFind, self.lineEditDir)
+        QWidget.setTabOrder(self.lineEditDir, self.btnBrowse)
+        QWidget.setTabOrder(self.btnBrowse, self.lineEditInclude)
+        QWidget.setTabOrder(self.lineEditInclude, self.lineEditExclude)
+        QWidget.setTabOrder(self.lineEditExclude, self.checkCase)
+        QWidget.setTabOrder(self.checkCase, self.checkWholeWord)
+        QWidget.setTabOrder(self.checkWholeWord, self.btnFindAll)
+        QWidget.setTabOrder(self.btnFindAll, self.btnCancel)
+
+        self.retranslateUi(FindInFiles)
+        self.btnCancel.clicked.connect(FindInFiles.reject)
+
+        QMetaObject.connectSlotsByName(FindInFiles)
+    # setupUi
+
+    def retranslateUi(self, FindInFiles):
+        FindInFiles.setWindowTitle(QCoreApplication.translate("FindInFiles", u"Find in Files", None))
+        self.label.setText(QCoreApplication.translate("FindInFiles", u"Find:", None))
+        self.label_2.setText(QCoreApplication.translate("FindInFiles", u"Directory:", None))
+        self.btnBrowse.setText(QCoreApplication.translate("FindInFiles", u"...", None))
+        self.label_3.setText(QCoreApplication.translate("FindInFiles", u"Include:", None))
+        self.lineEditInclude.setPlaceholderText(QCoreApplication.translate("FindInFiles", u"*.txt; *.log", None))
+        self.label_4.setText(QCoreApplication.translate("FindInFiles", u"Exclude:", None))
+        self.lineEditExclude.setPlaceholderText(QCoreApplication.translate("FindInFiles", u".git; *.bak", None))
+        self.checkCase.setText(QCoreApplication.translate("FindInFiles", u"Match Case", None))
+        self.checkWholeWord.setText(QCoreApplication.translate("FindInFiles", u"Match Whole Word", None))
+        self.btnFindAll.setText(QCoreApplication.translate("FindInFiles", u"Find &All", None))
+        self.btnCancel.setText(QCoreApplication.translate("FindInFiles", u"&Cancel", None))
+    # retranslateUi
+
@@ -9,8 +9,8 @@ class Ui_Find(object):
         if not Find.objectName():
             Find.setObjectName(u"Find")
         Find.setEnabled(True)
-        Find.resize(420, 150)
-        Find.setMinimumSize(QSize(420, 150))
+        Find.resize(460, 200)
+        Find.setMinimumSize(QSize(460, 200))
         self.horizontalLayout = QHBoxLayout(Find)
         self.horizontalLayout.setObjectName(u"horizontalLayout")
         self.gridLayout = QGridLayout()
@@ -52,6 +52,16 @@ class Ui_Find(object):
 
         self.gridLayout.addWidget(self.checkWrapAround, 2, 1, 1, 1)
 
+        self.checkRegex = QCheckBox(Find)
+        self.checkRegex.setObjectName(u"checkRegex")
+
+        self.gridLayout.addWidget(self.checkRegex, 3, 1, 1, 1)
+
+        self.labelCount = QLabel(Find)
+        self.labelCount.setObjectName(u"labelCount")
+
+        self.gridLayout.addWidget(self.labelCount, 4, 0, 1, 2)
+
 
         self.horizontalLayout.addLayout(self.gridLayout)
 
@@ -63,6 +73,11 @@ class Ui_Find(object):
 
         self.verticalLayout.addWidget(self.btnFind)
 
+        self.btnFindPrev = QPushButton(Find)
+        self.btnFindPrev.setObjectName(u"btnFindPrev")
+
+        self.verticalLayout.addWidget(self.btnFindPrev)
+
         self.btnReplace = QPushButton(Find)
         self.btnReplace.setObjectName(u"btnReplace")
 
@@ -73,6 +88,11 @@ class Ui_Find(object):
 
         self.verticalLayout.addWidget(self.btnReplaceAll)
 
+        self.btnFindAllTabs = QPushButton(Find)
+        self.btnFindAllTabs.setObjectName(u"btnFindAllTabs")
+
+        self.verticalLayout.addWidget(self.btnFindAllTabs)
+
         self.verticalSpacer = QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Expanding)
 
         self.verticalLayout.addItem(self.verticalSpacer)
@@ -91,12 +111,15 @@ class Ui_Find(object):
 #endif // QT_CONFIG(shortcut)
         QWidget.setTabOrder(self.lineEditFind, self.lineEditReplace)
         QWidget.setTabOrder(self.lineEditReplace, self.btnFind)
-        QWidget.setTabOrder(self.btnFind, self.btnReplace)
+        QWidget.setTabOrder(self.btnFind, self.btnFindPrev)
+        QWidget.setTabOrder(self.btnFindPrev, self.btnReplace)
         QWidget.setTabOrder(self.btnReplace, self.btnReplaceAll)
-        QWidget.setTabOrder(self.btnReplaceAll, self.checkCase)
+        QWidget.setTabOrder(self.btnReplaceAll, self.btnFindAllTabs)
+        QWidget.setTabOrder(self.btnFindAllTabs, self.checkCase)
         QWidget.setTabOrder(self.checkCase, self.checkWholeWord)
         QWidget.setTabOrder(self.checkWholeWord, self.checkWrapAround)
-        QWidget.setTabOrder(self.checkWrapAround, self.btnCancel)
+        QWidget.setTabOrder(self.checkWrapAround, self.checkRegex)
+        QWidget.setTabOrder(self.checkRegex, self.btnCancel)
 
         self.retranslateUi(Find)
         self.btnCancel.clicked.connect(Find.reject)
@@ -111,8 +134,12 @@ class Ui_Find(object):
         self.label_2.setText(QCoreApplication.translate("Find", u"Replace:", None))
         self.checkCase.setText(QCoreApplication.translate("Find", u"Match Case", None))
         self.checkWrapAround.setText(QCoreApplication.translate("Find", u"Wrap Around", None))
+        self.checkRegex.setText(QCoreApplication.translate("Find", u"Regular E&xpression", None))
+        self.labelCount.setText("")
         self.btnFind.setText(QCoreApplication.translate("Find", u"&Find", None))
+        self.btnFindPrev.setText(QCoreApplication.translate("Find", u"Find &Previous", None))
         self.btnReplace.setText(QCoreApplication.translate("Find", u"&Replace", None))
         self.btnReplaceAll.setText(QCoreApplication.translate("Find", u"Replace All", None))
+        self.btnFindAllTabs.setText(QCoreApplication.translate("Find", u"Find All in Open &Documents", None))
         self.btnCancel.setText(QCoreApplication.translate("Find", u"&Cancel", None))
     # retranslateUi
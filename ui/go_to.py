@@ -1,7 +1,7 @@
 # Auto-generated UI module; linting is intentionally disabled.
 from PySide6.QtCore import QCoreApplication, QMetaObject, QSize
-from PySide6.QtWidgets import (QGridLayout, QLabel,
-    QPushButton, QSpinBox)
+from PySide6.QtWidgets import (QComboBox, QDoubleSpinBox, QGridLayout,
+    QPushButton)
 
 class Ui_Goto(object):
     def setupUi(self, Goto):
@@ -18,15 +18,18 @@ class Ui_Goto(object):
 
         self.gridLayout.addWidget(self.pushButton, 0, 2, 1, 1)
 
-        self.label = QLabel(Goto)
-        self.label.setObjectName(u"label")
+        self.comboMode = QComboBox(Goto)
+        self.comboMode.addItem("")
+        self.comboMode.addItem("")
+        self.comboMode.setObjectName(u"comboMode")
 
-        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+        self.gridLayout.addWidget(self.comboMode, 0, 0, 1, 1)
 
-        self.spinBox = QSpinBox(Goto)
+        self.spinBox = QDoubleSpinBox(Goto)
         self.spinBox.setObjectName(u"spinBox")
-        self.spinBox.setMinimum(1)
-        self.spinBox.setMaximum(999999999)
+        self.spinBox.setDecimals(0)
+        self.spinBox.setMinimum(1.000000000000000)
+        self.spinBox.setMaximum(9007199254740992.000000000000000)
 
         self.gridLayout.addWidget(self.spinBox, 0, 1, 1, 1)
 
@@ -42,6 +45,8 @@ class Ui_Goto(object):
     def retranslateUi(self, Goto):
         Goto.setWindowTitle(QCoreApplication.translate("Goto", u"Go to", None))
         self.pushButton.setText(QCoreApplication.translate("Goto", u"Go to", None))
-        self.label.setText(QCoreApplication.translate("Goto", u"Go to Line:", None))
+        self.comboMode.setItemText(0, QCoreApplication.translate("Goto", u"Line", None))
+        self.comboMode.setItemText(1, QCoreApplication.translate("Goto", u"Byte offset", None))
+
     # retranslateUi
 
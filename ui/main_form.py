@@ -33,6 +33,8 @@ class Ui_MainWindow(object):
         icon4 = QIcon()
         icon4.addFile(u":/resources/icons/file-save-as.png", QSize(), QIcon.Normal, QIcon.Off)
         self.actionSaveAs.setIcon(icon4)
+        self.actionSaveAll = QAction(MainWindow)
+        self.actionSaveAll.setObjectName(u"actionSaveAll")
         self.actionClose = QAction(MainWindow)
         self.actionClose.setObjectName(u"actionClose")
         icon5 = QIcon()
@@ -99,6 +101,8 @@ class Ui_MainWindow(object):
         icon17 = QIcon()
         icon17.addFile(u":/resources/icons/edit-find-replace.png", QSize(), QIcon.Normal, QIcon.Off)
         self.actionFindReplace.setIcon(icon17)
+        self.actionFindInFiles = QAction(MainWindow)
+        self.actionFindInFiles.setObjectName(u"actionFindInFiles")
         self.actionGoto = QAction(MainWindow)
         self.actionGoto.setObjectName(u"actionGoto")
         icon18 = QIcon()
@@ -163,6 +167,10 @@ class Ui_MainWindow(object):
         self.actionSortLinesAscendingOrder.setObjectName(u"actionSortLinesAscendingOrder")
         self.actionSortLinesDescendingOrder = QAction(MainWindow)
         self.actionSortLinesDescendingOrder.setObjectName(u"actionSortLinesDescendingOrder")
+        self.actionRemoveDuplicates = QAction(MainWindow)
+        self.actionRemoveDuplicates.setObjectName(u"actionRemoveDuplicates")
+        self.actionSortLines = QAction(MainWindow)
+        self.actionSortLines.setObjectName(u"actionSortLines")
         self.actionTrimTrailingSpace = QAction(MainWindow)
         self.actionTrimTrailingSpace.setObjectName(u"actionTrimTrailingSpace")
         self.actionTrimLeadingSpace = QAction(MainWindow)
@@ -260,6 +268,7 @@ class Ui_MainWindow(object):
         self.menuFile.addAction(self.actionOpen)
         self.menuFile.addAction(self.actionSave)
         self.menuFile.addAction(self.actionSaveAs)
+        self.menuFile.addAction(self.actionSaveAll)
         self.menuFile.addSeparator()
         self.menuFile.addAction(self.actionClose)
         self.menuFile.addAction(self.actionCloseAll)
@@ -279,6 +288,7 @@ class Ui_MainWindow(object):
         self.menuEdit.addAction(self.actionSelectAll)
         self.menuEdit.addSeparator()
         self.menuEdit.addAction(self.actionFindReplace)
+        self.menuEdit.addAction(self.actionFindInFiles)
         self.menuEdit.addAction(self.actionGoto)
         self.menuEdit.addSeparator()
         self.menuEdit.addAction(self.actionDateTime)
@@ -292,9 +302,11 @@ class Ui_MainWindow(object):
         self.menuLineOperations.addAction(self.actionJoinLines)
         self.menuLineOperations.addAction(self.actionRemoveEmptyLines)
         self.menuLineOperations.addAction(self.actionRemoveDuplicateLines)
+        self.menuLineOperations.addAction(self.actionRemoveDuplicates)
         self.menuLineOperations.addSeparator()
         self.menuLineOperations.addAction(self.actionSortLinesAscendingOrder)
         self.menuLineOperations.addAction(self.actionSortLinesDescendingOrder)
+        self.menuLineOperations.addAction(self.actionSortLines)
         self.menuBlankOperations.addAction(self.actionTrimTrailingSpace)
         self.menuBlankOperations.addAction(self.actionTrimLeadingSpace)
         self.menuBlankOperations.addAction(self.actionTabToSpace)
@@ -370,6 +382,10 @@ class Ui_MainWindow(object):
         self.actionSaveAs.setText(QCoreApplication.translate("MainWindow", u"Save &As", None))
 #if QT_CONFIG(shortcut)
         self.actionSaveAs.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+Shift+S", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionSaveAll.setText(QCoreApplication.translate("MainWindow", u"Save A&ll", None))
+#if QT_CONFIG(shortcut)
+        self.actionSaveAll.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+Alt+S", None))
 #endif // QT_CONFIG(shortcut)
         self.actionClose.setText(QCoreApplication.translate("MainWindow", u"&Close", None))
 #if QT_CONFIG(shortcut)
@@ -416,6 +432,10 @@ class Ui_MainWindow(object):
         self.actionFindReplace.setText(QCoreApplication.translate("MainWindow", u"Find and Replace", None))
 #if QT_CONFIG(shortcut)
         self.actionFindReplace.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+F", None))
+#endif // QT_CONFIG(shortcut)
+        self.actionFindInFiles.setText(QCoreApplication.translate("MainWindow", u"Find in Files...", None))
+#if QT_CONFIG(shortcut)
+        self.actionFindInFiles.setShortcut(QCoreApplication.translate("MainWindow", u"Ctrl+Shift+F", None))
 #endif // QT_CONFIG(shortcut)
         self.actionGoto.setText(QCoreApplication.translate("MainWindow", u"Go to", None))
 #if QT_CONFIG(shortcut)
@@ -453,6 +473,8 @@ class Ui_MainWindow(object):
         self.actionRemoveDuplicateLines.setText(QCoreApplication.translate("MainWindow", u"Remove Duplicate Lines", None))
         self.actionSortLinesAscendingOrder.setText(QCoreApplication.translate("MainWindow", u"Sort Lines Ascending Order", None))
         self.actionSortLinesDescendingOrder.setText(QCoreApplication.translate("MainWindow", u"Sort Lines Descending Order", None))
+        self.actionRemoveDuplicates.setText(QCoreApplication.translate("MainWindow", u"Remove Duplicate Lines...", None))
+        self.actionSortLines.setText(QCoreApplication.translate("MainWindow", u"Sort Lines...", None))
         self.actionTrimTrailingSpace.setText(QCoreApplication.translate("MainWindow", u"Trim Trailing Space", None))
         self.actionTrimLeadingSpace.setText(QCoreApplication.translate("MainWindow", u"Trim Leading Space", None))
         self.actionTabToSpace.setText(QCoreApplication.translate("MainWindow", u"Tab to Space", None))
@@ -0,0 +1,84 @@
+# Auto-generated UI module; linting is intentionally disabled.
+from PySide6.QtCore import QCoreApplication, QMetaObject, QSize
+from PySide6.QtWidgets import (QCheckBox, QHBoxLayout, QPushButton,
+    QSizePolicy, QSpacerItem, QVBoxLayout)
+
+class Ui_RemoveDuplicates(object):
+    def setupUi(self, RemoveDuplicates):
+        if not RemoveDuplicates.objectName():
+            RemoveDuplicates.setObjectName(u"RemoveDuplicates")
+        RemoveDuplicates.resize(360, 160)
+        RemoveDuplicates.setMinimumSize(QSize(360, 160))
+        self.horizontalLayout = QHBoxLayout(RemoveDuplicates)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.verticalLayout_2 = QVBoxLayout()
+        self.verticalLayout_2.setObjectName(u"verticalLayout_2")
+        self.checkKeepLast = QCheckBox(RemoveDuplicates)
+        self.checkKeepLast.setObjectName(u"checkKeepLast")
+
+        self.verticalLayout_2.addWidget(self.checkKeepLast)
+
+        self.checkIgnoreCase = QCheckBox(RemoveDuplicates)
+        self.checkIgnoreCase.setObjectName(u"checkIgnoreCase")
+
+        self.verticalLayout_2.addWidget(self.checkIgnoreCase)
+
+        self.checkIgnoreSpace = QCheckBox(RemoveDuplicates)
+        self.checkIgnoreSpace.setObjectName(u"checkIgnoreSpace")
+
+        self.verticalLayout_2.addWidget(self.checkIgnoreSpace)
+
+        self.checkCount = QCheckBox(RemoveDuplicates)
+        self.checkCount.setObjectName(u"checkCount")
+
+        self.verticalLayout_2.addWidget(self.checkCount)
+
+        self.checkVerify = QCheckBox(RemoveDuplicates)
+        self.checkVerify.setObjectName(u"checkVerify")
+        self.checkVerify.setChecked(True)
+
+        self.verticalLayout_2.addWidget(self.checkVerify)
+
+
+        self.horizontalLayout.addLayout(self.verticalLayout_2)
+
+        self.verticalLayout = QVBoxLayout()
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.btnRemove = QPushButton(RemoveDuplicates)
+        self.btnRemove.setObjectName(u"btnRemove")
+
+        self.verticalLayout.addWidget(self.btnRemove)
+
+        self.verticalSpacer = QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.btnCancel = QPushButton(RemoveDuplicates)
+        self.btnCancel.setObjectName(u"btnCancel")
+
+        self.verticalLayout.addWidget(self.btnCancel)
+
+
+        self.horizontalLayout.addLayout(self.verticalLayout)
+
+
+        self.retranslateUi(RemoveDuplicates)
+        self.btnCancel.clicked.connect(RemoveDuplicates.reject)
+
+        self.btnRemove.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(RemoveDuplicates)
+    # setupUi
+
+    def retranslateUi(self, RemoveDuplicates):
+        RemoveDuplicates.setWindowTitle(QCoreApplication.translate("RemoveDuplicates", u"Remove Duplicate Lines", None))
+        self.checkKeepLast.setText(QCoreApplication.translate("RemoveDuplicates", u"Keep Last Occurrence", None))
+        self.checkIgnoreCase.setText(QCoreApplication.translate("RemoveDuplicates", u"Ignore Case", None))
+        self.checkIgnoreSpace.setText(QCoreApplication.translate("RemoveDuplicates", u"Ignore Whitespace", None))
+        self.checkCount.setText(QCoreApplication.translate("RemoveDuplicates", u"Count Occurrences", None))
+        self.checkVerify.setText(QCoreApplication.translate("RemoveDuplicates", u"Compare Lines on Hash Match", None))
+        self.btnRemove.setText(QCoreApplication.translate("RemoveDuplicates", u"&Remove", None))
+        self.btnCancel.setText(QCoreApplication.translate("RemoveDuplicates", u"&Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,172 @@
+# Auto-generated UI module; linting is intentionally disabled.
+from PySide6.QtCore import QCoreApplication, QMetaObject, QSize
+from PySide6.QtWidgets import (QCheckBox, QComboBox, QGridLayout,
+    QHBoxLayout, QLabel, QLineEdit, QPushButton,
+    QSizePolicy, QSpacerItem, QSpinBox, QVBoxLayout, QWidget)
+
+class Ui_SortLines(object):
+    def setupUi(self, SortLines):
+        if not SortLines.objectName():
+            SortLines.setObjectName(u"SortLines")
+        SortLines.resize(460, 200)
+        SortLines.setMinimumSize(QSize(460, 200))
+        self.horizontalLayout = QHBoxLayout(SortLines)
+        self.horizontalLayout.setObjectName(u"horizontalLayout")
+        self.gridLayout = QGridLayout()
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label = QLabel(SortLines)
+        self.label.setObjectName(u"label")
+
+        self.gridLayout.addWidget(self.label, 0, 0, 1, 1)
+
+        self.lineEditDelimiter = QLineEdit(SortLines)
+        self.lineEditDelimiter.setObjectName(u"lineEditDelimiter")
+
+        self.gridLayout.addWidget(self.lineEditDelimiter, 0, 1, 1, 3)
+
+        self.label_2 = QLabel(SortLines)
+        self.label_2.setObjectName(u"label_2")
+
+        self.gridLayout.addWidget(self.label_2, 1, 0, 1, 1)
+
+        self.lineEditRegex = QLineEdit(SortLines)
+        self.lineEditRegex.setObjectName(u"lineEditRegex")
+
+        self.gridLayout.addWidget(self.lineEditRegex, 1, 1, 1, 3)
+
+        self.label_3 = QLabel(SortLines)
+        self.label_3.setObjectName(u"label_3")
+
+        self.gridLayout.addWidget(self.label_3, 2, 0, 1, 1)
+
+        self.spinColumn1 = QSpinBox(SortLines)
+        self.spinColumn1.setObjectName(u"spinColumn1")
+        self.spinColumn1.setMaximum(999)
+
+        self.gridLayout.addWidget(self.spinColumn1, 2, 1, 1, 1)
+
+        self.comboMode1 = QComboBox(SortLines)
+        self.comboMode1.addItem("")
+        self.comboMode1.addItem("")
+        self.comboMode1.addItem("")
+        self.comboMode1.addItem("")
+        self.comboMode1.setObjectName(u"comboMode1")
+
+        self.gridLayout.addWidget(self.comboMode1, 2, 2, 1, 1)
+
+        self.checkDescending1 = QCheckBox(SortLines)
+        self.checkDescending1.setObjectName(u"checkDescending1")
+
+        self.gridLayout.addWidget(self.checkDescending1, 2, 3, 1, 1)
+
+        self.checkThenBy = QCheckBox(SortLines)
+        self.checkThenBy.setObjectName(u"checkThenBy")
+
+        self.gridLayout.addWidget(self.checkThenBy, 3, 0, 1, 1)
+
+        self.spinColumn2 = QSpinBox(SortLines)
+        self.spinColumn2.setObjectName(u"spinColumn2")
+        self.spinColumn2.setEnabled(False)
+        self.spinColumn2.setMaximum(999)
+
+        self.gridLayout.addWidget(self.spinColumn2, 3, 1, 1, 1)
+
+        self.comboMode2 = QComboBox(SortLines)
+        self.comboMode2.addItem("")
+        self.comboMode2.addItem("")
+        self.comboMode2.addItem("")
+        self.comboMode2.addItem("")
+        self.comboMode2.setObjectName(u"comboMode2")
+        self.comboMode2.setEnabled(False)
+
+        self.gridLayout.addWidget(self.comboMode2, 3, 2, 1, 1)
+
+        self.checkDescending2 = QCheckBox(SortLines)
+        self.checkDescending2.setObjectName(u"checkDescending2")
+        self.checkDescending2.setEnabled(False)
+
+        self.gridLayout.addWidget(self.checkDescending2, 3, 3, 1, 1)
+
+        self.checkUnique = QCheckBox(SortLines)
+        self.checkUnique.setObjectName(u"checkUnique")
+
+        self.gridLayout.addWidget(self.checkUnique, 4, 0, 1, 4)
+
+
+        self.horizontalLayout.addLayout(self.gridLayout)
+
+        self.verticalLayout = QVBoxLayout()
+        self.verticalLayout.setObjectName(u"verticalLayout")
+        self.btnSort = QPushButton(SortLines)
+        self.btnSort.setObjectName(u"btnSort")
+
+        self.verticalLayout.addWidget(self.btnSort)
+
+        self.verticalSpacer = QSpacerItem(20, 20, QSizePolicy.Minimum, QSizePolicy.Expanding)
+
+        self.verticalLayout.addItem(self.verticalSpacer)
+
+        self.btnCancel = QPushButton(SortLines)
+        self.btnCancel.setObjectName(u"btnCancel")
+
+        self.verticalLayout.addWidget(self.btnCancel)
+
+
+        self.horizontalLayout.addLayout(self.verticalLayout)
+
+#if QT_CONFIG(shortcut)
+        self.label.setBuddy(self.lineEditDelimiter)
+        self.label_2.setBuddy(self.lineEditRegex)
+        self.label_3.setBuddy(self.spinColumn1)
+#endif // QT_CONFIG(shortcut)
+        QWidget.setTabOrder(self.lineEditDelimiter, self.lineEditRegex)
+        QWidget.setTabOrder(self.lineEditRegex, self.spinColumn1)
+        QWidget.setTabOrder(self.spinColumn1, self.comboMode1)
+        QWidget.setTabOrder(self.comboMode1, self.checkDescending1)
+        QWidget.setTabOrder(self.checkDescending1, self.checkThenBy)
+        QWidget.setTabOrder(self.checkThenBy, self.spinColumn2)
+        QWidget.setTabOrder(self.spinColumn2, self.comboMode2)
+        QWidget.setTabOrder(self.comboMode2, self.checkDescending2)
+        QWidget.setTabOrder(self.checkDescending2, self.checkUnique)
+        QWidget.setTabOrder(self.checkUnique, self.btnSort)
+        QWidget.setTabOrder(self.btnSort, self.btnCancel)
+
+        self.retranslateUi(SortLines)
+        self.btnCancel.clicked.connect(SortLines.reject)
+        self.checkThenBy.toggled.connect(self.spinColumn2.setEnabled)
+        self.checkThenBy.toggled.connect(self.comboMode2.setEnabled)
+        self.checkThenBy.toggled.connect(self.checkDescending2.setEnabled)
+
+        self.btnSort.setDefault(True)
+
+
+        QMetaObject.connectSlotsByName(SortLines)
+    # setupUi
+
+    def retranslateUi(self, SortLines):
+        SortLines.setWindowTitle(QCoreApplication.translate("SortLines", u"Sort Lines", None))
+        self.label.setText(QCoreApplication.translate("SortLines", u"Delimiter:", None))
+        self.lineEditDelimiter.setPlaceholderText(QCoreApplication.translate("SortLines", u"Whitespace", None))
+        self.label_2.setText(QCoreApplication.translate("SortLines", u"Regex:", None))
+        self.lineEditRegex.setPlaceholderText(QCoreApplication.translate("SortLines", u"Capture groups are columns", None))
+        self.label_3.setText(QCoreApplication.translate("SortLines", u"Sort by column:", None))
+        self.spinColumn1.setSpecialValueText(QCoreApplication.translate("SortLines", u"Whole line", None))
+        self.comboMode1.setItemText(0, QCoreApplication.translate("SortLines", u"Text", None))
+        self.comboMode1.setItemText(1, QCoreApplication.translate("SortLines", u"Ignore Case", None))
+        self.comboMode1.setItemText(2, QCoreApplication.translate("SortLines", u"Natural", None))
+        self.comboMode1.setItemText(3, QCoreApplication.translate("SortLines", u"Numeric", None))
+
+        self.checkDescending1.setText(QCoreApplication.translate("SortLines", u"Descending", None))
+        self.checkThenBy.setText(QCoreApplication.translate("SortLines", u"Then by column:", None))
+        self.spinColumn2.setSpecialValueText(QCoreApplication.translate("SortLines", u"Whole line", None))
+        self.comboMode2.setItemText(0, QCoreApplication.translate("SortLines", u"Text", None))
+        self.comboMode2.setItemText(1, QCoreApplication.translate("SortLines", u"Ignore Case", None))
+        self.comboMode2.setItemText(2, QCoreApplication.translate("SortLines", u"Natural", None))
+        self.comboMode2.setItemText(3, QCoreApplication.translate("SortLines", u"Numeric", None))
+
+        self.checkDescending2.setText(QCoreApplication.translate("SortLines", u"Descending", None))
+        self.checkUnique.setText(QCoreApplication.translate("SortLines", u"Remove lines with equal keys", None))
+        self.btnSort.setText(QCoreApplication.translate("SortLines", u"&Sort", None))
+        self.btnCancel.setText(QCoreApplication.translate("SortLines", u"&Cancel", None))
+    # retranslateUi
+
@@ -0,0 +1,55 @@
+"""Background workers run on the global Qt thread pool."""
+
+import threading
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+
+class WorkerSignals(QObject):
+    """Signals emitted by a Worker; delivered to the GUI thread."""
+
+    progress = Signal(int)
+    result = Signal(object)
+    error = Signal(str)
+    finished = Signal()
+
+
+class Worker(QRunnable):
+    """Run a callable on the global thread pool.
+
+    The callable receives the worker as its first argument so that it can
+    report progress and poll ``isCancelled``. Results of cancelled workers
+    are discarded.
+    """
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+        self._cancelled = threading.Event()
+
+    def run(self) -> None:
+        try:
+            result = self.fn(self, *self.args, **self.kwargs)
+        except Exception as e:  # pylint: disable=broad-except
+            if not self.isCancelled():
+                self.signals.error.emit(str(e))
+        else:
+            if not self.isCancelled():
+                self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
+
+    def start(self) -> None:
+        """Queue the worker on the global thread pool."""
+        QThreadPool.globalInstance().start(self)
+
+    def cancel(self) -> None:
+        """Ask the callable to stop at its next cancellation check."""
+        self._cancelled.set()
+
+    def isCancelled(self) -> bool:  # pylint: disable=invalid-name
+        """Return True once cancel() has been called."""
+        return self._cancelled.is_set()